@@ -0,0 +1,314 @@
+#!/usr/bin/env python
+"""
+Times representative workloads of the render pipeline, headless, and stores
+the results as json so that they can be compared across commits.
+
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py -k paths surface -o before.json
+    python benchmarks/run_benchmarks.py --compare before.json
+
+Each workload runs in a fresh process, so that its peak memory is its own,
+and so that one crashing or hanging doesn't take the others with it.
+"""
+from __future__ import annotations
+
+import argparse
+from functools import partial
+import json
+import os
+import platform
+import subprocess as sp
+import sys
+import tempfile
+import time
+
+import workloads
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(BENCHMARKS_DIR, "results")
+
+# For each measurement compared, whether larger values are better
+COMPARED_KEYS = {
+    "fps": True,
+    "construction_ms": False,
+    "triangulation_ms": False,
+    "combined_triangulation_ms": False,
+    "init_ms": False,
+    "run_s": False,
+    "peak_memory_mb": False,
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmarks for the manim render pipeline")
+    parser.add_argument(
+        "-k", "--keywords",
+        nargs="*",
+        help="Only run workloads whose names contain one of these",
+    )
+    parser.add_argument(
+        "-l", "--list",
+        action="store_true",
+        help="List the available workloads",
+    )
+    parser.add_argument(
+        "-o", "--output",
+        help="Where to write the results, by default benchmarks/results/<commit>.json",
+    )
+    parser.add_argument(
+        "-c", "--compare",
+        help="Results of an earlier run to compare against",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative change counted as a regression when comparing",
+    )
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=120,
+        help="Number of frames to render for each rendering workload",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Number of times to run each workload, keeping the best times",
+    )
+    parser.add_argument(
+        "-r", "--resolution",
+        default="1920x1080",
+        help="Resolution to render at, passed as \"WxH\"",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=600,
+        help="Seconds to allow each workload before giving up on it",
+    )
+    # Used internally, for running a single workload in a subprocess
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--worker_output", help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def get_peak_memory_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS, and kilobytes elsewhere
+    return max_rss / 2**20 if platform.system() == "Darwin" else max_rss / 2**10
+
+
+def combine_repeats(results: list[dict[str, float]]) -> dict[str, float]:
+    combined = dict(results[0])
+    for key in combined:
+        values = [result[key] for result in results]
+        if key.endswith("_ms") or key.endswith("_s"):
+            combined[key] = min(values)
+        elif key == "fps":
+            combined[key] = max(values)
+    return combined
+
+
+def is_headless() -> bool:
+    # On Linux, with no display to open windows or GL contexts on, as on
+    # most CI machines. Elsewhere, there's always a display to use.
+    return platform.system() == "Linux" and not (
+        os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")
+    )
+
+
+def get_worker_env() -> dict[str, str]:
+    env = dict(os.environ)
+    if is_headless():
+        # pyglet, which manimlib imports for its window, otherwise
+        # fails to import when there's no display
+        env.setdefault("PYGLET_HEADLESS", "1")
+    return env
+
+
+def use_egl_contexts() -> None:
+    # moderngl's standalone contexts come from X11 by default on Linux,
+    # so with no display, they're created through EGL instead
+    import moderngl
+    moderngl.create_standalone_context = partial(
+        moderngl.create_standalone_context,
+        backend="egl",
+    )
+
+
+def run_worker(args: argparse.Namespace) -> None:
+    # manimlib builds its configuration from the command line when imported,
+    # which should be that of a plain run, rather than of this script
+    sys.argv = sys.argv[:1]
+    if is_headless():
+        use_egl_contexts()
+    width, height = map(int, args.resolution.split("x"))
+    results = [
+        workloads.run_workload(args.worker, args.frames, (width, height))
+        for _ in range(args.repeat)
+    ]
+    result = combine_repeats(results)
+    result["peak_memory_mb"] = get_peak_memory_mb()
+
+    import moderngl
+    from manimlib import __version__
+    ctx = moderngl.create_standalone_context()
+    result["gl_renderer"] = ctx.info["GL_RENDERER"]
+    result["manimgl_version"] = __version__
+
+    with open(args.worker_output, "w") as fp:
+        json.dump(result, fp)
+
+
+def run_workload_in_subprocess(name: str, args: argparse.Namespace) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = os.path.join(temp_dir, "result.json")
+        command = [
+            sys.executable, os.path.abspath(__file__),
+            "--worker", name,
+            "--worker_output", output_path,
+            "--frames", str(args.frames),
+            "--repeat", str(args.repeat),
+            "--resolution", args.resolution,
+        ]
+        try:
+            process = sp.run(
+                command,
+                stdout=sp.PIPE,
+                stderr=sp.STDOUT,
+                timeout=args.timeout,
+                # Scenes may write to relative paths
+                cwd=temp_dir,
+                env=get_worker_env(),
+            )
+        except sp.TimeoutExpired:
+            return dict(error=f"Timed out after {args.timeout}s")
+        if process.returncode != 0 or not os.path.exists(output_path):
+            lines = process.stdout.decode(errors="replace").strip().splitlines()
+            return dict(error=lines[-1] if lines else f"Exited with code {process.returncode}")
+        with open(output_path) as fp:
+            return json.load(fp)
+
+
+def get_git_commit() -> str | None:
+    try:
+        return sp.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=BENCHMARKS_DIR,
+            stderr=sp.DEVNULL,
+        ).decode().strip()
+    except (OSError, sp.CalledProcessError):
+        return None
+
+
+def format_result(result: dict[str, Any]) -> str:
+    if "error" in result:
+        return f"error: {result['error']}"
+    parts = []
+    if "fps" in result:
+        parts.append(f"{result['fps']:8.1f} fps")
+    for key in ["construction_ms", "triangulation_ms", "init_ms"]:
+        if key in result:
+            parts.append(f"{result[key]:9.1f} ms {key[:-3]}")
+    if "run_s" in result:
+        parts.append(f"{result['run_s']:7.2f} s run")
+    if result.get("peak_memory_mb") is not None:
+        parts.append(f"{result['peak_memory_mb']:7.1f} MB peak")
+    return ", ".join(parts)
+
+
+def compare_results(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float,
+) -> list[str]:
+    """
+    Prints how each measurement changed relative to the baseline,
+    and returns descriptions of those which got worse by more than
+    the threshold
+    """
+    regressions = []
+    print(f"\n{'Workload':<44} {'Measurement':<16} {'Before':>10} {'After':>10} {'Change':>8}")
+    for name, result in results.items():
+        old_result = baseline.get(name)
+        if old_result is None or "error" in result or "error" in old_result:
+            continue
+        for key, larger_is_better in COMPARED_KEYS.items():
+            old_value, new_value = old_result.get(key), result.get(key)
+            if not old_value or new_value is None:
+                continue
+            change = (new_value - old_value) / old_value
+            is_regression = (-change if larger_is_better else change) > threshold
+            flag = "  <--" if is_regression else ""
+            print(
+                f"{name[:44]:<44} {key:<16} {old_value:>10.2f} {new_value:>10.2f} {change:>+8.1%}{flag}"
+            )
+            if is_regression:
+                regressions.append(f"{name} {key}: {old_value:.2f} -> {new_value:.2f}")
+    return regressions
+
+
+def main() -> None:
+    args = parse_args()
+    if args.worker:
+        run_worker(args)
+        return
+
+    names = workloads.get_workload_names()
+    if args.list:
+        print("\n".join(names))
+        return
+    if args.keywords:
+        names = [name for name in names if any(k in name for k in args.keywords)]
+
+    commit = get_git_commit()
+    results = dict()
+    for name in names:
+        print(f"{name:<44}", end=" ", flush=True)
+        result = run_workload_in_subprocess(name, args)
+        print(format_result(result))
+        results[name] = result
+
+    output_path = args.output
+    if output_path is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        file_name = (commit[:10] if commit else time.strftime("%Y%m%d_%H%M%S")) + ".json"
+        output_path = os.path.join(RESULTS_DIR, file_name)
+    with open(output_path, "w") as fp:
+        json.dump(dict(
+            commit=commit,
+            time=time.strftime("%Y-%m-%dT%H:%M:%S"),
+            platform=platform.platform(),
+            python=platform.python_version(),
+            frames=args.frames,
+            repeat=args.repeat,
+            resolution=args.resolution,
+            results=results,
+        ), fp, indent=2)
+    print(f"\nResults written to {output_path}")
+
+    if args.compare:
+        with open(args.compare) as fp:
+            baseline = json.load(fp)["results"]
+        regressions = compare_results(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regressions beyond {args.threshold:.0%}:")
+            print("\n".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
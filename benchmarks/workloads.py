@@ -0,0 +1,331 @@
+"""
+Workloads timed by run_benchmarks.py. Each takes the number of frames to
+render and the resolution to render at, and returns a dict of measurements,
+where keys ending in _ms or _s are times, and fps is a rate.
+
+Note, manimlib parses the command line when it's first imported, so it's
+only imported within the workloads themselves, which run_benchmarks.py
+calls in a separate process with a clean sys.argv.
+"""
+from __future__ import annotations
+
+import ast
+import importlib.util
+import os
+import time
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+    from manimlib.scene.scene import Scene
+
+    Workload = Callable[[int, tuple[int, int]], dict[str, float]]
+
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXAMPLE_SCENES_FILE = os.path.join(REPO_DIR, "example_scenes.py")
+EXAMPLE_SCENE_PREFIX = "example_scenes."
+
+WORKLOADS: dict[str, Workload] = dict()
+
+
+def workload(func: Workload) -> Workload:
+    WORKLOADS[func.__name__] = func
+    return func
+
+
+def get_example_scene_names() -> list[str]:
+    with open(EXAMPLE_SCENES_FILE) as fp:
+        tree = ast.parse(fp.read())
+    return [node.name for node in tree.body if isinstance(node, ast.ClassDef)]
+
+
+def get_workload_names() -> list[str]:
+    return [
+        *WORKLOADS.keys(),
+        *(EXAMPLE_SCENE_PREFIX + name for name in get_example_scene_names()),
+    ]
+
+
+def run_workload(name: str, n_frames: int, resolution: tuple[int, int]) -> dict[str, float]:
+    if name.startswith(EXAMPLE_SCENE_PREFIX):
+        return render_example_scene(name[len(EXAMPLE_SCENE_PREFIX):], resolution)
+    return WORKLOADS[name](n_frames, resolution)
+
+
+# Helpers
+
+def get_scene(resolution: tuple[int, int], scene_class: type | None = None) -> Scene:
+    if scene_class is None:
+        from manimlib.scene.scene import Scene
+        scene_class = Scene
+    return scene_class(
+        camera_config=dict(resolution=resolution),
+        file_writer_config=dict(write_to_movie=False, save_last_frame=False, quiet=True),
+    )
+
+
+def time_construction(func: Callable[[], object]) -> tuple[object, float]:
+    start = time.perf_counter()
+    result = func()
+    return result, 1000 * (time.perf_counter() - start)
+
+
+def time_frames(
+    scene: Scene,
+    n_frames: int,
+    step: Callable[[float], None] | None = None,
+) -> dict[str, float]:
+    """
+    Renders n_frames frames of the scene, calling step with the time
+    increment before each, and returns the resulting frame rate
+    """
+    dt = 1.0 / scene.camera.fps
+    # The first frame compiles shaders and creates buffers, so isn't timed
+    scene.update_frame(dt)
+    scene.camera.ctx.finish()
+    start = time.perf_counter()
+    for _ in range(n_frames):
+        if step is not None:
+            step(dt)
+        scene.update_frame(dt)
+    scene.camera.ctx.finish()
+    elapsed = time.perf_counter() - start
+    return dict(
+        frames=n_frames,
+        fps=n_frames / elapsed,
+        frame_ms=1000 * elapsed / n_frames,
+        draw_calls=scene.camera.n_draw_calls,
+    )
+
+
+def get_random_svg_string(n_paths: int, n_curves: int = 8, seed: int = 0) -> str:
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    paths = []
+    for _ in range(n_paths):
+        points = rng.uniform(0, 1000, size=(3 * n_curves + 1, 2))
+        commands = [f"M {points[0, 0]:.2f} {points[0, 1]:.2f}"]
+        for i in range(n_curves):
+            p1, p2, p3 = points[3 * i + 1:3 * i + 4]
+            commands.append(f"C {p1[0]:.2f} {p1[1]:.2f} {p2[0]:.2f} {p2[1]:.2f} {p3[0]:.2f} {p3[1]:.2f}")
+        paths.append(f'<path d="{" ".join(commands)} Z" fill="#58C4DD" stroke="#FFFFFF"/>')
+    return "".join([
+        '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1000 1000">',
+        *paths,
+        '</svg>',
+    ])
+
+
+# Workloads
+
+@workload
+def vmobject_paths(n_frames: int, resolution: tuple[int, int]) -> dict[str, float]:
+    """Fill and stroke of many curved paths, all moving every frame"""
+    import numpy as np
+    from manimlib.constants import OUT
+    from manimlib.mobject.types.vectorized_mobject import VGroup
+    from manimlib.mobject.types.vectorized_mobject import VMobject
+
+    n_paths = 200
+    rng = np.random.default_rng(0)
+
+    def construct():
+        paths = VGroup()
+        for _ in range(n_paths):
+            center = rng.uniform(-1, 1, 3) * [6, 3, 0]
+            points = center + rng.uniform(-0.5, 0.5, (8, 3)) * [1, 1, 0]
+            path = VMobject()
+            path.set_points_smoothly([*points, points[0]])
+            path.set_fill(rng.choice(["#58C4DD", "#83C167", "#FC6255"]), 0.5)
+            path.set_stroke("#FFFFFF", 2)
+            paths.add(path)
+        return paths
+
+    paths, construction_ms = time_construction(construct)
+    scene = get_scene(resolution)
+    scene.add(paths)
+    result = time_frames(scene, n_frames, lambda dt: paths.rotate(0.1 * dt, axis=OUT))
+    return dict(construction_ms=construction_ms, **result)
+
+
+@workload
+def surface(n_frames: int, resolution: tuple[int, int]) -> dict[str, float]:
+    """Shaded surfaces, with the camera orbiting around them"""
+    from manimlib.constants import LEFT, RIGHT
+    from manimlib.mobject.three_dimensions import Sphere
+    from manimlib.mobject.three_dimensions import Torus
+
+    def construct():
+        return [
+            Sphere(radius=1.5).shift(2 * LEFT),
+            Torus(r1=1.5, r2=0.5).shift(2 * RIGHT),
+        ]
+
+    surfaces, construction_ms = time_construction(construct)
+    scene = get_scene(resolution)
+    scene.add(*surfaces)
+    frame = scene.frame
+    frame.reorient(-30, 70)
+    result = time_frames(scene, n_frames, lambda dt: frame.increment_theta(0.2 * dt))
+    return dict(construction_ms=construction_ms, **result)
+
+
+@workload
+def decimal_updaters(n_frames: int, resolution: tuple[int, int]) -> dict[str, float]:
+    """Many numbers, each updated to a changing value every frame"""
+    from manimlib.mobject.numbers import DecimalNumber
+    from manimlib.mobject.types.vectorized_mobject import VGroup
+    from manimlib.mobject.value_tracker import ValueTracker
+
+    tracker = ValueTracker(0)
+
+    def construct():
+        numbers = VGroup(*(DecimalNumber(0, num_decimal_places=3) for _ in range(50)))
+        numbers.arrange_in_grid(10, 5)
+        for i, number in enumerate(numbers):
+            number.add_updater(lambda m, i=i: m.set_value(i * tracker.get_value()))
+        return numbers
+
+    numbers, construction_ms = time_construction(construct)
+    scene = get_scene(resolution)
+    scene.add(numbers)
+    result = time_frames(scene, n_frames, lambda dt: tracker.increment_value(dt))
+    return dict(construction_ms=construction_ms, **result)
+
+
+@workload
+def tex_construction(n_frames: int, resolution: tuple[int, int]) -> dict[str, float]:
+    """
+    Construction of Tex mobjects. Compiled LaTeX is cached on disk, so
+    after the first run this mostly times the parsing of its svg output.
+    """
+    from manimlib.mobject.svg.svg_mobject import SVG_HASH_TO_MOB_MAP
+    from manimlib.mobject.svg.tex_mobject import Tex
+
+    formulas = [
+        R"e^{i \pi} + 1 = 0",
+        R"\int_0^\infty e^{-x^2} \, dx = \frac{\sqrt{\pi}}{2}",
+        R"\sum_{n=1}^\infty \frac{1}{n^2} = \frac{\pi^2}{6}",
+        R"\nabla \times \mathbf{B} = \mu_0 \mathbf{J} + \mu_0 \epsilon_0 \frac{\partial \mathbf{E}}{\partial t}",
+        R"\det\left(\begin{array}{cc} a & b \\ c & d \end{array}\right) = ad - bc",
+    ]
+
+    def construct():
+        SVG_HASH_TO_MOB_MAP.clear()
+        return [Tex(formula) for formula in formulas for _ in range(4)]
+
+    texs, construction_ms = time_construction(construct)
+    return dict(construction_ms=construction_ms)
+
+
+@workload
+def svg_parsing(n_frames: int, resolution: tuple[int, int]) -> dict[str, float]:
+    """Parsing an svg of many curved paths into mobjects"""
+    from manimlib.mobject.svg.svg_mobject import SVG_HASH_TO_MOB_MAP
+    from manimlib.mobject.svg.svg_mobject import SVGMobject
+
+    svg_string = get_random_svg_string(n_paths=300)
+
+    def construct():
+        SVG_HASH_TO_MOB_MAP.clear()
+        return SVGMobject(svg_string=svg_string)
+
+    svg, construction_ms = time_construction(construct)
+    return dict(construction_ms=construction_ms, n_submobjects=len(svg.submobjects))
+
+
+@workload
+def text_triangulation(n_frames: int, resolution: tuple[int, int]) -> dict[str, float]:
+    """
+    Triangulating the glyphs of a 5,000 glyph Text, each on its own, then again
+    once they're cached, and then all of them as the rings of a single VMobject
+    """
+    import string
+
+    import numpy as np
+    from manimlib.mobject.svg.text_mobject import Text
+    from manimlib.mobject.types.vectorized_mobject import TRIANGULATION_CACHE
+    from manimlib.mobject.types.vectorized_mobject import VMobject
+
+    rng = np.random.default_rng(0)
+    letters = rng.choice(list(string.ascii_letters + string.digits), size=5000)
+    words = ["".join(letters[i:i + 5]) for i in range(0, len(letters), 5)]
+    lines = [" ".join(words[i:i + 10]) for i in range(0, len(words), 10)]
+
+    text, construction_ms = time_construction(lambda: Text("\n".join(lines)))
+    glyphs = text.family_members_with_points()
+
+    def triangulate_all():
+        for glyph in glyphs:
+            glyph.get_triangulation()
+
+    TRIANGULATION_CACHE.clear()
+    _, triangulation_ms = time_construction(triangulate_all)
+    _, cached_triangulation_ms = time_construction(triangulate_all)
+
+    # All glyph outlines as subpaths of one VMobject, separated by null
+    # curves, as add_subpath would do it, to time working out which of
+    # many rings are nested within which
+    combined = VMobject()
+    combined.set_points(np.vstack([
+        part
+        for glyph in glyphs
+        for part in (glyph.get_points(), glyph.get_points()[-1:])
+    ][:-1]))
+    TRIANGULATION_CACHE.clear()
+    _, combined_triangulation_ms = time_construction(combined.get_triangulation)
+
+    return dict(
+        construction_ms=construction_ms,
+        n_glyphs=len(glyphs),
+        triangulation_ms=triangulation_ms,
+        cached_triangulation_ms=cached_triangulation_ms,
+        combined_triangulation_ms=combined_triangulation_ms,
+    )
+
+
+@workload
+def frame_readback(n_frames: int, resolution: tuple[int, int]) -> dict[str, float]:
+    """Reading rendered frames back from the gpu, as when writing to a file"""
+    from manimlib.mobject.geometry import Square
+
+    scene = get_scene(resolution)
+    scene.add(Square(fill_opacity=0.5))
+    scene.update_frame()
+    scene.camera.get_raw_fbo_data()
+    start = time.perf_counter()
+    for _ in range(n_frames):
+        scene.camera.get_raw_fbo_data()
+    elapsed = time.perf_counter() - start
+    return dict(
+        frames=n_frames,
+        fps=n_frames / elapsed,
+        frame_ms=1000 * elapsed / n_frames,
+    )
+
+
+def render_example_scene(scene_name: str, resolution: tuple[int, int]) -> dict[str, float]:
+    """
+    Runs one of the scenes in example_scenes.py in full, rendering every
+    frame (though without writing them to a file)
+    """
+    spec = importlib.util.spec_from_file_location("example_scenes", EXAMPLE_SCENES_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    scene, init_ms = time_construction(
+        lambda: get_scene(resolution, getattr(module, scene_name))
+    )
+    start = time.perf_counter()
+    scene.run()
+    elapsed = time.perf_counter() - start
+    n_frames = sum(scene.play_frame_counts)
+    return dict(
+        init_ms=init_ms,
+        run_s=elapsed,
+        frames=n_frames,
+        fps=n_frames / elapsed if elapsed > 0 else 0,
+    )
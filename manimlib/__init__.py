@@ -9,6 +9,10 @@ if TYPE_CHECKING:
 
 from manimlib.constants import *
 
+# This must come before anything loads the OpenGL driver
+from manimlib.utils.shaders import use_shader_program_cache
+use_shader_program_cache()
+
 from manimlib.window import *
 
 from manimlib.animation.animation import *
@@ -132,7 +132,7 @@ class DrawBorderThenFill(Animation):
 
         if index == 1 and self.sm_to_index[hash(submob)] == 0:
             # First time crossing over
-            submob.set_data(outline.data)
+            submob.set_data(outline.get_data())
             self.sm_to_index[hash(submob)] = 1
 
         if index == 0:
@@ -53,14 +53,14 @@ class TransformMatchingParts(AnimationGroup):
 
         # Finally, account for mismatches
         for source_piece in self.source_pieces:
-            if any([source_piece in anim.mobject.get_family() for anim in self.anims]):
+            if any([anim.mobject.has_family_member(source_piece) for anim in self.anims]):
                 continue
             self.anims.append(FadeOutToPoint(
                 source_piece, target.get_center(),
                 **self.anim_config
             ))
         for target_piece in self.target_pieces:
-            if any([target_piece in anim.mobject.get_family() for anim in self.anims]):
+            if any([anim.mobject.has_family_member(target_piece) for anim in self.anims]):
                 continue
             self.anims.append(FadeInFromPoint(
                 target_piece, source.get_center(),
@@ -12,7 +12,13 @@ from manimlib.constants import FRAME_HEIGHT
 from manimlib.constants import FRAME_WIDTH
 from manimlib.mobject.mobject import Mobject
 from manimlib.mobject.mobject import Point
+from manimlib.shader_wrapper import ShaderWrapper
+from manimlib.shader_wrapper import VShaderWrapper
 from manimlib.utils.color import color_to_rgba
+from manimlib.utils.profiling import PROFILER
+from manimlib.utils.profiling import get_mobject_label
+from manimlib.utils.profiling import profile
+from manimlib.utils.shaders import CAMERA_UNIFORM_BINDING
 
 from typing import TYPE_CHECKING
 
@@ -22,6 +28,13 @@ if TYPE_CHECKING:
     from manimlib.window import Window
 
 
+# Substrings of the names of OpenGL renderers which run on the cpu
+SOFTWARE_RENDERERS = ["llvmpipe", "softpipe", "swiftshader", "software"]
+# Largest number of pixels in a frame for which adaptive fill supersampling,
+# see Camera.get_fill_supersampling, still draws fills at twice the resolution
+MAX_PIXELS_FOR_FILL_SUPERSAMPLING = 1920 * 1080
+
+
 class Camera(object):
     def __init__(
         self,
@@ -44,6 +57,10 @@ class Camera(object):
         # without multisampling, for 3d scenes one might want
         # to set samples to be greater than 0.
         samples: int = 0,
+        # Factor by which the canvas that vectorized mobjects draw their fill
+        # to is larger than the frame in each dimension, either 1, 2, or
+        # "adaptive", see get_fill_supersampling
+        fill_supersampling: int | str = 2,
     ):
         self.window = window
         self.background_image = background_image
@@ -55,14 +72,18 @@ class Camera(object):
         self.pixel_array_dtype = pixel_array_dtype
         self.light_source_position = light_source_position
         self.samples = samples
+        self.fill_supersampling = fill_supersampling
 
         self.rgb_max_val: float = np.iinfo(self.pixel_array_dtype).max
         self.background_rgba: list[float] = list(color_to_rgba(
             background_color, background_opacity
         ))
         self.uniforms = dict()
+        # Number of draw calls made in capturing the last frame
+        self.n_draw_calls: int = 0
         self.init_frame(**frame_config)
         self.init_context()
+        self.init_uniform_buffer()
         self.init_fbo()
         self.init_light_source()
 
@@ -77,6 +98,14 @@ class Camera(object):
 
         self.ctx.enable(moderngl.PROGRAM_POINT_SIZE)
         self.ctx.enable(moderngl.BLEND)
+        renderer = self.ctx.info["GL_RENDERER"].lower()
+        self.is_software_renderer = any(name in renderer for name in SOFTWARE_RENDERERS)
+
+    def init_uniform_buffer(self) -> None:
+        # Laid out as the CameraUniforms block in inserts/camera_uniforms.glsl,
+        # following std140 rules, where each vec3 is followed by a float
+        self.uniform_data = np.zeros(28, dtype='f4')
+        self.uniform_buffer = self.ctx.buffer(reserve=self.uniform_data.nbytes)
 
     def init_fbo(self) -> None:
         # This is the buffer used when writing to a video/image file
@@ -121,6 +150,32 @@ class Camera(object):
             )
         )
 
+    def get_fill_supersampling(self) -> int:
+        """
+        Factor by which fills are supersampled. When adaptive, it's 2, unless
+        rendering on the cpu, or at a resolution above 1080p, where the
+        extra quality isn't worth the time and memory, and it's 1.
+        """
+        if self.fill_supersampling != "adaptive":
+            return int(self.fill_supersampling)
+        width, height = self.get_pixel_shape()
+        if self.is_software_renderer or width * height > MAX_PIXELS_FOR_FILL_SUPERSAMPLING:
+            return 1
+        return 2
+
+    def refresh_fill_canvas(self) -> None:
+        # The frame buffer may have been switched or resized since the last frame
+        VShaderWrapper.set_fill_canvas_size(
+            self.ctx, self.get_pixel_shape(), self.get_fill_supersampling()
+        )
+
+    def release(self) -> None:
+        """
+        Releases the canvas fills are drawn to, which is
+        recreated if the camera captures another frame
+        """
+        VShaderWrapper.release_fill_canvas(self.ctx)
+
     def clear(self) -> None:
         self.fbo.clear(*self.background_rgba)
         if self.window:
@@ -138,6 +193,7 @@ class Camera(object):
             gl.GL_COLOR_BUFFER_BIT, gl.GL_LINEAR
         )
 
+    @profile()
     def get_raw_fbo_data(self, dtype: str = 'f1') -> bytes:
         self.blit(self.fbo, self.draw_fbo)
         return self.draw_fbo.read(
@@ -146,6 +202,26 @@ class Camera(object):
             dtype=dtype,
         )
 
+    def get_raw_frame_size(self, dtype: str = 'f1') -> int:
+        # Moderngl dtypes, like 'f1' or 'f4', end with the byte count per component
+        width, height = self.draw_fbo.size
+        return width * height * self.n_channels * int(dtype[1:])
+
+    @profile()
+    def read_fbo_into_buffer(self, buffer: moderngl.Buffer, dtype: str = 'f1') -> None:
+        """
+        Like get_raw_fbo_data, but reads into a (pixel pack) buffer on the gpu,
+        which returns without waiting for the transfer to finish.  The pixels
+        only need to be synchronized once buffer.read() is called.
+        """
+        self.blit(self.fbo, self.draw_fbo)
+        self.draw_fbo.read_into(
+            buffer,
+            viewport=self.draw_fbo.viewport,
+            components=self.n_channels,
+            dtype=dtype,
+        )
+
     def get_image(self) -> Image.Image:
         return Image.frombytes(
             'RGBA',
@@ -222,12 +298,20 @@ class Camera(object):
         self.frame.set_width(frame_width, stretch=True)
 
     # Rendering
+    @profile()
     def capture(self, *mobjects: Mobject) -> None:
         self.clear()
         self.refresh_uniforms()
+        self.refresh_fill_canvas()
         self.fbo.use()
+        ShaderWrapper.n_draw_calls = 0
         for mobject in mobjects:
-            mobject.render(self.ctx, self.uniforms)
+            with PROFILER.section(get_mobject_label(mobject), "mobject"):
+                mobject.render(self.ctx, self.uniforms)
+        ShaderWrapper.flush_deferred_draw()
+        self.n_draw_calls = ShaderWrapper.n_draw_calls
+        if PROFILER.enabled:
+            PROFILER.add_count("draw calls", self.n_draw_calls)
 
         if self.window:
             self.window.swap_buffers()
@@ -254,6 +338,18 @@ class Camera(object):
             light_position=tuple(light_pos),
         )
 
+        # Write these for all programs at once
+        uniforms = self.uniforms
+        data = self.uniform_data
+        data[0:16] = uniforms["view"]
+        data[16:19] = uniforms["frame_rescale_factors"]
+        data[19] = uniforms["frame_scale"]
+        data[20:23] = uniforms["camera_position"]
+        data[23] = uniforms["pixel_size"]
+        data[24:27] = uniforms["light_position"]
+        self.uniform_buffer.write(data)
+        self.uniform_buffer.bind_to_uniform_block(CAMERA_UNIFORM_BINDING)
+
 
 # Mostly just defined so old scenes don't break
 class ThreeDCamera(Camera):
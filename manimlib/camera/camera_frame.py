@@ -48,11 +48,14 @@ class CameraFrame(Mobject):
         self.set_height(frame_shape[1], stretch=True)
         self.move_to(center_point)
 
+    @Mobject.affects_data
     def set_orientation(self, rotation: Rotation):
         self.uniforms["orientation"][:] = rotation.as_quat()
+        self.note_changed_uniforms()
         return self
 
     def get_orientation(self):
+        self.note_read()
         return Rotation.from_quat(self.uniforms["orientation"])
 
     def make_orientation_default(self):
@@ -243,9 +246,10 @@ class CameraFrame(Mobject):
         return points[4, 1] - points[3, 1]
 
     def get_focal_distance(self) -> float:
-        return 0.5 * self.get_height() / math.tan(0.5 * self.uniforms["fovy"])
+        return 0.5 * self.get_height() / math.tan(0.5 * self.get_field_of_view())
 
     def get_field_of_view(self) -> float:
+        self.note_read()
         return self.uniforms["fovy"]
 
     def get_implied_camera_location(self) -> np.ndarray:
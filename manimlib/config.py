@@ -161,6 +161,13 @@ def parse_cli():
                  "in two comma separated values, e.g. \"3,6\", it will end " + \
                  "the rendering at the second value",
         )
+        parser.add_argument(
+            "--checkpoints",
+            action="store_true",
+            help="Save the state of the scene to disk after each animation, so " + \
+                 "that later runs with -n can resume from there rather than " + \
+                 "recomputing every earlier animation",
+        )
         parser.add_argument(
             "-e", "--embed",
             metavar="LINE_NUMBER",
@@ -175,6 +182,12 @@ def parse_cli():
             "--fps",
             help="Frame rate, as an integer",
         )
+        parser.add_argument(
+            "--fill_supersampling",
+            choices=["1", "2", "adaptive"],
+            help="Factor by which vectorized fills are supersampled, " + \
+                 "where 1 is fastest, as for drafts",
+        )
         parser.add_argument(
             "-c", "--color",
             help="Background color",
@@ -189,6 +202,22 @@ def parse_cli():
             action="store_true",
             help="Show progress bar for each animation",
         )
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="Time each phase of rendering, per frame, play and mobject " + \
+                 "class, writing a Chrome trace next to the output file and " + \
+                 "printing a summary at the end",
+        )
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=1,
+            help="Number of processes to render with. When writing more than " + \
+                 "one scene, e.g. with -a, each scene gets its own process. When " + \
+                 "writing one scene, its animations are split into ranges which " + \
+                 "are rendered in parallel, then joined",
+        )
         parser.add_argument(
             "--prerun",
             action="store_true",
@@ -253,6 +282,8 @@ def update_camera_config(config: Dict, args: Namespace):
     camera_config.resolution = arg_resolution or literal_eval(camera_config.resolution)
     if args.fps:
         camera_config.fps = args.fps
+    if args.fill_supersampling:
+        camera_config.fill_supersampling = args.fill_supersampling
     if args.color:
         try:
             camera_config.background_color = colour.Color(args.color)
@@ -278,6 +309,8 @@ def update_file_writer_config(config: Dict, args: Namespace):
         show_file_location_upon_completion=args.finder,
         quiet=args.quiet,
     )
+    if args.profile:
+        file_writer_config.profile = True
 
     if args.vcodec:
         file_writer_config.video_codec = args.vcodec
@@ -309,6 +342,8 @@ def update_scene_config(config: Dict, args: Namespace):
         scene_config.leave_progress_bars = True
     if args.show_animation_progress:
         scene_config.show_animation_progress = True
+    if args.checkpoints:
+        scene_config.use_disk_checkpoints = True
 
 
 def update_run_config(config: Dict, args: Namespace):
@@ -320,6 +355,7 @@ def update_run_config(config: Dict, args: Namespace):
         scene_names=args.scene_names,
         quiet=args.quiet or args.write_all,
         write_all=args.write_all,
+        jobs=args.jobs,
         show_in_window=not args.write_file
     )
 
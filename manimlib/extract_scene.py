@@ -1,21 +1,33 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
 import copy
 import inspect
+import multiprocessing
+import os
+from pathlib import Path
+import platform
 import sys
 
+from addict import Dict
+from tqdm.auto import tqdm as ProgressDisplay
+
 from manimlib.module_loader import ModuleLoader
 
 from manimlib.config import manim_config
 from manimlib.logger import log
 from manimlib.scene.interactive_scene import InteractiveScene
 from manimlib.scene.scene import Scene
+from manimlib.scene.scene_file_writer import concatenate_movie_files
+from manimlib.scene.scene_frame_counts import load_play_frame_counts
+from manimlib.scene.scene_frame_counts import save_play_frame_counts
+from manimlib.utils.dict_ops import merge_dicts_recursively
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     Module = importlib.util.types.ModuleType
     from typing import Optional
-    from addict import Dict
 
 
 class BlankScene(InteractiveScene):
@@ -59,28 +71,68 @@ def prompt_user_for_choice(scene_classes):
         sys.exit(1)
 
 
-def compute_total_frames(scene_class, scene_config):
+def prerun_scene(scene_class, scene_config) -> Scene:
     """
     When a scene is being written to file, a copy of the scene is run with
-    skip_animations set to true so as to count how many frames it will require.
-    This allows for a total progress bar on rendering, and also allows runtime
-    errors to be exposed preemptively for long running scenes.
+    skip_animations set to true so as to count how many frames each of its
+    plays will require. This allows for a total progress bar on rendering,
+    and also allows runtime errors to be exposed preemptively for long
+    running scenes.
     """
     pre_config = copy.deepcopy(scene_config)
     pre_config["file_writer_config"]["write_to_movie"] = False
     pre_config["file_writer_config"]["save_last_frame"] = False
     pre_config["file_writer_config"]["quiet"] = True
+    pre_config["file_writer_config"]["profile"] = False
     pre_config["skip_animations"] = True
     pre_scene = scene_class(**pre_config)
     pre_scene.run()
-    total_time = pre_scene.time - pre_scene.skip_time
-    return int(total_time * manim_config.camera.fps)
+    if not pre_scene.file_writer.ended_with_interrupt:
+        save_play_frame_counts(pre_scene)
+    return pre_scene
+
+
+def compute_play_frame_counts(scene_class, scene_config) -> list[int]:
+    return prerun_scene(scene_class, scene_config).play_frame_counts
+
+
+def compute_total_frames(scene_class, scene_config) -> int:
+    return sum(compute_play_frame_counts(scene_class, scene_config))
+
+
+def find_play_frame_counts(scene_class, scene_config) -> tuple[list[int], bool, Optional[bool]] | None:
+    camera_config = merge_dicts_recursively(
+        manim_config.camera,
+        scene_class.default_camera_config,
+        scene_config.camera_config,
+    )
+    return load_play_frame_counts(
+        scene_class,
+        camera_config["fps"],
+        scene_config.start_at_animation_number,
+        scene_config.end_at_animation_number,
+    )
+
+
+def get_play_frame_counts(scene_class, scene_config) -> list[int]:
+    """
+    Frame counts for each play of the scene, as recorded by its last run
+    when there is one and the scene's source file hasn't changed since, so
+    that it needn't be run twice. Otherwise, they're found with a prerun.
+    """
+    record = find_play_frame_counts(scene_class, scene_config)
+    if record is None or not record[1]:
+        return compute_play_frame_counts(scene_class, scene_config)
+    play_frame_counts, _, _ = record
+    return play_frame_counts
 
 
 def scene_from_class(scene_class, scene_config: Dict, run_config: Dict):
     fw_config = manim_config.file_writer
     if fw_config.write_to_movie and run_config.prerun:
-        scene_config.file_writer_config.total_frames = compute_total_frames(scene_class, scene_config)
+        play_frame_counts = get_play_frame_counts(scene_class, scene_config)
+        scene_config.file_writer_config.total_frames = sum(play_frame_counts)
+        scene_config.file_writer_config.expected_play_frame_counts = play_frame_counts
     return scene_class(**scene_config)
 
 
@@ -90,7 +142,7 @@ def note_missing_scenes(arg_names, module_names):
             log.error(f"No scene named {name} found")
 
 
-def get_scenes_to_render(all_scene_classes: list, scene_config: Dict, run_config: Dict):
+def get_scene_classes_to_render(all_scene_classes: list, run_config: Dict):
     if run_config["write_all"] or len(all_scene_classes) == 1:
         classes_to_run = all_scene_classes
     else:
@@ -101,11 +153,173 @@ def get_scenes_to_render(all_scene_classes: list, scene_config: Dict, run_config
 
     if len(classes_to_run) == 0:
         classes_to_run = prompt_user_for_choice(all_scene_classes)
+    return classes_to_run
 
-    return [
-        scene_from_class(scene_class, scene_config, run_config)
-        for scene_class in classes_to_run
+
+def render_scene_in_subprocess(scene_name: str, scene_config_updates: Optional[dict] = None) -> str | None:
+    """
+    Meant to run in a freshly spawned process, where manim_config is rebuilt
+    from the same command line arguments, so this finds the scene by name
+    and renders it with its own OpenGL context and file writer.
+
+    Returns the path of the movie written, if any.
+    """
+    run_config = manim_config.run
+    module = get_module(run_config.file_name, run_config.embed_line)
+    name_to_class = {sc.__name__: sc for sc in get_scene_classes(module)}
+    scene_config = Dict(manim_config.scene)
+    scene_config.update(scene_config_updates or dict())
+    # Output from the file writers of separate processes would be garbled,
+    # and with no progress display, there's no need for a prerun
+    scene_config.file_writer_config.quiet = True
+    scene = name_to_class[scene_name](**scene_config)
+    scene.run()
+    if scene.file_writer.write_to_movie:
+        return scene.file_writer.get_movie_file_path()
+    return None
+
+
+def render_in_subprocesses(
+    tasks: list[tuple[str, dict]],
+    n_jobs: int,
+    desc: str = "Rendering",
+) -> list[str | None]:
+    """
+    Calls render_scene_in_subprocess for each pair of scene name and scene
+    config updates in tasks, with up to n_jobs processes running at once,
+    showing a single progress display across all of them.
+
+    Returns what each returned, with None for any which failed.
+    """
+    # Processes are spawned, rather than forked, since OpenGL contexts
+    # can't safely be shared with a child process
+    mp_context = multiprocessing.get_context("spawn")
+    results: list[str | None] = [None] * len(tasks)
+    with ProcessPoolExecutor(max_workers=n_jobs, mp_context=mp_context) as executor:
+        future_to_index = {
+            executor.submit(render_scene_in_subprocess, *task): index
+            for index, task in enumerate(tasks)
+        }
+        progress_display = ProgressDisplay(
+            as_completed(future_to_index),
+            total=len(future_to_index),
+            desc=desc,
+            leave=False,
+            ascii=True if platform.system() == 'Windows' else None,
+        )
+        for future in progress_display:
+            index = future_to_index[future]
+            name = tasks[index][0]
+            try:
+                results[index] = future.result()
+            except Exception as err:
+                log.error(f"Failed to render {name}", exc_info=err)
+    return results
+
+
+def render_scenes_in_parallel(scene_classes: list, run_config: Dict) -> None:
+    """
+    Renders each scene in its own process, with up to run_config.jobs
+    running at once
+    """
+    render_in_subprocesses(
+        [(scene_class.__name__, dict()) for scene_class in scene_classes],
+        n_jobs=run_config.jobs,
+        desc=f"Rendering {len(scene_classes)} scenes",
+    )
+
+
+def get_time_slices(
+    play_frame_counts: list[int],
+    n_slices: int,
+    start: int | None = None,
+    end: int | None = None,
+) -> list[tuple[int | None, int | None]]:
+    """
+    Splits the plays from start to end into at most n_slices consecutive ranges,
+    each writing about as many frames as the others, returned as pairs to be
+    used for start_at_animation_number and end_at_animation_number
+    """
+    total = sum(play_frame_counts)
+    boundaries = [start or 0]
+    cumulative = 0
+    for index, count in enumerate(play_frame_counts[:-1]):
+        cumulative += count
+        if len(boundaries) == n_slices:
+            break
+        if index + 1 > boundaries[-1] and cumulative >= total * len(boundaries) / n_slices:
+            boundaries.append(index + 1)
+    starts = [b or None for b in boundaries]
+    return list(zip(starts, [*boundaries[1:], end]))
+
+
+def render_scene_in_time_slices(scene_class, scene_config: Dict, run_config: Dict) -> bool:
+    """
+    Renders a single scene in up to run_config.jobs processes at once, each
+    writing a consecutive range of its plays to a separate file, by way of
+    start_at_animation_number and end_at_animation_number, which are then
+    concatenated without re-encoding.
+
+    Each process still has to get through all plays before its range, though
+    that's fast when skipping animations, and faster still with --checkpoints.
+
+    Sounds added by the scene aren't carried from the slices into the
+    combined movie, so scenes adding any aren't rendered this way. Returns
+    whether the scene was rendered.
+    """
+    record = find_play_frame_counts(scene_class, scene_config)
+    if record is not None and record[1] and record[2] is not None:
+        play_frame_counts, _, adds_sound = record
+    else:
+        pre_scene = prerun_scene(scene_class, scene_config)
+        play_frame_counts = pre_scene.play_frame_counts
+        adds_sound = pre_scene.adds_sound
+    if adds_sound:
+        log.warning(
+            f"{scene_class.__name__} adds sounds, which would be lost from a movie "
+            "rendered in time slices, so it's rendered in a single process"
+        )
+        return False
+    time_slices = get_time_slices(
+        play_frame_counts, run_config.jobs,
+        scene_config.start_at_animation_number,
+        scene_config.end_at_animation_number,
+    )
+
+    # Name the final file as a single process would have
+    file_name = manim_config.file_writer.file_name or scene_class.__name__
+    if not manim_config.file_writer.file_name:
+        for number in (scene_config.start_at_animation_number, scene_config.end_at_animation_number):
+            if number is not None:
+                file_name += f"_{number}"
+
+    tasks = [
+        (scene_class.__name__, dict(
+            start_at_animation_number=slice_start,
+            end_at_animation_number=slice_end,
+            file_writer_config=dict(file_name=f"{file_name}_slice_{index:03}"),
+        ))
+        for index, (slice_start, slice_end) in enumerate(time_slices)
     ]
+    slice_paths = render_in_subprocesses(
+        tasks,
+        n_jobs=run_config.jobs,
+        desc=f"Rendering {scene_class.__name__} in {len(tasks)} slices",
+    )
+    if None in slice_paths:
+        # Rather than leave a movie with a gap, discard the slices which
+        # did render and fall back on rendering in a single process
+        for path in filter(None, slice_paths):
+            os.remove(path)
+        log.warning(f"Rendering {scene_class.__name__} in a single process instead")
+        return False
+    slice_paths = [Path(path) for path in slice_paths]
+    movie_path = slice_paths[0].with_name(file_name + slice_paths[0].suffix)
+    concatenate_movie_files(slice_paths, movie_path, manim_config.file_writer.ffmpeg_bin)
+    for path in slice_paths:
+        os.remove(path)
+    log.info(f"File ready at {movie_path}")
+    return True
 
 
 def get_scene_classes(module: Optional[Module]):
@@ -172,7 +386,18 @@ def get_module(file_name: Optional[str], embed_line: Optional[int], is_reload: b
 def main(scene_config: Dict, run_config: Dict):
     module = get_module(run_config.file_name, run_config.embed_line, run_config.is_reload)
     all_scene_classes = get_scene_classes(module)
-    scenes = get_scenes_to_render(all_scene_classes, scene_config, run_config)
+    scene_classes = get_scene_classes_to_render(all_scene_classes, run_config)
+    if run_config.jobs > 1 and not run_config.show_in_window:
+        if len(scene_classes) > 1:
+            render_scenes_in_parallel(scene_classes, run_config)
+            return []
+        if manim_config.file_writer.write_to_movie and len(scene_classes) == 1:
+            if render_scene_in_time_slices(scene_classes[0], scene_config, run_config):
+                return []
+    scenes = [
+        scene_from_class(scene_class, scene_config, run_config)
+        for scene_class in scene_classes
+    ]
     if len(scenes) == 0:
         print("No scenes found to run")
     return scenes
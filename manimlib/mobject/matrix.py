@@ -72,11 +72,11 @@ class Matrix(VMobject):
 
     def copy(self, deep: bool = False):
         result = super().copy(deep)
-        self_family = self.get_family()
+        family_indices = self.get_family_indices()
         copy_family = result.get_family()
         for attr in ["elements", "ellipses"]:
             setattr(result, attr, [
-                copy_family[self_family.index(mob)]
+                copy_family[family_indices[mob]]
                 for mob in getattr(self, attr)
             ])
         return result
@@ -54,6 +54,7 @@ if TYPE_CHECKING:
     import numpy.typing as npt
     from manimlib.typing import ManimColor, Vect3, Vect4, Vect3Array, UniformDict, Self
     from moderngl.context import Context
+    from manimlib.scene.scene_checkpoints import MobjectRegistry
 
     T = TypeVar('T')
     TimeBasedUpdater = Callable[["Mobject", float], "Mobject" | None]
@@ -75,6 +76,19 @@ class Mobject(object):
     ])
     aligned_data_keys = ['point']
     pointlike_data_keys = ['point']
+    # Whether the shaders apply the "model_matrix" uniform to points,
+    # which is needed for use_lazy_transforms
+    supports_lazy_transforms: bool = False
+    # Running count of all mobjects created or copied, each of which is
+    # given the count at its creation as an index, so that the order in
+    # which any two were created can be told
+    num_created: int = 0
+    # While a scene saving checkpoints to disk runs, this records the
+    # mobjects it creates, see SceneCheckpointStore
+    creation_registry: MobjectRegistry | None = None
+    # While an updater runs with its reads recorded, this collects
+    # the mobjects it reads from, see UpdaterSchedule
+    recorded_reads: set[Mobject] | None = None
 
     def __init__(
         self,
@@ -96,9 +110,12 @@ class Mobject(object):
         self.z_index = z_index
 
         # Internal state
+        self.set_creation_index()
         self.submobjects: list[Mobject] = []
         self.parents: list[Mobject] = []
         self.family: list[Mobject] | None = [self]
+        # See get_family_indices
+        self.family_indices: dict[Mobject, int] | None = None
         self.locked_data_keys: set[str] = set()
         self.const_data_keys: set[str] = set()
         self.locked_uniform_keys: set[str] = set()
@@ -106,9 +123,25 @@ class Mobject(object):
         self.target = None
         self.bounding_box: Vect3Array = np.zeros((3, 3))
         self.shader_wrapper: Optional[ShaderWrapper] = None
+        # Whether submobjects may be drawn as instances of one shape,
+        # see VGroup.use_instanced_rendering
+        self.instanced_rendering: bool = False
+        self.instanced_shader_wrapper: Optional[ShaderWrapper] = None
         self._is_animating: bool = False
         self._needs_new_bounding_box: bool = True
         self._data_has_changed: bool = True
+        # Incremented with each change to data, so that shader wrappers
+        # can tell which mobjects need their data rewritten
+        self._data_version: int = 0
+        # Incremented with each change to the data, uniforms or lazy transform
+        # of this mobject or any of its family, so that anything depending on
+        # the family can tell, without comparing it, whether it's changed
+        self._family_version: int = 0
+        # See use_lazy_transforms
+        self.lazy_transforms: bool = False
+        self._has_model_transform: bool = False
+        # Incremented with each change to the lazy transform
+        self._model_version: int = 0
         self.shader_code_replacements: dict[str, str] = dict()
 
         self.init_data()
@@ -134,12 +167,57 @@ class Mobject(object):
         assert isinstance(other, int)
         return self.replicate(other)
 
+    @property
+    def data(self) -> np.ndarray:
+        # As this may be edited, any pending lazy transform is applied,
+        # and it's no longer shared with any copies
+        return self.get_data(unshare=True)
+
+    @data.setter
+    def data(self, data: np.ndarray) -> None:
+        self._data = data
+
+    def get_data(self, unshare: bool = False, transform_points: bool = True) -> np.ndarray:
+        """
+        Returns the data, for reading. This may be shared with copies of the
+        mobject, see Mobject.copy, in which case it's read-only, unless
+        unshare is True, as it is when accessed as Mobject.data.
+
+        Any pending lazy transform is first applied to the points, unless
+        transform_points is False, which suits reading or editing only
+        fields other than pointlike_data_keys, such as colors.
+        """
+        self.note_read()
+        if transform_points and self._has_model_transform:
+            self.apply_model_transform()
+        if unshare:
+            self.unshare_data()
+        return self._data
+
+    def unshare_data(self) -> Self:
+        """
+        Copies the data if it's shared with other mobjects, so
+        that it can be edited without affecting them
+        """
+        if not self._data.flags.writeable:
+            self._data = self._data.copy()
+        return self
+
     def init_data(self, length: int = 0):
         self.data = np.zeros(length, dtype=self.data_dtype)
         self._data_defaults = np.ones(1, dtype=self.data.dtype)
 
+    @property
+    def uniforms(self) -> UniformDict:
+        return self._uniforms
+
+    @uniforms.setter
+    def uniforms(self, uniforms: UniformDict):
+        self._uniforms = MobjectUniforms(self, uniforms)
+        self.note_changed_uniforms()
+
     def init_uniforms(self):
-        self.uniforms: UniformDict = {
+        self.uniforms = {
             "is_fixed_in_frame": 0.0,
             "shading": np.array(self.shading, dtype=float),
             "clip_plane": np.zeros(4),
@@ -153,10 +231,10 @@ class Mobject(object):
         pass
 
     def set_uniforms(self, uniforms: dict) -> Self:
-        for key, value in uniforms.items():
-            if isinstance(value, np.ndarray):
-                value = value.copy()
-            self.uniforms[key] = value
+        self.uniforms.update({
+            key: value.copy() if isinstance(value, np.ndarray) else value
+            for key, value in uniforms.items()
+        })
         return self
 
     @property
@@ -202,11 +280,41 @@ class Mobject(object):
         """
         return _FunctionalUpdaterBuilder(self)
 
+    def note_read(self) -> Self:
+        # For updaters whose reads are being recorded, see UpdaterSchedule
+        if Mobject.recorded_reads is not None:
+            Mobject.recorded_reads.add(self)
+        return self
+
     def note_changed_data(self, recurse_up: bool = True) -> Self:
         self._data_has_changed = True
+        self._data_version += 1
+        self._family_version += 1
         if recurse_up:
             for mob in self.parents:
-                mob.note_changed_data()
+                mob.note_changed_submobject_data()
+        return self
+
+    def note_changed_submobject_data(self) -> Self:
+        # This mobject's own data is unchanged, but not that of its family
+        self._data_has_changed = True
+        self._family_version += 1
+        for mob in self.parents:
+            mob.note_changed_submobject_data()
+        return self
+
+    def note_changed_uniforms(self, recurse: bool = False) -> Self:
+        """
+        Notes a change to the uniforms of this mobject, or of its whole
+        family if recurse is True, for anything tracking _family_version.
+        Assignments to uniforms are noted by MobjectUniforms, so this need
+        only be called after changing an array among them in place.
+        """
+        for mob in self.get_family(recurse):
+            mob._family_version += 1
+        if self.parents:
+            for mob in self.get_ancestors():
+                mob._family_version += 1
         return self
 
     @staticmethod
@@ -243,12 +351,12 @@ class Mobject(object):
         resize_func: Callable[[np.ndarray, int], np.ndarray] = resize_array
     ) -> Self:
         if new_length == 0:
-            if len(self.data) > 0:
-                self._data_defaults[:1] = self.data[:1]
+            if len(self.get_data()) > 0:
+                self._data_defaults[:1] = self.get_data()[:1]
         elif self.get_num_points() == 0:
             self.data = self._data_defaults.copy()
 
-        self.data = resize_func(self.data, new_length)
+        self.data = resize_func(self.get_data(), new_length)
         self.refresh_bounding_box()
         return self
 
@@ -314,6 +422,8 @@ class Mobject(object):
         return self
 
     def get_points(self) -> Vect3Array:
+        # As the points returned may be edited in place,
+        # they're no longer shared with any copies
         return self.data["point"]
 
     def clear_points(self) -> Self:
@@ -321,18 +431,19 @@ class Mobject(object):
         return self
 
     def get_num_points(self) -> int:
-        return len(self.get_points())
+        return len(self._data)
 
     def get_all_points(self) -> Vect3Array:
         if self.submobjects:
-            return np.vstack([sm.get_points() for sm in self.get_family()])
+            return np.vstack([sm.get_data()["point"] for sm in self.get_family()])
         else:
             return self.get_points()
 
     def has_points(self) -> bool:
-        return len(self.get_points()) > 0
+        return self.get_num_points() > 0
 
     def get_bounding_box(self) -> Vect3Array:
+        self.note_read()
         if self._needs_new_bounding_box:
             self.bounding_box[:] = self.compute_bounding_box()
             self._needs_new_bounding_box = False
@@ -340,7 +451,7 @@ class Mobject(object):
 
     def compute_bounding_box(self) -> Vect3Array:
         all_points = np.vstack([
-            self.get_points(),
+            self.get_model_transformed_points(),
             *(
                 mob.get_bounding_box()
                 for mob in self.get_family()[1:]
@@ -413,11 +524,21 @@ class Mobject(object):
     @affects_data
     def note_changed_family(self, only_changed_order=False) -> Self:
         self.family = None
+        self.family_indices = None
+        self._updaters_version += 1
+        self._family_version += 1
         if not only_changed_order:
-            self.refresh_has_updater_status()
-            self.refresh_bounding_box()
-        for parent in self.parents:
-            parent.note_changed_family()
+            self._has_updaters_in_family = None
+            self._needs_new_bounding_box = True
+        # Each ancestor is only visited once, rather than once
+        # for every path leading up to it
+        for mob in self.get_ancestors():
+            mob.family = None
+            mob.family_indices = None
+            mob._updaters_version += 1
+            mob._family_version += 1
+            mob._has_updaters_in_family = None
+            mob._needs_new_bounding_box = True
         return self
 
     def get_family(self, recurse: bool = True) -> list[Mobject]:
@@ -429,8 +550,26 @@ class Mobject(object):
             self.family = [self, *it.chain(*sub_families)]
         return self.family
 
+    def get_family_indices(self) -> dict[Mobject, int]:
+        """
+        Maps each member of the family to its position in get_family, which
+        is kept alongside it, so that finding a member, or checking whether
+        something is one, takes constant time.
+        """
+        if self.family_indices is None:
+            family = self.get_family()
+            # Filled from the end, so that a mobject appearing more than
+            # once in the family is mapped to its first position
+            self.family_indices = dict(zip(
+                reversed(family), range(len(family) - 1, -1, -1)
+            ))
+        return self.family_indices
+
+    def has_family_member(self, mobject: Mobject) -> bool:
+        return mobject in self.get_family_indices()
+
     def family_members_with_points(self) -> list[Mobject]:
-        return [m for m in self.get_family() if len(m.data) > 0]
+        return [m for m in self.get_family() if m.has_points()]
 
     def get_ancestors(self, extended: bool = False) -> list[Mobject]:
         """
@@ -456,8 +595,10 @@ class Mobject(object):
     def add(self, *mobjects: Mobject) -> Self:
         if self in mobjects:
             raise Exception("Mobject cannot contain self")
-        for mobject in mobjects:
-            if mobject not in self.submobjects:
+        # Checked against a set when adding many, so that it stays linear
+        existing = set(self.submobjects) if len(mobjects) > 1 else self.submobjects
+        for mobject in dict.fromkeys(mobjects):
+            if mobject not in existing:
                 self.submobjects.append(mobject)
             if self not in mobject.parents:
                 mobject.parents.append(self)
@@ -656,13 +797,23 @@ class Mobject(object):
 
     @stash_mobject_pointers
     def deepcopy(self) -> Self:
-        return copy.deepcopy(self)
+        result = copy.deepcopy(self)
+        for mob in result.get_family():
+            mob.set_creation_index()
+        return result
+
+    def set_creation_index(self) -> None:
+        self.creation_index: int = Mobject.num_created
+        Mobject.num_created += 1
+        if Mobject.creation_registry is not None:
+            Mobject.creation_registry.add(self)
 
     def copy(self, deep: bool = False) -> Self:
         if deep:
             return self.deepcopy()
 
         result = copy.copy(self)
+        result.set_creation_index()
 
         result.parents = []
         result.target = None
@@ -671,10 +822,14 @@ class Mobject(object):
         # copy.copy is only a shallow copy, so the internal
         # data which are numpy arrays or other mobjects still
         # need to be further copied.
-        result.uniforms = {
+        result._uniforms = MobjectUniforms(result, {
             key: value.copy() if isinstance(value, np.ndarray) else value
             for key, value in self.uniforms.items()
-        }
+        })
+        # The data, however, is shared until either mobject edits it,
+        # at which point that one makes its own copy, see get_data
+        self._data.flags.writeable = False
+        result._data = self._data
 
         # Instead of adding using result.add, which does some checks for updating
         # updater statues and bounding box, just directly modify the family-related
@@ -683,19 +838,22 @@ class Mobject(object):
         for sm in result.submobjects:
             sm.parents = [result]
         result.family = [result, *it.chain(*(sm.get_family() for sm in result.submobjects))]
+        result.family_indices = None
 
         # Similarly, instead of calling match_updaters, since we know the status
         # won't have changed, just directly match.
         result.updaters = list(self.updaters)
+        result.updater_dependencies = dict(self.updater_dependencies)
         result._data_has_changed = True
         result.shader_wrapper = None
+        result.instanced_shader_wrapper = None
 
-        family = self.get_family()
         for attr, value in self.__dict__.items():
             if isinstance(value, Mobject) and value is not self:
-                if value in family:
-                    setattr(result, attr, result.family[family.index(value)])
-            elif isinstance(value, np.ndarray):
+                index = self.get_family_indices().get(value)
+                if index is not None:
+                    setattr(result, attr, result.family[index])
+            elif isinstance(value, np.ndarray) and attr != "_data":
                 setattr(result, attr, value.copy())
         return result
 
@@ -724,7 +882,7 @@ class Mobject(object):
         family1 = self.get_family()
         family2 = mobject.get_family()
         for sm1, sm2 in zip(family1, family2):
-            sm1.set_data(sm2.data)
+            sm1.set_data(sm2.get_data())
             sm1.set_uniforms(sm2.uniforms)
             sm1.bounding_box[:] = sm2.bounding_box
             sm1.shader_folder = sm2.shader_folder
@@ -734,8 +892,8 @@ class Mobject(object):
             sm1._needs_new_bounding_box = sm2._needs_new_bounding_box
         # Make sure named family members carry over
         for attr, value in list(mobject.__dict__.items()):
-            if isinstance(value, Mobject) and value in family2:
-                setattr(self, attr, family1[family2.index(value)])
+            if isinstance(value, Mobject) and mobject.has_family_member(value):
+                setattr(self, attr, family1[mobject.get_family_indices()[value]])
         if match_updaters:
             self.match_updaters(mobject)
         return self
@@ -748,10 +906,11 @@ class Mobject(object):
         for m1, m2 in zip(fam1, fam2):
             if m1.get_num_points() != m2.get_num_points():
                 return False
-            if not m1.data.dtype == m2.data.dtype:
+            data1, data2 = m1.get_data(), m2.get_data()
+            if not data1.dtype == data2.dtype:
                 return False
-            for key in m1.data.dtype.names:
-                if not np.isclose(m1.data[key], m2.data[key]).all():
+            for key in data1.dtype.names:
+                if not np.isclose(data1[key], data2[key]).all():
                     return False
             if set(m1.uniforms).difference(m2.uniforms):
                 return False
@@ -818,6 +977,12 @@ class Mobject(object):
         self.updaters: list[Updater] = list()
         self._has_updaters_in_family: Optional[bool] = False
         self.updating_suspended: bool = False
+        # Mobjects that updaters added with dependencies depend on
+        self.updater_dependencies: dict[Updater, list[Mobject]] = dict()
+        # Incremented, for this mobject and its ancestors, whenever the
+        # updaters in the family, or the order they'd be called in, might
+        # have changed, see UpdaterSchedule
+        self._updaters_version: int = 0
 
     def update(self, dt: float = 0, recurse: bool = True) -> Self:
         if not self.has_updaters() or self.updating_suspended:
@@ -837,8 +1002,25 @@ class Mobject(object):
     def get_updaters(self) -> list[Updater]:
         return self.updaters
 
-    def add_updater(self, update_func: Updater, call: bool = True) -> Self:
+    def add_updater(
+        self,
+        update_func: Updater,
+        call: bool = True,
+        dependencies: Iterable[Mobject] | None = None
+    ) -> Self:
+        """
+        Adds a function to be called with this mobject on each frame, and
+        with the time since the last one, if it takes an argument named dt.
+
+        If dependencies are given, the function is taken to depend only on
+        the state of those mobjects, and of this one, so that a scene will
+        only call it when one of them has changed since it was last called.
+        Scenes with reactive_updaters set treat all updaters not taking dt
+        this way, recording the mobjects they read from as they run.
+        """
         self.updaters.append(update_func)
+        if dependencies is not None:
+            self.updater_dependencies[update_func] = list(dependencies)
         if call:
             self.update(dt=0)
         self.refresh_has_updater_status()
@@ -852,36 +1034,37 @@ class Mobject(object):
     def remove_updater(self, update_func: Updater) -> Self:
         while update_func in self.updaters:
             self.updaters.remove(update_func)
+        self.updater_dependencies.pop(update_func, None)
         self.refresh_has_updater_status()
         return self
 
     def clear_updaters(self, recurse: bool = True) -> Self:
         for mob in self.get_family(recurse):
             mob.updaters = []
+            mob.updater_dependencies = dict()
             mob._has_updaters_in_family = False
+            mob._updaters_version += 1
         for parent in self.get_ancestors():
             parent._has_updaters_in_family = False
+            parent._updaters_version += 1
         return self
 
     def match_updaters(self, mobject: Mobject) -> Self:
         self.updaters = list(mobject.updaters)
+        self.updater_dependencies = dict(mobject.updater_dependencies)
         self.refresh_has_updater_status()
         return self
 
     def suspend_updating(self, recurse: bool = True) -> Self:
-        self.updating_suspended = True
-        if recurse:
-            for submob in self.submobjects:
-                submob.suspend_updating(recurse)
+        for mob in self.get_family(recurse):
+            mob.updating_suspended = True
+        self.refresh_has_updater_status()
         return self
 
     def resume_updating(self, recurse: bool = True, call_updater: bool = True) -> Self:
-        self.updating_suspended = False
-        if recurse:
-            for submob in self.submobjects:
-                submob.resume_updating(recurse)
-        for parent in self.parents:
-            parent.resume_updating(recurse=False, call_updater=False)
+        for mob in (*self.get_family(recurse), *self.get_ancestors()):
+            mob.updating_suspended = False
+        self.refresh_has_updater_status()
         if call_updater:
             self.update(dt=0, recurse=recurse)
         return self
@@ -895,9 +1078,9 @@ class Mobject(object):
         return self._has_updaters_in_family
 
     def refresh_has_updater_status(self) -> Self:
-        self._has_updaters_in_family = None
-        for parent in self.parents:
-            parent.refresh_has_updater_status()
+        for mob in (self, *self.get_ancestors()):
+            mob._has_updaters_in_family = None
+            mob._updaters_version += 1
         return self
 
     # Check if mark as static or not for camera
@@ -913,6 +1096,8 @@ class Mobject(object):
     # Transforming operations
 
     def shift(self, vector: Vect3) -> Self:
+        if self.can_transform_lazily():
+            return self.compose_model_transform(1.0, np.identity(3), ORIGIN, vector)
         self.apply_points_function(
             lambda points: points + vector,
             about_edge=None,
@@ -940,12 +1125,17 @@ class Mobject(object):
             scale_factor = max(scale_factor, min_scale_factor)
         else:
             scale_factor = np.array(scale_factor).clip(min=min_scale_factor)
-        self.apply_points_function(
-            lambda points: scale_factor * points,
-            about_point=about_point,
-            about_edge=about_edge,
-            works_on_bounding_box=True,
-        )
+        if isinstance(scale_factor, numbers.Number) and self.can_transform_lazily():
+            if about_point is None:
+                about_point = self.get_bounding_box_point(about_edge)
+            self.compose_model_transform(scale_factor, np.identity(3), about_point)
+        else:
+            self.apply_points_function(
+                lambda points: scale_factor * points,
+                about_point=about_point,
+                about_edge=about_edge,
+                works_on_bounding_box=True,
+            )
         for mob in self.get_family():
             mob._handle_scale_side_effects(scale_factor)
         return self
@@ -973,6 +1163,10 @@ class Mobject(object):
         **kwargs
     ) -> Self:
         rot_matrix_T = rotation_matrix_transpose(angle, axis)
+        if self.can_transform_lazily():
+            if about_point is None:
+                about_point = self.get_bounding_box_point(kwargs.get("about_edge", ORIGIN))
+            return self.compose_model_transform(1.0, rot_matrix_T.T, about_point)
         self.apply_points_function(
             lambda points: np.dot(points, rot_matrix_T),
             about_point,
@@ -980,6 +1174,101 @@ class Mobject(object):
         )
         return self
 
+    # Lazy transforms
+
+    def use_lazy_transforms(self, use: bool = True, recurse: bool = True) -> Self:
+        """
+        With this, shift, rotate and scale (by a single factor) don't rewrite
+        any points, but are composed into a transform which the shaders apply,
+        held in the "model_matrix" uniform. It's only applied to the points
+        themselves when they're next read or edited, so a mobject with many
+        points can be moved about every frame without rewriting them, nor
+        sending them to the gpu again.
+
+        This only takes effect for a mobject whose whole family supports it,
+        as with VMobjects.
+        """
+        for mob in self.get_family(recurse):
+            if not use:
+                mob.apply_model_transform()
+            mob.lazy_transforms = use and mob.supports_lazy_transforms
+        return self
+
+    def can_transform_lazily(self) -> bool:
+        return all(mob.lazy_transforms for mob in self.get_family())
+
+    def compose_model_transform(
+        self,
+        scale_factor: float,
+        rotation: np.ndarray,
+        about_point: Vect3,
+        shift: Vect3 = ORIGIN,
+    ) -> Self:
+        """
+        Composes the map p -> scale_factor * rotation (p - about_point) + about_point + shift
+        into the lazy transform of each family member, see use_lazy_transforms
+        """
+        affine = np.identity(4)
+        affine[:3, :3] = scale_factor * rotation
+        affine[:3, 3] = about_point - np.dot(affine[:3, :3], about_point) + shift
+        # Bounding boxes can follow along exactly unless there's a rotation
+        moves_bounding_box = (rotation == np.identity(3)).all()
+
+        for mob in self.get_family():
+            if mob.has_points():
+                # Stored flattened in the column major order of glsl
+                model_matrix = mob.uniforms["model_matrix"]
+                model_matrix[:] = np.dot(affine, model_matrix.reshape(4, 4).T).T.flatten()
+                mob._has_model_transform = True
+            if moves_bounding_box:
+                mob.bounding_box[:] = scale_factor * (mob.bounding_box - about_point) + about_point + shift
+            else:
+                mob._needs_new_bounding_box = True
+            mob.note_changed_model_transform(recurse_up=False)
+
+        for parent in self.parents:
+            parent.refresh_bounding_box()
+            parent.note_changed_model_transform()
+        return self
+
+    def note_changed_model_transform(self, recurse_up: bool = True) -> Self:
+        # The data is unchanged, but shader wrappers are batched by transform
+        self._data_has_changed = True
+        self._model_version += 1
+        self._family_version += 1
+        if recurse_up:
+            for mob in self.parents:
+                mob.note_changed_model_transform()
+        return self
+
+    def get_model_transformed_points(self) -> Vect3Array:
+        """
+        The points as they are drawn, with any pending lazy
+        transform applied, without applying it to the data
+        """
+        points = self._data["point"]
+        if not self._has_model_transform:
+            return points
+        affine = self.uniforms["model_matrix"].reshape(4, 4).T
+        return np.dot(points, affine[:3, :3].T) + affine[:3, 3]
+
+    def apply_model_transform(self) -> Self:
+        """
+        Applies any pending lazy transform to the points themselves,
+        see use_lazy_transforms
+        """
+        if not self._has_model_transform:
+            return self
+        self._has_model_transform = False
+        model_matrix = self.uniforms["model_matrix"]
+        affine = model_matrix.reshape(4, 4).T
+        self.unshare_data()
+        for key in self.pointlike_data_keys:
+            self._data[key] = np.dot(self._data[key], affine[:3, :3].T) + affine[:3, 3]
+        model_matrix[:] = np.identity(4).flatten()
+        self.note_changed_data()
+        return self
+
     def flip(self, axis: Vect3 = UP, **kwargs) -> Self:
         return self.rotate(TAU / 2, axis, **kwargs)
 
@@ -1313,7 +1602,7 @@ class Mobject(object):
         recurse: bool = False
     ) -> Self:
         for mob in self.get_family(recurse):
-            data = mob.data if mob.get_num_points() > 0 else mob._data_defaults
+            data = mob.get_data(unshare=True, transform_points=False) if mob.has_points() else mob._data_defaults
             data[name][:] = rgba_array
         return self
 
@@ -1353,7 +1642,7 @@ class Mobject(object):
         recurse: bool = True
     ) -> Self:
         for mob in self.get_family(recurse):
-            data = mob.data if mob.has_points() > 0 else mob._data_defaults
+            data = mob.get_data(unshare=True, transform_points=False) if mob.has_points() else mob._data_defaults
             if color is not None:
                 rgbs = np.array(list(map(color_to_rgb, listify(color))))
                 if 1 < len(rgbs):
@@ -1391,13 +1680,13 @@ class Mobject(object):
         return self
 
     def get_color(self) -> str:
-        return rgb_to_hex(self.data["rgba"][0, :3])
+        return rgb_to_hex(self.get_data(transform_points=False)["rgba"][0, :3])
 
     def get_opacity(self) -> float:
-        return float(self.data["rgba"][0, 3])
+        return float(self.get_data(transform_points=False)["rgba"][0, 3])
 
     def get_opacities(self) -> float:
-        return self.data["rgba"][:, 3]
+        return self.get_data(unshare=True, transform_points=False)["rgba"][:, 3]
 
     def set_color_by_gradient(self, *colors: ManimColor) -> Self:
         if self.has_points():
@@ -1716,7 +2005,7 @@ class Mobject(object):
     # Alignment
 
     def is_aligned_with(self, mobject: Mobject) -> bool:
-        if len(self.data) != len(mobject.data):
+        if self.get_num_points() != mobject.get_num_points():
             return False
         if len(self.submobjects) != len(mobject.submobjects):
             return False
@@ -1805,8 +2094,8 @@ class Mobject(object):
         if keys:
             self.note_changed_data()
         for key in keys:
-            md1 = mobject1.data[key]
-            md2 = mobject2.data[key]
+            md1 = mobject1.get_data()[key]
+            md2 = mobject2.get_data()[key]
             if key in self.const_data_keys:
                 md1 = md1[0]
                 md2 = md2[0]
@@ -1815,12 +2104,16 @@ class Mobject(object):
             else:
                 self.data[key] = (1 - alpha) * md1 + alpha * md2
 
+        uniforms = dict()
         for key in self.uniforms:
-            if key in self.locked_uniform_keys:
+            if key in self.locked_uniform_keys or key == "model_matrix":
+                # Any lazy transforms were applied when the data above was read
                 continue
             if key not in mobject1.uniforms or key not in mobject2.uniforms:
                 continue
-            self.uniforms[key] = (1 - alpha) * mobject1.uniforms[key] + alpha * mobject2.uniforms[key]
+            uniforms[key] = (1 - alpha) * mobject1.uniforms[key] + alpha * mobject2.uniforms[key]
+        if uniforms:
+            self.uniforms.update(uniforms)
         self.bounding_box[:] = path_func(mobject1.bounding_box, mobject2.bounding_box, alpha)
         return self
 
@@ -1862,22 +2155,23 @@ class Mobject(object):
             mobject2.get_family(),
         )
         for sm, sm1, sm2 in tuples:
-            if not sm.data.dtype == sm1.data.dtype == sm2.data.dtype:
+            data, data1, data2 = sm.get_data(), sm1.get_data(), sm2.get_data()
+            if not data.dtype == data1.dtype == data2.dtype:
                 continue
             sm.lock_data(
-                key for key in sm.data.dtype.names
-                if arrays_match(sm1.data[key], sm2.data[key])
+                key for key in data.dtype.names
+                if arrays_match(data1[key], data2[key])
             )
             sm.lock_uniforms(
                 key for key in self.uniforms
                 if all(listify(mobject1.uniforms.get(key, 0) == mobject2.uniforms.get(key, 0)))
             )
             sm.const_data_keys = set(
-                key for key in sm.data.dtype.names
+                key for key in data.dtype.names
                 if key not in sm.locked_data_keys
                 if all(
-                    array_is_constant(mob.data[key])
-                    for mob in (sm, sm1, sm2)
+                    array_is_constant(mob_data[key])
+                    for mob_data in (data, data1, data2)
                 )
             )
 
@@ -1943,10 +2237,12 @@ class Mobject(object):
                 submob.uniforms["clip_plane"][:3] = vect
             if threshold is not None:
                 submob.uniforms["clip_plane"][3] = threshold
+        self.note_changed_uniforms(recurse)
         return self
 
     def deactivate_clip_plane(self) -> Self:
         self.uniforms["clip_plane"][:] = 0
+        self.note_changed_uniforms()
         return self
 
     # Shader code manipulation
@@ -2002,7 +2298,7 @@ class Mobject(object):
     def init_shader_wrapper(self, ctx: Context):
         self.shader_wrapper = ShaderWrapper(
             ctx=ctx,
-            vert_data=self.data,
+            vert_data=self.get_data(),
             shader_folder=self.shader_folder,
             mobject_uniforms=self.uniforms,
             texture_paths=self.texture_paths,
@@ -2025,24 +2321,61 @@ class Mobject(object):
             self.init_shader_wrapper(ctx)
         return self.shader_wrapper
 
+    def get_instanced_shader_wrapper(self, ctx: Context) -> Optional[ShaderWrapper]:
+        """
+        Shader wrapper, with its data read in, which draws all submobjects
+        at once as instances of a single shape, or None if they can't be
+        """
+        return None
+
     def get_shader_wrapper_list(self, ctx: Context) -> list[ShaderWrapper]:
         family = self.family_members_with_points()
-        batches = batch_by_property(family, lambda sm: sm.get_shader_wrapper(ctx).get_id())
+
+        # Groups drawn with instancing take the place of their submobjects
+        instanced_groups = dict()
+        for group in self.get_family():
+            if group.instanced_rendering and group.submobjects:
+                wrapper = group.get_instanced_shader_wrapper(ctx)
+                if wrapper is not None:
+                    instanced_groups[id(group.submobjects[0])] = (group, wrapper)
+        if instanced_groups:
+            skipped = set()
+            items = []
+            for sm in family:
+                if id(sm) in skipped:
+                    continue
+                if id(sm) in instanced_groups:
+                    group, wrapper = instanced_groups[id(sm)]
+                    skipped.update(map(id, group.submobjects))
+                    sm = wrapper
+                items.append(sm)
+        else:
+            items = family
+
+        def get_id(item):
+            if isinstance(item, ShaderWrapper):
+                return id(item)
+            # Mobjects with different lazy transforms can't share a draw call
+            model_matrix = item.uniforms.get("model_matrix")
+            model_key = None if model_matrix is None else model_matrix.tobytes()
+            return (item.get_shader_wrapper(ctx).get_id(), model_key)
 
         result = []
-        for submobs, sid in batches:
+        for submobs, sid in batch_by_property(items, get_id):
+            if isinstance(submobs[0], ShaderWrapper):
+                result.append(submobs[0])
+                continue
             shader_wrapper = submobs[0].shader_wrapper
-            data_list = [sm.get_shader_data() for sm in submobs]
-            shader_wrapper.read_in(data_list)
+            shader_wrapper.read_in_mobjects(submobs)
             result.append(shader_wrapper)
         return result
 
     def get_shader_data(self) -> np.ndarray:
         indices = self.get_shader_vert_indices()
         if indices is not None:
-            return self.data[indices]
+            return self.get_data()[indices]
         else:
-            return self.data
+            return self.get_data()
 
     def get_uniforms(self):
         return self.uniforms
@@ -2165,6 +2498,57 @@ class Mobject(object):
             raise Exception(message.format(caller_name))
 
 
+class MobjectUniforms(dict):
+    """
+    Uniforms of a mobject, which note any assignment to them with
+    Mobject.note_changed_uniforms. Arrays among them which are
+    changed in place have to be noted explicitly.
+    """
+    def __init__(self, mobject: Mobject | None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.mobject = mobject
+
+    def __reduce__(self):
+        # When copied or unpickled, the items are passed in together, as
+        # the mobject they'd otherwise be noted with may not yet be whole
+        return (MobjectUniforms, (None, dict(self)), dict(mobject=self.mobject))
+
+    def note_changed(self) -> None:
+        if self.mobject is not None:
+            self.mobject.note_changed_uniforms()
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self.note_changed()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self.note_changed()
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self.note_changed()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self.note_changed()
+        return result
+
+    def popitem(self):
+        result = super().popitem()
+        self.note_changed()
+        return result
+
+    def clear(self) -> None:
+        super().clear()
+        self.note_changed()
+
+
 class Group(Mobject, Generic[SubmobjectType]):
     def __init__(self, *mobjects: SubmobjectType | Iterable[SubmobjectType], **kwargs):
         super().__init__(**kwargs)
@@ -165,6 +165,7 @@ class BraceLabel(VMobject):
 
     def copy(self):
         copy_mobject = copy.copy(self)
+        copy_mobject.set_creation_index()
         copy_mobject.brace = self.brace.copy()
         copy_mobject.label = self.label.copy()
         copy_mobject.set_submobjects([copy_mobject.brace, copy_mobject.label])
@@ -115,7 +115,7 @@ class DotCloud(PMobject):
         return self
 
     def get_radius(self) -> float:
-        return self.get_radii().max()
+        return self.get_data()["radius"].max()
 
     def scale_radii(self, scale_factor: float) -> Self:
         self.set_radius(scale_factor * self.get_radii())
@@ -36,7 +36,7 @@ class PMobject(Mobject):
         # rgbas array will have been resized with points
         if color is not None:
             if opacity is None:
-                opacity = self.data["rgba"][-1, 3]
+                opacity = self.get_data()["rgba"][-1, 3]
             rgbas = np.repeat(
                 [color_to_rgba(color, opacity)],
                 len(points),
@@ -62,7 +62,7 @@ class PMobject(Mobject):
     @Mobject.affects_data
     def match_colors(self, pmobject: PMobject) -> Self:
         self.data["rgba"][:] = resize_with_interpolation(
-            pmobject.data["rgba"], self.get_num_points()
+            pmobject.get_data()["rgba"], self.get_num_points()
         )
         return self
 
@@ -87,7 +87,7 @@ class PMobject(Mobject):
     @Mobject.affects_data
     def ingest_submobjects(self) -> Self:
         self.data = np.vstack([
-            sm.data for sm in self.get_family()
+            sm.get_data() for sm in self.get_family()
         ])
         return self
 
@@ -99,7 +99,7 @@ class PMobject(Mobject):
     def pointwise_become_partial(self, pmobject: PMobject, a: float, b: float) -> Self:
         lower_index = int(a * pmobject.get_num_points())
         upper_index = int(b * pmobject.get_num_points())
-        self.data = pmobject.data[lower_index:upper_index].copy()
+        self.data = pmobject.get_data()[lower_index:upper_index].copy()
         return self
 
 
@@ -124,10 +124,11 @@ class Surface(Mobject):
         return self.triangle_indices
 
     def get_unit_normals(self) -> Vect3Array:
-        points = self.get_points()
+        data = self.get_data()
+        points = data['point']
         crosses = cross(
-            self.data['du_point'] - points,
-            self.data['dv_point'] - points,
+            data['du_point'] - points,
+            data['dv_point'] - points,
         )
         return normalize_along_axis(crosses, 1)
 
@@ -148,7 +149,7 @@ class Surface(Mobject):
 
         nu, nv = smobject.resolution
         self.data['point'][:] = self.get_partial_points_array(
-            smobject.data['point'], a, b,
+            smobject.get_data()['point'], a, b,
             (nu, nv, 3),
             axis=axis
         )
@@ -292,10 +293,11 @@ class TexturedSurface(Surface):
         nu, nv = surf.resolution
         self.resize_points(surf.get_num_points())
         self.resolution = surf.resolution
-        self.data['point'][:] = surf.data['point']
-        self.data['du_point'][:] = surf.data['du_point']
-        self.data['dv_point'][:] = surf.data['dv_point']
-        self.data['opacity'][:, 0] = surf.data["rgba"][:, 3]
+        surf_data = surf.get_data()
+        self.data['point'][:] = surf_data['point']
+        self.data['du_point'][:] = surf_data['du_point']
+        self.data['dv_point'][:] = surf_data['dv_point']
+        self.data['opacity'][:, 0] = surf_data["rgba"][:, 3]
         self.data["im_coords"] = np.array([
             [u, v]
             for u in np.linspace(0, 1, nu)
@@ -331,7 +333,7 @@ class TexturedSurface(Surface):
     ) -> Self:
         super().pointwise_become_partial(tsmobject, a, b, axis)
         im_coords = self.data["im_coords"]
-        im_coords[:] = tsmobject.data["im_coords"]
+        im_coords[:] = tsmobject.get_data()["im_coords"]
         if a <= 0 and b >= 1:
             return self
         nu, nv = tsmobject.resolution
@@ -43,6 +43,7 @@ from manimlib.utils.space_ops import rotation_matrix_transpose
 from manimlib.utils.space_ops import poly_line_length
 from manimlib.utils.space_ops import z_to_vector
 from manimlib.shader_wrapper import VShaderWrapper
+from manimlib.shader_wrapper import InstancedVShaderWrapper
 
 from typing import TYPE_CHECKING
 from typing import Generic, TypeVar, Iterable
@@ -57,6 +58,37 @@ DEFAULT_STROKE_COLOR = GREY_A
 DEFAULT_FILL_COLOR = GREY_C
 
 
+class TriangulationCache(object):
+    """
+    Results of VMobject.get_triangulation, by the hash of the points and
+    normal they were computed for, since many mobjects share their shapes.
+    Once those cached hold more than max_size indices in total, the oldest
+    are forgotten.
+    """
+    def __init__(self, max_size: int = 2**24):
+        self.max_size = max_size
+        self.triangulations: dict[int, np.ndarray] = dict()
+        self.size = 0
+
+    def get(self, key: int) -> np.ndarray | None:
+        return self.triangulations.get(key)
+
+    def add(self, key: int, tri_indices: np.ndarray) -> None:
+        tri_indices.flags.writeable = False
+        while self.triangulations and self.size + len(tri_indices) > self.max_size:
+            oldest = self.triangulations.pop(next(iter(self.triangulations)))
+            self.size -= len(oldest)
+        self.triangulations[key] = tri_indices
+        self.size += len(tri_indices)
+
+    def clear(self) -> None:
+        self.triangulations.clear()
+        self.size = 0
+
+
+TRIANGULATION_CACHE = TriangulationCache()
+
+
 class VMobject(Mobject):
     data_dtype: np.dtype = np.dtype([
         ('point', np.float32, (3,)),
@@ -67,6 +99,7 @@ class VMobject(Mobject):
         ('base_normal', np.float32, (3,)),  # Base points and unit normal vectors are interleaved in this array
         ('fill_border_width', np.float32, (1,)),
     ])
+    supports_lazy_transforms: bool = True
     pre_function_handle_to_anchor_scale_factor: float = 0.01
     make_smooth_after_applying_functions: bool = False
     # TODO, do we care about accounting for varying zoom levels?
@@ -130,7 +163,9 @@ class VMobject(Mobject):
             anti_alias_width=self.anti_alias_width,
             joint_type=self.joint_type_map[self.joint_type],
             flat_stroke=float(self.flat_stroke),
-            scale_stroke_with_zoom=float(self.scale_stroke_with_zoom)
+            scale_stroke_with_zoom=float(self.scale_stroke_with_zoom),
+            # Pending lazy transform, see Mobject.use_lazy_transforms
+            model_matrix=np.identity(4).flatten(),
         )
 
     def add(self, *vmobjects: VMobject) -> Self:
@@ -167,7 +202,7 @@ class VMobject(Mobject):
         if border_width is not None:
             self.border_width = border_width
             for mob in self.get_family(recurse):
-                data = mob.data if mob.has_points() > 0 else mob._data_defaults
+                data = mob.get_data(unshare=True, transform_points=False) if mob.has_points() else mob._data_defaults
                 data["fill_border_width"] = border_width
         return self
 
@@ -184,7 +219,7 @@ class VMobject(Mobject):
 
         if width is not None:
             for mob in self.get_family(recurse):
-                data = mob.data if mob.get_num_points() > 0 else mob._data_defaults
+                data = mob.get_data(unshare=True, transform_points=False) if mob.has_points() else mob._data_defaults
                 if isinstance(width, (float, int)):
                     data['stroke_width'][:, 0] = width
                 else:
@@ -229,7 +264,8 @@ class VMobject(Mobject):
     ) -> Self:
         for mob in self.get_family(recurse):
             if fill_rgba is not None:
-                mob.data['fill_rgba'][:] = resize_with_interpolation(fill_rgba, len(mob.data['fill_rgba']))
+                data = mob.get_data(unshare=True, transform_points=False)
+                data['fill_rgba'][:] = resize_with_interpolation(fill_rgba, len(data))
             else:
                 mob.set_fill(
                     color=fill_color,
@@ -239,7 +275,8 @@ class VMobject(Mobject):
                 )
 
             if stroke_rgba is not None:
-                mob.data['stroke_rgba'][:] = resize_with_interpolation(stroke_rgba, len(mob.data['stroke_rgba']))
+                data = mob.get_data(unshare=True, transform_points=False)
+                data['stroke_rgba'][:] = resize_with_interpolation(stroke_rgba, len(data))
                 mob.set_stroke(
                     width=stroke_width,
                     behind=stroke_behind,
@@ -261,7 +298,7 @@ class VMobject(Mobject):
         return self
 
     def get_style(self) -> dict[str, Any]:
-        data = self.data if self.get_num_points() > 0 else self._data_defaults
+        data = self.get_data(transform_points=False) if self.has_points() else self._data_defaults
         return {
             "fill_rgba": data['fill_rgba'].copy(),
             "fill_border_width": data['fill_border_width'].copy(),
@@ -326,23 +363,23 @@ class VMobject(Mobject):
     def get_fill_colors(self) -> list[str]:
         return [
             rgb_to_hex(rgba[:3])
-            for rgba in self.data['fill_rgba']
+            for rgba in self.get_data(transform_points=False)['fill_rgba']
         ]
 
     def get_fill_opacities(self) -> np.ndarray:
-        return self.data['fill_rgba'][:, 3]
+        return self.get_data(unshare=True, transform_points=False)['fill_rgba'][:, 3]
 
     def get_stroke_colors(self) -> list[str]:
         return [
             rgb_to_hex(rgba[:3])
-            for rgba in self.data['stroke_rgba']
+            for rgba in self.get_data(transform_points=False)['stroke_rgba']
         ]
 
     def get_stroke_opacities(self) -> np.ndarray:
-        return self.data['stroke_rgba'][:, 3]
+        return self.get_data(unshare=True, transform_points=False)['stroke_rgba'][:, 3]
 
     def get_stroke_widths(self) -> np.ndarray:
-        return self.data['stroke_width'][:, 0]
+        return self.get_data(unshare=True, transform_points=False)['stroke_width'][:, 0]
 
     # TODO, it's weird for these to return the first of various lists
     # rather than the full information
@@ -351,7 +388,7 @@ class VMobject(Mobject):
         If there are multiple colors (for gradient)
         this returns the first one
         """
-        data = self.data if self.has_points() else self._data_defaults
+        data = self.get_data(transform_points=False) if self.has_points() else self._data_defaults
         return rgb_to_hex(data["fill_rgba"][0, :3])
 
     def get_fill_opacity(self) -> float:
@@ -359,19 +396,19 @@ class VMobject(Mobject):
         If there are multiple opacities, this returns the
         first
         """
-        data = self.data if self.has_points() else self._data_defaults
+        data = self.get_data(transform_points=False) if self.has_points() else self._data_defaults
         return data["fill_rgba"][0, 3]
 
     def get_stroke_color(self) -> str:
-        data = self.data if self.has_points() else self._data_defaults
+        data = self.get_data(transform_points=False) if self.has_points() else self._data_defaults
         return rgb_to_hex(data["stroke_rgba"][0, :3])
 
     def get_stroke_width(self) -> float:
-        data = self.data if self.has_points() else self._data_defaults
+        data = self.get_data(transform_points=False) if self.has_points() else self._data_defaults
         return data["stroke_width"][0, 0]
 
     def get_stroke_opacity(self) -> float:
-        data = self.data if self.has_points() else self._data_defaults
+        data = self.get_data(transform_points=False) if self.has_points() else self._data_defaults
         return data["stroke_rgba"][0, 3]
 
     def get_color(self) -> str:
@@ -383,11 +420,11 @@ class VMobject(Mobject):
         return self.uniforms["anti_alias_width"]
 
     def has_stroke(self) -> bool:
-        data = self.data if len(self.data) > 0 else self._data_defaults
+        data = self.get_data(transform_points=False) if self.has_points() else self._data_defaults
         return any(data['stroke_width']) and any(data['stroke_rgba'][:, 3])
 
     def has_fill(self) -> bool:
-        data = self.data if len(self.data) > 0 else self._data_defaults
+        data = self.get_data(transform_points=False) if self.has_points() else self._data_defaults
         return any(data['fill_rgba'][:, 3])
 
     def get_opacity(self) -> float:
@@ -722,7 +759,7 @@ class VMobject(Mobject):
     def append_vectorized_mobject(self, vmobject: VMobject) -> Self:
         self.add_subpath(vmobject.get_points())
         n = vmobject.get_num_points()
-        self.data[-n:] = vmobject.data
+        self.data[-n:] = vmobject.get_data()
         return self
 
     #
@@ -915,6 +952,12 @@ class VMobject(Mobject):
             mob.refresh_unit_normal()
         return self
 
+    def apply_model_transform(self) -> Self:
+        if self._has_model_transform:
+            super().apply_model_transform()
+            self.refresh_unit_normal()
+        return self
+
     def ensure_positive_orientation(self, recurse=True) -> Self:
         for mob in self.get_family(recurse):
             if mob.get_unit_normal()[2] < 0:
@@ -1010,8 +1053,9 @@ class VMobject(Mobject):
 
     def pointwise_become_partial(self, vmobject: VMobject, a: float, b: float) -> Self:
         assert isinstance(vmobject, VMobject)
-        vm_points = vmobject.get_points()
-        self.data["joint_angle"] = vmobject.data["joint_angle"]
+        vm_data = vmobject.get_data()
+        vm_points = vm_data["point"]
+        self.data["joint_angle"] = vm_data["joint_angle"]
         if a <= 0 and b >= 1:
             self.set_points(vm_points, refresh=False)
             return self
@@ -1079,6 +1123,14 @@ class VMobject(Mobject):
 
         normal_vector = self.get_unit_normal()
 
+        key = hash((points.tobytes(), normal_vector.tobytes()))
+        tri_indices = TRIANGULATION_CACHE.get(key)
+        if tri_indices is None:
+            tri_indices = self.compute_triangulation(points, normal_vector)
+            TRIANGULATION_CACHE.add(key, tri_indices)
+        return tri_indices
+
+    def compute_triangulation(self, points: Vect3Array, normal_vector: Vect3) -> np.ndarray:
         # Rotate points such that unit normal vector is OUT
         if not np.isclose(normal_vector, OUT).all():
             points = np.dot(points, z_to_vector(normal_vector))
@@ -1134,7 +1186,10 @@ class VMobject(Mobject):
             return self.data["joint_angle"][:, 0]
 
         self.needs_new_joint_angles = False
+        # These follow from the points, so while the data sent to shaders
+        # changes, nothing else need count this as a change
         self._data_has_changed = True
+        self._data_version += 1
 
         # Rotate points such that positive z direction is the normal
         points = self.get_points() @ rotation_between_vectors(OUT, self.get_unit_normal())
@@ -1250,6 +1305,9 @@ class VMobject(Mobject):
         about_point: Vect3 | None = None,
         **kwargs
     ) -> Self:
+        if self.can_transform_lazily():
+            # Normals are rotated in the shaders, until the points are
+            return super().rotate(angle, axis, about_point, **kwargs)
         rot_matrix_T = rotation_matrix_transpose(angle, axis)
         self.apply_points_function(
             lambda points: np.dot(points, rot_matrix_T),
@@ -1271,7 +1329,7 @@ class VMobject(Mobject):
     def init_shader_wrapper(self, ctx: Context):
         self.shader_wrapper = VShaderWrapper(
             ctx=ctx,
-            vert_data=self.data,
+            vert_data=self.get_data(transform_points=False),
             mobject_uniforms=self.uniforms,
             code_replacements=self.shader_code_replacements,
             stroke_behind=self.stroke_behind,
@@ -1286,10 +1344,23 @@ class VMobject(Mobject):
         return self
 
     def get_shader_data(self) -> np.ndarray:
-        # Do we want this elsewhere? Say whenever points are refreshed or something?
-        self.get_joint_angles()
-        self.data["base_normal"][0::2] = self.data["point"][0]
-        return super().get_shader_data()
+        # The shaders apply any pending lazy transform, so the points are read
+        # as they are. Joint angles are unaffected by the rotations and uniform
+        # scalings involved, and the base point and normal are transformed along
+        # with the points.
+        has_model_transform = self._has_model_transform
+        self._has_model_transform = False
+        try:
+            # Do we want this elsewhere? Say whenever points are refreshed or something?
+            if self.needs_new_joint_angles:
+                self.get_joint_angles()
+            data = self.get_data()
+            # Only written when it's changed, so as not to unshare the data
+            if len(data) > 0 and (data["base_normal"][0::2] != data["point"][0]).any():
+                self.data["base_normal"][0::2] = data["point"][0]
+            return super().get_shader_data()
+        finally:
+            self._has_model_transform = has_model_transform
 
     def get_shader_vert_indices(self) -> Optional[np.ndarray]:
         return self.get_outer_vert_indices()
@@ -1312,6 +1383,139 @@ class VGroup(Group, VMobject, Generic[SubVmobjectType]):
     def __getitem__(self, index) -> SubVmobjectType:
         return super().__getitem__(index)
 
+    # Instanced rendering
+
+    def use_instanced_rendering(self, use: bool = True) -> Self:
+        """
+        When the submobjects are all copies of the first, as from replicate
+        or get_grid, each only moved, rotated or scaled, and each of a single
+        fill and stroke color, they can be drawn as instances of one shape.
+        The points of that shape are then sent to the gpu just once, along
+        with a small record for each copy, rather than the points of them all.
+
+        Whenever some submobject is not such a copy, e.g. midway through
+        a Transform, the group is rendered as usual.
+        """
+        self.instanced_rendering = use and len(self.submobjects) > 0
+        if self.instanced_rendering:
+            template = self.submobjects[0].copy()
+            template.clear_updaters()
+            template.get_shader_data()
+            self.instance_template = template
+            # Solves for the affine map taking the template's points to others
+            points = template.get_points()
+            self.instance_template_pinv = np.linalg.pinv(
+                np.hstack([points, np.ones((len(points), 1))])
+            )
+        else:
+            self.instance_template = None
+        self.instance_members = []
+        self.instanced_shader_wrapper = None
+        self.note_changed_data()
+        return self
+
+    def get_instance_records(self, vmobjects: list[VMobject]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        For each of the given mobjects, which must have as many points as this
+        group's instance template, finds the affine map taking the template to
+        it, along with its colors. Returns these as instance records, along with
+        an array of whether each mobject is indeed an instance of the template,
+        i.e. matches it in all other data.
+        """
+        template = self.instance_template
+        t_data = template.get_data()
+        data = np.array([vmob.get_data() for vmob in vmobjects])
+        tol = 1e-4
+
+        is_valid = np.ones(len(vmobjects), dtype=bool)
+        for key in ["stroke_width", "joint_angle", "fill_border_width"]:
+            is_valid &= np.isclose(data[key], t_data[key], atol=tol).all((1, 2))
+        normals = data["base_normal"][:, 1::2]
+        is_valid &= np.isclose(normals, t_data["base_normal"][1::2], atol=tol).all((1, 2))
+        for key in ["fill_rgba", "stroke_rgba"]:
+            is_valid &= (data[key] == data[key][:, :1]).all((1, 2))
+
+        points = data["point"]
+        coefs = np.einsum("ij,kjl->kil", self.instance_template_pinv, points)
+        matrices = coefs[:, :3].transpose(0, 2, 1)
+        shifts = coefs[:, 3]
+        mapped_points = np.einsum("ij,klj->kil", template.get_points(), matrices) + shifts[:, None, :]
+        is_valid &= np.isclose(mapped_points, points, atol=tol).all((1, 2))
+
+        records = np.zeros(len(vmobjects), dtype=InstancedVShaderWrapper.instance_dtype)
+        # Column major
+        records["instance_matrix"] = matrices.transpose(0, 2, 1)
+        records["instance_shift"] = shifts
+        records["instance_fill_rgba"] = data["fill_rgba"][:, 0]
+        records["instance_stroke_rgba"] = data["stroke_rgba"][:, 0]
+        return records, is_valid
+
+    def get_instance_data(self, ctx: Context) -> np.ndarray | None:
+        """
+        Array of records for each submobject, as read by InstancedVShaderWrapper,
+        or None if they are not all instances of the template. Only those which
+        have changed since the last call are checked again.
+        """
+        members = self.submobjects
+        if members != self.instance_members:
+            self.instance_members = list(members)
+            # Family versions of each
+            self.instance_versions = np.full(len(members), -1)
+            self.instance_validity = np.zeros(len(members), dtype=bool)
+            self.instance_data = np.zeros(len(members), dtype=InstancedVShaderWrapper.instance_dtype)
+
+        n_points = self.instance_template.get_num_points()
+        changed = []
+        for index, mob in enumerate(members):
+            if mob._family_version == self.instance_versions[index]:
+                continue
+            if not isinstance(mob, VMobject) or mob.submobjects or mob.get_num_points() != n_points:
+                self.instance_validity[index] = False
+            else:
+                # Instances are compared by their points as drawn, and with
+                # joint angles and normals refreshed
+                mob.apply_model_transform()
+                mob.get_shader_data()
+                changed.append(index)
+            # Versions are read after the data, as fetching it may update them
+            self.instance_versions[index] = mob._family_version
+
+        if changed:
+            records, is_valid = self.get_instance_records([members[i] for i in changed])
+            self.instance_data[changed] = records
+            self.instance_validity[changed] = is_valid
+
+        if not self.instance_validity.all():
+            return None
+        # Each must also be rendered with the same shaders and uniforms
+        wrapper_id = members[0].get_shader_wrapper(ctx).get_id()
+        if any(mob.get_shader_wrapper(ctx).get_id() != wrapper_id for mob in members[1:]):
+            return None
+        return self.instance_data
+
+    def get_instanced_shader_wrapper(self, ctx: Context) -> InstancedVShaderWrapper | None:
+        instance_data = self.get_instance_data(ctx)
+        if instance_data is None:
+            return None
+        first = self.submobjects[0]
+        wrapper = self.instanced_shader_wrapper
+        if wrapper is None or wrapper.mobject_uniforms is not first.uniforms \
+                or self.instanced_source_id != first.get_shader_wrapper(ctx).get_id():
+            wrapper = InstancedVShaderWrapper(
+                ctx=ctx,
+                vert_data=self.instance_template.get_data(),
+                mobject_uniforms=first.uniforms,
+                code_replacements=first.shader_code_replacements,
+                stroke_behind=first.stroke_behind,
+                depth_test=first.depth_test,
+            )
+            self.instanced_shader_wrapper = wrapper
+            # Id of the shader wrapper of each instance, as drawn without instancing
+            self.instanced_source_id = first.get_shader_wrapper(ctx).get_id()
+        wrapper.read_in_mobjects([self.instance_template])
+        wrapper.read_in_instances(instance_data)
+        return wrapper
+
 
 class VectorizedPoint(Point, VMobject):
     def __init__(
@@ -35,6 +35,7 @@ class ValueTracker(Mobject):
         )
 
     def get_value(self) -> float | complex | np.ndarray:
+        self.note_read()
         result = self.uniforms["value"]
         if len(result) == 1:
             return result[0]
@@ -42,6 +43,7 @@ class ValueTracker(Mobject):
 
     def set_value(self, value: float | complex | np.ndarray) -> Self:
         self.uniforms["value"][:] = value
+        self.note_changed_uniforms()
         return self
 
     def increment_value(self, d_value: float | complex) -> None:
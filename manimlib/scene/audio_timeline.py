@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import numpy as np
+from pydub import AudioSegment
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Optional
+
+
+def db_to_amplitude(db: float) -> float:
+    return 10 ** (db / 20)
+
+
+class AudioTimeline(object):
+    """
+    Sounds added to a scene, kept as a list of events, each a segment
+    of audio with the time at which it starts, until the whole track is
+    mixed at once when the movie is finished.
+
+    Overlaying each sound onto the track so far as it's added, as pydub
+    does, copies that whole track every time, which is quadratic in the
+    number of sounds. Here each distinct sound file is decoded once, and
+    mixing writes every event into a single preallocated buffer.
+    """
+    def __init__(self):
+        # Each as (time, segment, gain, gain_to_background)
+        self.events: list[tuple[float, AudioSegment, Optional[float], Optional[float]]] = []
+        self.file_segments: dict[str, AudioSegment] = dict()
+
+    def is_empty(self) -> bool:
+        return len(self.events) == 0
+
+    def load_file(self, file_path: str) -> AudioSegment:
+        if file_path not in self.file_segments:
+            self.file_segments[file_path] = AudioSegment.from_file(file_path)
+        return self.file_segments[file_path]
+
+    def add_segment(
+        self,
+        segment: AudioSegment,
+        time: float,
+        gain: float | None = None,
+        gain_to_background: float | None = None
+    ) -> None:
+        """
+        Adds the segment to start at the given time, in seconds. If gain is
+        passed in, the segment's volume is changed by that many decibels. If
+        gain_to_background is, the volume of all sounds added before this
+        one is changed by that many decibels for as long as it plays.
+        """
+        if time < 0:
+            raise Exception("Adding sound at timestamp < 0")
+        self.events.append((time, segment, gain, gain_to_background))
+
+    def add_file(
+        self,
+        file_path: str,
+        time: float,
+        gain: float | None = None,
+        gain_to_background: float | None = None
+    ) -> None:
+        self.add_segment(self.load_file(file_path), time, gain, gain_to_background)
+
+    def get_duration(self) -> float:
+        return max(
+            (time + segment.duration_seconds for time, segment, _, _ in self.events),
+            default=0,
+        )
+
+    def get_format(self) -> tuple[int, int]:
+        """
+        Sample rate and number of channels of the mix, which are the
+        largest among the segments added, so that nothing is lost
+        """
+        segments = [segment for _, segment, _, _ in self.events]
+        return (
+            max(segment.frame_rate for segment in segments),
+            max(segment.channels for segment in segments),
+        )
+
+    @staticmethod
+    def get_samples(segment: AudioSegment, frame_rate: int, n_channels: int) -> np.ndarray:
+        """
+        Samples of the segment at the given sample rate and number of channels,
+        as floats between -1 and 1, in an array of shape (n_samples, n_channels)
+        """
+        if segment.frame_rate != frame_rate:
+            segment = segment.set_frame_rate(frame_rate)
+        if segment.channels != n_channels:
+            segment = segment.set_channels(n_channels)
+        # pydub keeps samples signed, 8-bit ones included
+        samples = np.array(segment.get_array_of_samples(), dtype=np.float32)
+        samples /= 2**(8 * segment.sample_width - 1)
+        return samples.reshape(-1, n_channels)
+
+    def mix(self) -> tuple[np.ndarray, int]:
+        """
+        Returns all sounds mixed into one array of samples, with shape
+        (n_samples, n_channels), along with its sample rate
+        """
+        frame_rate, n_channels = self.get_format()
+        # Decode each distinct segment only once
+        samples_by_id: dict[int, np.ndarray] = dict()
+        for _, segment, _, _ in self.events:
+            if id(segment) not in samples_by_id:
+                samples_by_id[id(segment)] = self.get_samples(segment, frame_rate, n_channels)
+
+        starts = [int(time * frame_rate) for time, _, _, _ in self.events]
+        length = max(
+            start + len(samples_by_id[id(event[1])])
+            for start, event in zip(starts, self.events)
+        )
+        track = np.zeros((length, n_channels), dtype=np.float32)
+        for start, (time, segment, gain, gain_to_background) in zip(starts, self.events):
+            samples = samples_by_id[id(segment)]
+            section = track[start:start + len(samples)]
+            if gain_to_background:
+                section *= db_to_amplitude(gain_to_background)
+            if gain:
+                section += db_to_amplitude(gain) * samples
+            else:
+                section += samples
+        np.clip(track, -1, 1, out=track)
+        return track, frame_rate
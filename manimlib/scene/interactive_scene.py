@@ -171,7 +171,7 @@ class InteractiveScene(Scene):
             index = min((
                 i for i, mob in enumerate(self.mobjects)
                 for sm in self.selection
-                if sm in mob.get_family()
+                if mob.has_family_member(sm)
             ))
             self.mobjects.remove(highlight)
             self.mobjects.insert(index - 1, highlight)
@@ -275,7 +275,7 @@ class InteractiveScene(Scene):
             self.selection.set_submobjects([
                 mob
                 for mob in self.mobjects
-                if any(sm in mob.get_family() for sm in curr)
+                if any(mob.has_family_member(sm) for sm in curr)
             ])
             self.selection.refresh_bounding_box(recurse_down=True)
         else:
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import numpy as np
+
+from manimlib.mobject.types.dot_cloud import DotCloud
+from manimlib.mobject.types.vectorized_mobject import VMobject
+from manimlib.utils.iterables import batch_by_property
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Callable, Hashable
+    from manimlib.mobject.mobject import Mobject
+
+    # Indices of the mobjects drawn earlier than their place in the
+    # list would have them, and of those they were moved in front of
+    Reordering = tuple[np.ndarray, np.ndarray]
+
+
+# Tolerance for considering a mobject to lie in the xy-plane
+FLATNESS_TOLERANCE = 1e-3
+# Stroke widths are in hundredths of a unit, as in the stroke shader
+STROKE_WIDTH_CONVERSION = 0.01
+
+
+def get_padding(mobject: Mobject, frame_scale: float) -> float:
+    """
+    How far beyond its points the mobject may be drawn, in scene units,
+    given the widest of its strokes and the largest of its dots, when
+    the camera frame has the given scale
+    """
+    padding = 0.0
+    for mob in mobject.get_family():
+        if not mob.has_points():
+            continue
+        if isinstance(mob, VMobject):
+            # Read without applying any lazy transform, which strokes don't depend on
+            stroke_widths = mob.get_data(transform_points=False)["stroke_width"]
+            width = STROKE_WIDTH_CONVERSION * stroke_widths.max()
+            if not mob.uniforms["scale_stroke_with_zoom"]:
+                width *= frame_scale
+            padding = max(padding, width)
+        elif isinstance(mob, DotCloud):
+            padding = max(padding, mob.get_radius())
+    return padding
+
+
+def is_reorderable(mobject: Mobject, padding: float = 0.0) -> bool:
+    """
+    Whether the mobject may be drawn out of order relative to those it doesn't
+    overlap. This is only judged for mobjects lying flat in the xy-plane, and
+    not fixed in frame, since for those, not overlapping on screen follows from
+    not overlapping in the plane, however the camera is oriented. Bounding
+    boxes may stick out of the plane by the padding, as those of dots do.
+    """
+    if mobject.is_fixed_in_frame() or mobject.depth_test:
+        return False
+    bb = mobject.get_bounding_box()
+    tolerance = FLATNESS_TOLERANCE + padding
+    return bool(abs(bb[0, 2]) < tolerance and abs(bb[2, 2]) < tolerance)
+
+
+def get_xy_bounds(mobjects: list[Mobject], paddings: np.ndarray) -> np.ndarray:
+    """
+    Array of shape (len(mobjects), 2, 2) of the lower left and upper right
+    corners of each mobject's bounding box, padded by the given amounts
+    """
+    bounds = np.array([
+        mob.get_bounding_box()[0::2, :2] for mob in mobjects
+    ]).reshape(-1, 2, 2)
+    bounds[:, 0] -= paddings[:, np.newaxis]
+    bounds[:, 1] += paddings[:, np.newaxis]
+    return bounds
+
+
+def get_reorderability_and_bounds(mobjects: list[Mobject], frame_scale: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Whether each mobject is reorderable, and its bounds, padded
+    to contain its strokes and dots
+    """
+    paddings = np.array([get_padding(mob, frame_scale) for mob in mobjects])
+    reorderable = np.array(list(map(is_reorderable, mobjects, paddings)), dtype=bool)
+    return reorderable, get_xy_bounds(mobjects, paddings)
+
+
+def are_disjoint(bounds: np.ndarray, other_bounds: np.ndarray, buff: float) -> bool:
+    """
+    Whether the box containing all of one array of boxes, each given as
+    lower left and upper right corners, stays at least buff away from
+    each of another array of boxes
+    """
+    lower = bounds[:, 0].min(0)
+    upper = bounds[:, 1].max(0)
+    return bool(np.all(
+        (other_bounds[:, 0] > upper + buff).any(1) |
+        (other_bounds[:, 1] < lower - buff).any(1)
+    ))
+
+
+def batch_for_rendering(
+    mobjects: list[Mobject],
+    batch_key: Callable[[Mobject], Hashable],
+    merge_key: Callable[[Mobject], Hashable],
+    buff: float,
+    frame_scale: float = 1.0,
+    allow_reordering: bool = True,
+) -> tuple[list[list[Mobject]], list[Reordering]]:
+    """
+    Splits mobjects into batches, each to be rendered as a single group.
+
+    First, adjacent mobjects with the same batch_key are batched together.
+    Then, unless allow_reordering is False, each batch is merged into an
+    earlier one with the same merge_key, so long as it doesn't overlap that
+    batch, nor any drawn between the two, judged by their bounds padded to
+    contain their strokes and dots, plus buff. Drawing it earlier then makes no
+    difference to the image, but means fewer draw calls.
+
+    Since mobjects move, each such reordering is returned along with the
+    batches, to be checked with reorderings_are_valid on later frames.
+    """
+    indices = list(range(len(mobjects)))
+    index_batches = [
+        batch for batch, key in
+        batch_by_property(indices, lambda i: batch_key(mobjects[i]))
+    ]
+    if not allow_reordering:
+        return [[mobjects[i] for i in batch] for batch in index_batches], []
+
+    reorderable, bounds = get_reorderability_and_bounds(mobjects, frame_scale)
+
+    groups: list[list[int]] = []
+    group_keys: list[Hashable] = []
+    reorderings: list[Reordering] = []
+
+    for batch in index_batches:
+        key = merge_key(mobjects[batch[0]])
+        target = None
+        if reorderable[batch].all():
+            for group_index in range(len(groups) - 1, -1, -1):
+                group = groups[group_index]
+                if not reorderable[group].all():
+                    break
+                if not are_disjoint(bounds[batch], bounds[group], buff):
+                    break
+                if group_keys[group_index] == key:
+                    target = group_index
+                    break
+
+        if target is None:
+            groups.append(batch)
+            group_keys.append(key)
+        else:
+            passed = [i for group in groups[target:] for i in group]
+            reorderings.append((np.array(batch), np.array(passed)))
+            groups[target] = [*groups[target], *batch]
+
+    return [[mobjects[i] for i in group] for group in groups], reorderings
+
+
+def reorderings_are_valid(
+    mobjects: list[Mobject],
+    reorderings: list[Reordering],
+    buff: float,
+    frame_scale: float = 1.0,
+) -> bool:
+    """
+    Whether each reordering returned by batch_for_rendering for this list
+    of mobjects still leaves the image unchanged, given where they are now
+    """
+    if not reorderings:
+        return True
+    reorderable, bounds = get_reorderability_and_bounds(mobjects, frame_scale)
+    return all(
+        reorderable[moved].all() and reorderable[passed].all()
+        and are_disjoint(bounds[moved], bounds[passed], buff)
+        for moved, passed in reorderings
+    )
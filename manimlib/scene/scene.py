@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections import OrderedDict
+import itertools as it
 import platform
 import random
 import time
@@ -28,11 +29,19 @@ from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.scene.scene_embed import InteractiveSceneEmbed
 from manimlib.scene.scene_embed import CheckpointManager
+from manimlib.scene.scene_checkpoints import MobjectRegistry
+from manimlib.scene.scene_checkpoints import SceneCheckpointStore
+from manimlib.scene.scene_frame_counts import save_play_frame_counts
+from manimlib.scene.render_groups import batch_for_rendering
+from manimlib.scene.render_groups import reorderings_are_valid
 from manimlib.scene.scene_file_writer import SceneFileWriter
+from manimlib.scene.updater_schedule import UpdaterSchedule
 from manimlib.utils.dict_ops import merge_dicts_recursively
 from manimlib.utils.family_ops import extract_mobject_family_members
 from manimlib.utils.family_ops import recursive_mobject_remove
-from manimlib.utils.iterables import batch_by_property
+from manimlib.utils.hashing import hash_objects
+from manimlib.utils.profiling import PROFILER
+from manimlib.utils.profiling import profile
 from manimlib.window import Window
 
 from typing import TYPE_CHECKING
@@ -46,6 +55,7 @@ if TYPE_CHECKING:
     from PIL.Image import Image
 
     from manimlib.animation.animation import Animation
+    from manimlib.scene.render_groups import Reordering
 
 
 class Scene(object):
@@ -74,7 +84,16 @@ class Scene(object):
         preview_while_skipping: bool = True,
         presenter_mode: bool = False,
         default_wait_time: float = 1.0,
+        use_disk_checkpoints: bool = False,
+        elide_static_frames: bool = True,
+        reorder_render_groups: bool = True,
+        reactive_updaters: bool = False,
     ):
+        # Mobjects created by the scene from here on are recorded in the
+        # checkpoint store, which is how it finds them
+        self.checkpoint_store = SceneCheckpointStore(self) if use_disk_checkpoints else None
+        if self.checkpoint_store is not None:
+            self.checkpoint_store.registry.start_recording()
         self.skip_animations = skip_animations
         self.always_update_mobjects = always_update_mobjects
         self.start_at_animation_number = start_at_animation_number
@@ -84,6 +103,8 @@ class Scene(object):
         self.preview_while_skipping = preview_while_skipping
         self.presenter_mode = presenter_mode
         self.default_wait_time = default_wait_time
+        self.elide_static_frames = elide_static_frames
+        self.reorder_render_groups = reorder_render_groups
 
         self.camera_config = merge_dicts_recursively(
             manim_config.camera,         # Global default
@@ -115,7 +136,10 @@ class Scene(object):
         self.file_writer = SceneFileWriter(self, **self.file_writer_config)
         self.mobjects: list[Mobject] = [self.camera.frame]
         self.render_groups: list[Mobject] = []
+        self.render_group_reorderings: list[Reordering] = []
+        self.render_group_versions: list[int] = []
         self.id_to_mobject_map: dict[int, Mobject] = dict()
+        self.updater_schedule = UpdaterSchedule(reactive=reactive_updaters)
         self.num_plays: int = 0
         self.time: float = 0
         self.skip_time: float = 0
@@ -123,6 +147,14 @@ class Scene(object):
         self.undo_stack = []
         self.redo_stack = []
 
+        self.resume_state: dict | None = None
+        # Number of frames written by each play, where plays before
+        # start_at_animation_number count as writing none
+        self.play_frame_counts: list[int] = []
+        self.num_play_frames: int = 0
+        # Whether add_sound has been called, even if while skipping animations
+        self.adds_sound: bool = False
+
         if self.start_at_animation_number is not None:
             self.skip_animations = True
         if self.file_writer.has_progress_display():
@@ -139,6 +171,9 @@ class Scene(object):
             random.seed(self.random_seed)
             np.random.seed(self.random_seed)
 
+        if self.checkpoint_store is not None:
+            self.checkpoint_store.registry.stop_recording()
+
     def __str__(self) -> str:
         return self.__class__.__name__
 
@@ -146,21 +181,44 @@ class Scene(object):
         return self.window
 
     def run(self) -> None:
-        self.virtual_animation_start_time: float = 0
-        self.real_animation_start_time: float = time.time()
-        self.file_writer.begin()
+        with self.record_created_mobjects():
+            self.virtual_animation_start_time: float = 0
+            self.real_animation_start_time: float = time.time()
+            self.file_writer.begin()
+            self.load_resume_checkpoint()
+
+            self.setup()
+            try:
+                self.construct()
+                self.interact()
+            except EndScene:
+                pass
+            except KeyboardInterrupt:
+                # Get rid keyboard interupt symbols
+                print("", end="\r")
+                self.file_writer.ended_with_interrupt = True
+            self.tear_down()
+        if self.file_writer.has_progress_display() and not self.file_writer.ended_with_interrupt:
+            # Read by the next render of this scene to size its progress
+            # display without a prerun
+            save_play_frame_counts(self)
+
+    def record_created_mobjects(self) -> ExitStack:
+        # Mobjects created while the scene runs are recorded
+        # for its checkpoints, if it saves any
+        stack = ExitStack()
+        if self.checkpoint_store is not None:
+            stack.enter_context(self.checkpoint_store.registry.recording())
+        return stack
 
-        self.setup()
-        try:
-            self.construct()
-            self.interact()
-        except EndScene:
-            pass
-        except KeyboardInterrupt:
-            # Get rid keyboard interupt symbols
-            print("", end="\r")
-            self.file_writer.ended_with_interrupt = True
-        self.tear_down()
+    def load_resume_checkpoint(self) -> None:
+        if self.checkpoint_store is None or self.start_at_animation_number is None:
+            return
+        num_plays = self.checkpoint_store.find_nearest_checkpoint(self.start_at_animation_number)
+        if num_plays is None:
+            return
+        log.info(f"Resuming {self} from the checkpoint after play {num_plays}")
+        self.resume_state = self.checkpoint_store.load(num_plays)
 
     def setup(self) -> None:
         """
@@ -178,6 +236,7 @@ class Scene(object):
     def tear_down(self) -> None:
         self.stop_skipping()
         self.file_writer.finish()
+        self.camera.release()
         if self.window:
             self.window.destroy()
             self.window = None
@@ -222,6 +281,7 @@ class Scene(object):
     def get_image(self) -> Image:
         if self.window is not None:
             self.camera.use_window_fbo(False)
+            self.refresh_render_groups()
             self.camera.capture(*self.render_groups)
         image = self.camera.get_image()
         if self.window is not None:
@@ -238,6 +298,12 @@ class Scene(object):
         if self.skip_animations and not force_draw:
             return
 
+        if self.file_writer.is_reusing_partial_movie() and not force_draw:
+            # Frames for this segment were already written on a previous
+            # run, but mobjects are still updated frame by frame above so
+            # that the state of the scene exactly matches that run
+            return
+
         if self.is_window_closing():
             raise EndScene()
 
@@ -247,6 +313,7 @@ class Scene(object):
             self.window._window.dispatch_events()
             return
 
+        self.refresh_render_groups()
         self.camera.capture(*self.render_groups)
 
         if self.window and not self.skip_animations:
@@ -260,9 +327,10 @@ class Scene(object):
 
     # Related to updating
 
+    @profile()
     def update_mobjects(self, dt: float) -> None:
-        for mobject in self.mobjects:
-            mobject.update(dt)
+        # Equivalent to calling update on each mobject, see UpdaterSchedule
+        self.updater_schedule.update(self.mobjects, dt)
 
     def should_update_mobjects(self) -> bool:
         return self.always_update_mobjects or any(
@@ -283,15 +351,8 @@ class Scene(object):
         # Return only those which are not in the family
         # of another mobject from the scene
         mobjects = self.get_mobjects()
-        families = [m.get_family() for m in mobjects]
-
-        def is_top_level(mobject):
-            num_families = sum([
-                (mobject in family)
-                for family in families
-            ])
-            return num_families == 1
-        return list(filter(is_top_level, mobjects))
+        descendants = set(it.chain(*(m.get_family()[1:] for m in mobjects)))
+        return [m for m in mobjects if m not in descendants]
 
     def get_mobject_family_members(self) -> list[Mobject]:
         return extract_mobject_family_members(self.mobjects)
@@ -300,19 +361,62 @@ class Scene(object):
         """
         Rendering can be more efficient when mobjects of the
         same type are grouped together, so this function creates
-        Groups of all clusters of adjacent Mobjects in the scene
+        Groups of all clusters of adjacent Mobjects in the scene.
+
+        Unless reorder_render_groups is False, a cluster is also merged
+        into an earlier one using the same shader, when it overlaps neither
+        that cluster, nor anything drawn between them.
         """
-        batches = batch_by_property(
+        ctx = self.camera.ctx
+        batches, self.render_group_reorderings = batch_for_rendering(
             self.mobjects,
-            lambda m: str(type(m)) + str(m.get_shader_wrapper(self.camera.ctx).get_id()) + str(m.z_index)
+            batch_key=lambda m: str(type(m)) + str(m.get_shader_wrapper(ctx).get_id()) + str(m.z_index),
+            merge_key=lambda m: (m.get_group_class(), m.get_shader_wrapper(ctx).get_id(), m.z_index),
+            buff=self.get_render_group_buff(),
+            frame_scale=self.frame.get_scale(),
+            allow_reordering=self.reorder_render_groups,
         )
+        self.render_group_versions = self.get_render_group_versions()
 
         for group in self.render_groups:
             group.clear()
-        self.render_groups = [
-            batch[0].get_group_class()(*batch)
-            for batch, key in batches
-        ]
+        # Render groups are internal to the scene, rather than anything scene
+        # code refers to, and how many there are depends on the (varying)
+        # state of the mobject list, so they're left out of checkpoints
+        with MobjectRegistry.paused():
+            self.render_groups = [
+                batch[0].get_group_class()(*batch)
+                for batch in batches
+            ]
+
+    def get_render_group_buff(self) -> float:
+        # Mobjects drawn out of order are kept at least this far apart,
+        # beyond their strokes and dots, which leaves room for antialiasing
+        return 0.01 * self.frame.get_height()
+
+    def get_render_group_versions(self) -> list[int]:
+        # The frame is included since zooming it changes how wide strokes are
+        return [mob._family_version for mob in [*self.mobjects, self.frame]]
+
+    def refresh_render_groups(self) -> None:
+        """
+        If any mobjects drawn out of order by assemble_render_groups have
+        since moved into something they were drawn in front of, or behind,
+        reassembles the groups.
+        """
+        if not self.render_group_reorderings:
+            return
+        versions = self.get_render_group_versions()
+        if versions == self.render_group_versions:
+            return
+        self.render_group_versions = versions
+        if not reorderings_are_valid(
+            self.mobjects,
+            self.render_group_reorderings,
+            self.get_render_group_buff(),
+            self.frame.get_scale(),
+        ):
+            self.assemble_render_groups()
 
     @staticmethod
     def affects_mobject_list(func: Callable[..., T]) -> Callable[..., T]:
@@ -465,11 +569,14 @@ class Scene(object):
         desc: str = "",
         override_skip_animations: bool = False
     ) -> list[float] | np.ndarray | ProgressDisplay:
+        times = np.arange(0, run_time, 1 / self.camera.fps) + 1 / self.camera.fps
+        # Count frames even when skipping, so that a skipped run can
+        # tell how many a real one would write
+        self.num_play_frames = len(times)
+
         if self.skip_animations and not override_skip_animations:
             return [run_time]
 
-        times = np.arange(0, run_time, 1 / self.camera.fps) + 1 / self.camera.fps
-
         self.file_writer.set_progress_display_description(sub_desc=desc)
 
         if self.show_animation_progress:
@@ -510,14 +617,48 @@ class Scene(object):
             kw["override_skip_animations"] = True
         return self.get_time_progression(duration, **kw)
 
-    def pre_play(self):
+    def get_segment_hash(self, *segment_description) -> str | None:
+        """
+        Hash of everything that determines what the upcoming play or wait
+        call will render, namely the current state of the scene, the
+        description passed in (e.g. the animations) and the camera and
+        output configuration. Returns None if nothing was described, or
+        if any of it can't be hashed, in which case it's always rendered.
+        """
+        if not segment_description:
+            return None
+        camera = self.camera
+        return hash_objects(
+            camera.get_pixel_shape(),
+            camera.fps,
+            camera.background_rgba,
+            camera.samples,
+            camera.get_fill_supersampling(),
+            self.file_writer.video_codec,
+            self.file_writer.pixel_format,
+            self.file_writer.saturation,
+            self.file_writer.gamma,
+            # Frame count, rather than time, to be robust to rounding
+            round(self.time * camera.fps),
+            self.mobjects,
+            *segment_description,
+        )
+
+    def pre_play(self, *segment_description):
         if self.presenter_mode and self.num_plays == 0:
             self.hold_loop()
 
+        if self.checkpoint_store is not None:
+            self.checkpoint_store.begin_play()
+        self.num_play_frames = 0
+
         self.update_skipping_status()
 
         if not self.skip_animations:
-            self.file_writer.begin_animation()
+            segment_hash = None
+            if self.file_writer.caches_partial_movies():
+                segment_hash = self.get_segment_hash(*segment_description)
+            self.file_writer.begin_animation(segment_hash)
 
         if self.window:
             self.virtual_animation_start_time = self.time
@@ -531,7 +672,32 @@ class Scene(object):
             # Show some quick frames along the way
             self.update_frame(dt=0, force_draw=True)
 
+        if self.num_plays < (self.start_at_animation_number or 0):
+            self.num_play_frames = 0
+        self.play_frame_counts.append(self.num_play_frames)
+
+        self.num_plays += 1
+        self.file_writer.update_expected_total_frames(self.num_plays)
+        if self.checkpoint_store is not None:
+            self.checkpoint_store.end_play()
+
+    def fast_forward_play(self) -> None:
+        """
+        Stands in for each play (or wait) call before the checkpoint being
+        resumed from, only keeping count of the mobjects it would have created,
+        and restores the checkpoint once the last of them is reached.
+        """
+        state = self.resume_state
+        if not self.checkpoint_store.skip_play(state, self.num_plays):
+            log.warning(
+                f"{self} created different mobjects than when its checkpoint was "
+                "saved, it may be that its construct method is not deterministic"
+            )
+        self.play_frame_counts.append(0)
         self.num_plays += 1
+        if self.num_plays == state["num_plays"]:
+            self.checkpoint_store.restore(state)
+            self.resume_state = None
 
     def begin_animations(self, animations: Iterable[Animation]) -> None:
         all_mobjects = set(self.get_mobject_family_members())
@@ -549,14 +715,16 @@ class Scene(object):
     def progress_through_animations(self, animations: Iterable[Animation]) -> None:
         last_t = 0
         for t in self.get_animation_time_progression(animations):
-            dt = t - last_t
-            last_t = t
-            for animation in animations:
-                animation.update_mobjects(dt)
-                alpha = t / animation.run_time
-                animation.interpolate(alpha)
-            self.update_frame(dt)
-            self.emit_frame()
+            with PROFILER.section("frame", "frame"):
+                dt = t - last_t
+                last_t = t
+                for animation in animations:
+                    with PROFILER.section(type(animation).__name__, "animation"):
+                        animation.update_mobjects(dt)
+                        alpha = t / animation.run_time
+                        animation.interpolate(alpha)
+                self.update_frame(dt)
+                self.emit_frame()
 
     def finish_animations(self, animations: Iterable[Animation]) -> None:
         for animation in animations:
@@ -581,11 +749,15 @@ class Scene(object):
         animations = list(map(prepare_animation, proto_animations))
         for anim in animations:
             anim.update_rate_info(run_time, rate_func, lag_ratio)
-        self.pre_play()
-        self.begin_animations(animations)
-        self.progress_through_animations(animations)
-        self.finish_animations(animations)
-        self.post_play()
+        if self.resume_state is not None:
+            self.fast_forward_play()
+            return
+        with PROFILER.section(lambda: f"{self.num_plays} {animations[0]}", "play"):
+            self.pre_play(*animations)
+            self.begin_animations(animations)
+            self.progress_through_animations(animations)
+            self.finish_animations(animations)
+            self.post_play()
 
     def wait(
         self,
@@ -596,23 +768,58 @@ class Scene(object):
     ):
         if duration is None:
             duration = self.default_wait_time
-        self.pre_play()
-        self.update_mobjects(dt=0)  # Any problems with this?
-        if self.presenter_mode and not self.skip_animations and not ignore_presenter_mode:
-            if note:
-                log.info(note)
-            self.hold_loop()
-        else:
-            time_progression = self.get_wait_time_progression(duration, stop_condition)
-            last_t = 0
-            for t in time_progression:
-                dt = t - last_t
-                last_t = t
-                self.update_frame(dt)
-                self.emit_frame()
-                if stop_condition is not None and stop_condition():
-                    break
-        self.post_play()
+        if self.resume_state is not None:
+            self.fast_forward_play()
+            return
+        with PROFILER.section(lambda: f"{self.num_plays} Waiting", "play"):
+            if stop_condition is None:
+                self.pre_play("wait", duration)
+            else:
+                # Segments ending on an arbitrary condition can't be reused
+                self.pre_play()
+            self.update_mobjects(dt=0)  # Any problems with this?
+            if self.presenter_mode and not self.skip_animations and not ignore_presenter_mode:
+                if note:
+                    log.info(note)
+                self.hold_loop()
+            elif stop_condition is None and self.has_static_frames():
+                self.emit_static_frames(self.get_wait_time_progression(duration))
+            else:
+                time_progression = self.get_wait_time_progression(duration, stop_condition)
+                last_t = 0
+                for t in time_progression:
+                    with PROFILER.section("frame", "frame"):
+                        dt = t - last_t
+                        last_t = t
+                        self.update_frame(dt)
+                        self.emit_frame()
+                    if stop_condition is not None and stop_condition():
+                        break
+            self.post_play()
+
+    def has_static_frames(self) -> bool:
+        """
+        Whether every frame will look the same until something is next
+        animated, which is the case when no mobjects have updaters
+        """
+        return all((
+            self.elide_static_frames,
+            self.window is None,
+            not self.should_update_mobjects(),
+        ))
+
+    def emit_static_frames(self, time_progression: Iterable[float]) -> None:
+        """
+        Renders only the first frame of the time progression, and writes
+        it once for each frame, rather than rendering each one anew
+        """
+        times = list(time_progression)
+        if len(times) == 0:
+            return
+        self.update_frame(times[0])
+        self.increment_time(times[-1] - times[0])
+        if not self.skip_animations:
+            self.file_writer.write_repeated_frame(self.camera, len(times))
 
     def hold_loop(self):
         while self.hold_on_wait:
@@ -643,6 +850,7 @@ class Scene(object):
         gain: float | None = None,
         gain_to_background: float | None = None
     ):
+        self.adds_sound = True
         if self.skip_animations:
             return
         time = self.get_time() + time_offset
@@ -877,14 +1085,17 @@ class SceneState():
             for mob in ignore:
                 self.mobjects_to_copies.pop(mob, None)
 
-        last_m2c = scene.undo_stack[-1].mobjects_to_copies if scene.undo_stack else dict()
+        # Family version of each mobject as it was copied
+        self.versions: dict[Mobject, int] = dict()
+        last_state = scene.undo_stack[-1] if scene.undo_stack else None
         for mob in self.mobjects_to_copies:
             # If it hasn't changed since the last state, just point to the
-            # same copy as before
-            if mob in last_m2c and last_m2c[mob].looks_identical(mob):
-                self.mobjects_to_copies[mob] = last_m2c[mob]
+            # same copy as before, which the version tells without comparing
+            if last_state is not None and last_state.versions.get(mob) == mob._family_version:
+                self.mobjects_to_copies[mob] = last_state.mobjects_to_copies[mob]
             else:
                 self.mobjects_to_copies[mob] = mob.copy()
+            self.versions[mob] = mob._family_version
 
     def __eq__(self, state: SceneState):
         return all((
@@ -897,10 +1108,9 @@ class SceneState():
         return self.mobjects_to_copies == state.mobjects_to_copies
 
     def n_changes(self, state: SceneState):
-        m2c = state.mobjects_to_copies
         return sum(
-            1 - int(mob in m2c and mob.looks_identical(m2c[mob]))
-            for mob in self.mobjects_to_copies
+            int(state.versions.get(mob) != version)
+            for mob, version in self.versions.items()
         )
 
     def restore_scene(self, scene: Scene):
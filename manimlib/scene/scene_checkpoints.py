@@ -0,0 +1,419 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+import io
+import os
+import pickle
+import random
+import types
+import weakref
+
+import moderngl
+import numpy as np
+from diskcache import Cache
+
+from manimlib.logger import log
+from manimlib.mobject.mobject import Mobject
+from manimlib.shader_wrapper import ShaderWrapper
+from manimlib.utils.directories import get_cache_dir
+from manimlib.utils.hashing import hash_source_file
+from manimlib.utils.simple_functions import hash_string
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Iterator, Optional
+    from manimlib.scene.scene import Scene
+
+
+CHECKPOINT_CACHE_SIZE = 5e9  # 5 Gig
+# How deep to look into other objects held by mobjects, when checking
+# whether anything in them was left out of a checkpoint
+MAX_RESTORE_DEPTH = 3
+
+
+class MobjectRegistry(object):
+    """
+    Mobjects created while this is recording, each identified by the number
+    recorded before it, which (for deterministic scene code) identifies the
+    same mobject across separate runs of a scene. Only weak references are
+    kept, so this keeps nothing alive.
+    """
+    def __init__(self):
+        self.num_created: int = 0
+        self.mobjects: weakref.WeakValueDictionary[int, Mobject] = weakref.WeakValueDictionary()
+        self.previous_registries: list[Optional[MobjectRegistry]] = []
+
+    def add(self, mobject: Mobject) -> None:
+        self.mobjects[self.num_created] = mobject
+        self.num_created += 1
+
+    def get_live_mobjects(self) -> dict[int, Mobject]:
+        """
+        Those mobjects recorded which have not yet been garbage
+        collected, by their index
+        """
+        return dict(self.mobjects.items())
+
+    def start_recording(self) -> None:
+        self.previous_registries.append(Mobject.creation_registry)
+        Mobject.creation_registry = self
+
+    def stop_recording(self) -> None:
+        Mobject.creation_registry = self.previous_registries.pop()
+
+    @contextmanager
+    def recording(self) -> Iterator[None]:
+        self.start_recording()
+        try:
+            yield
+        finally:
+            self.stop_recording()
+
+    @staticmethod
+    @contextmanager
+    def paused() -> Iterator[None]:
+        """
+        Mobjects created within this, e.g. by the scene for its own use,
+        are left out of whichever registry is recording
+        """
+        registry = Mobject.creation_registry
+        Mobject.creation_registry = None
+        try:
+            yield
+        finally:
+            Mobject.creation_registry = registry
+
+
+class LeftOut(object):
+    """
+    Stands in for a function left out of a checkpoint, so that when restoring,
+    whatever held it can be left as it is. Each function left out gets its
+    own instance, shared by everything referring to that function.
+    """
+    pass
+
+
+class _CheckpointPickler(pickle.Pickler):
+    """
+    Pickles the state of a scene, replacing anything which can't (or
+    shouldn't) be written to disk, like gpu resources or the scene itself,
+    with None, and functions with LeftOut.
+    """
+    def __init__(self, file, scene: Scene):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.scene = scene
+
+    def reducer_override(self, obj: Any):
+        if self.is_local_function(obj) or isinstance(obj, types.MethodType):
+            return (LeftOut, ())
+        if obj is self.scene or isinstance(obj, (
+            types.GeneratorType,
+            ShaderWrapper,
+            moderngl.Context,
+            moderngl.Buffer,
+            moderngl.VertexArray,
+            moderngl.Program,
+            moderngl.Texture,
+            moderngl.Framebuffer,
+        )):
+            return (type(None), ())
+        return NotImplemented
+
+    def is_local_function(self, obj: Any) -> bool:
+        """
+        Whether obj is a function which can't be pickled by reference, either
+        since it's a lambda or closure, or it's defined alongside the scene,
+        whose module may not be importable under the same name later on.
+        Other functions, including those pickle itself uses to reconstruct
+        objects, are left alone.
+        """
+        if not isinstance(obj, types.FunctionType):
+            return False
+        return any((
+            "<locals>" in obj.__qualname__,
+            "<lambda>" in obj.__qualname__,
+            obj.__module__ == type(self.scene).__module__,
+        ))
+
+
+class SceneCheckpointStore(object):
+    """
+    Saves the state of a scene to disk after each of its play (or wait) calls,
+    keyed by the scene's source code and the number of plays so far. When the
+    scene is later run with a start_at_animation_number, it can load the
+    nearest checkpoint rather than replaying every earlier animation.
+
+    Since there is no jumping into the middle of a construct method, the
+    scene code itself is still executed in such a resumed run, but the play
+    calls before the checkpoint do nothing. At the checkpoint, all mobjects
+    are updated to their saved state, which are identified with their
+    counterparts from the original run by Mobject.creation_index.
+
+    The scene records which mobjects it creates in a MobjectRegistry, while
+    it's being initialized and while it runs, which is how they are found.
+    Mobjects which the scene creates for its own use, like render groups,
+    aren't recorded, as how many it creates may vary between runs.
+
+    This assumes the scene's construct method is deterministic. Plain python
+    values computed from mobjects before the checkpoint (e.g. x = dot.get_x())
+    will still be stale after resuming.
+    """
+    def __init__(self, scene: Scene):
+        self.scene = scene
+        self.registry = MobjectRegistry()
+        # Found once the scene's camera exists
+        self.source_hash: str | None = None
+        self.cache = Cache(
+            os.path.join(get_cache_dir(), "scene_checkpoints"),
+            size_limit=CHECKPOINT_CACHE_SIZE,
+        )
+        self.disabled = False
+        # For each play, the range of indices in the registry
+        # of mobjects created during that play
+        self.play_creation_ranges: list[tuple[int, int]] = []
+        self.play_creation_start: int = 0
+
+    def get_source_hash(self) -> str:
+        if self.source_hash is None:
+            self.source_hash = self.compute_source_hash()
+        return self.source_hash
+
+    def compute_source_hash(self) -> str:
+        scene_class = type(self.scene)
+        return hash_string("".join(map(str, [
+            scene_class.__module__,
+            scene_class.__qualname__,
+            hash_source_file(scene_class),
+            self.scene.camera.get_pixel_shape(),
+            self.scene.camera.fps,
+        ])))
+
+    def get_key(self, num_plays: int) -> str:
+        return f"{self.get_source_hash()}_{num_plays:05}"
+
+    def has_checkpoint(self, num_plays: int) -> bool:
+        return self.get_key(num_plays) in self.cache
+
+    def find_nearest_checkpoint(self, num_plays: int) -> int | None:
+        """
+        Returns the largest play count, no more than num_plays,
+        for which a checkpoint was saved
+        """
+        for n in range(num_plays, 0, -1):
+            if self.has_checkpoint(n):
+                return n
+        return None
+
+    def begin_play(self) -> None:
+        self.play_creation_start = self.registry.num_created
+
+    def end_play(self) -> None:
+        self.play_creation_ranges.append(
+            (self.play_creation_start, self.registry.num_created)
+        )
+        self.save()
+
+    def skip_play(self, state: dict, play_index: int) -> bool:
+        """
+        Stands in for a play before the checkpoint being resumed from, counting
+        the mobjects it created when the checkpoint was saved as created.
+        Returns whether the mobjects created before it match those then.
+        """
+        start, end = state["play_creation_ranges"][play_index]
+        matches = self.registry.num_created == start
+        self.registry.num_created = end
+        return matches
+
+    def save(self) -> None:
+        scene = self.scene
+        if self.disabled or self.has_checkpoint(scene.num_plays):
+            return
+
+        def was_created_in_play(index: int) -> bool:
+            return any(start <= index < end for start, end in self.play_creation_ranges)
+
+        created = {
+            index: mob
+            for index, mob in self.registry.get_live_mobjects().items()
+            if not was_created_in_play(index)
+        }
+        state = dict(
+            time=scene.time,
+            num_plays=scene.num_plays,
+            mobjects=scene.mobjects,
+            created=created,
+            play_creation_ranges=list(self.play_creation_ranges),
+            num_created=self.registry.num_created,
+            random_state=random.getstate(),
+            np_random_state=np.random.get_state(),
+        )
+        buff = io.BytesIO()
+        try:
+            _CheckpointPickler(buff, scene).dump(state)
+        except Exception as err:
+            log.warning(f"Unable to save scene checkpoints, {err}")
+            self.disabled = True
+            return
+        self.cache.set(self.get_key(scene.num_plays), buff.getvalue())
+
+    def load(self, num_plays: int) -> dict:
+        return pickle.loads(self.cache[self.get_key(num_plays)])
+
+    def restore(self, state: dict) -> None:
+        """
+        Brings the scene, and all mobjects which the scene code might hold
+        references to, into the state saved in the checkpoint.
+        """
+        scene = self.scene
+        # Everything in the checkpoint, some of which have no live counterpart
+        # (e.g. those created by animations) and are used as they are
+        saved_mobjects = list({
+            id(sm): sm
+            for mob in (*state["mobjects"], *state["created"].values())
+            for sm in mob.get_family()
+        }.values())
+        saved_ids = set(map(id, saved_mobjects))
+        live = {
+            index: mob
+            for index, mob in self.registry.get_live_mobjects().items()
+            if id(mob) not in saved_ids
+        }
+
+        # Map from ids of mobjects in the checkpoint to their live counterparts
+        saved_to_live: dict[int, Mobject] = dict()
+        n_mismatches = 0
+        for index, saved_mob in state["created"].items():
+            live_mob = live.get(index)
+            if live_mob is None:
+                continue
+            if type(live_mob) is not type(saved_mob):
+                n_mismatches += 1
+                continue
+            saved_to_live[id(saved_mob)] = live_mob
+        if n_mismatches > 0:
+            log.warning(
+                f"{n_mismatches} mobjects did not match those in the checkpoint "
+                "for this scene, it may be that its construct method is not deterministic"
+            )
+
+        def resolve(mob: Mobject) -> Mobject:
+            return saved_to_live.get(id(mob), mob)
+
+        for saved_mob in saved_mobjects:
+            live_mob = saved_to_live.get(id(saved_mob))
+            if live_mob is not None:
+                self.restore_mobject(live_mob, saved_mob, resolve)
+            else:
+                # Functions left out, such as updaters, can't be restored
+                saved_mob.updaters = [
+                    updater for updater in saved_mob.updaters
+                    if not isinstance(updater, LeftOut)
+                ]
+                saved_mob.updater_dependencies = dict()
+                saved_mob.set_submobjects([resolve(sm) for sm in saved_mob.submobjects])
+                saved_mob.refresh_has_updater_status()
+                saved_mob.note_changed_data(recurse_up=False)
+
+        scene.mobjects = [resolve(mob) for mob in state["mobjects"]]
+        scene.time = state["time"]
+        scene.num_plays = state["num_plays"]
+        self.play_creation_ranges = list(state["play_creation_ranges"])
+        self.registry.num_created = state["num_created"]
+        random.setstate(state["random_state"])
+        np.random.set_state(state["np_random_state"])
+        scene.assemble_render_groups()
+
+    # Attributes of a mobject which are kept as they are on its live
+    # counterpart, being either bookkeeping, which has to keep counting up,
+    # or restored separately
+    live_attributes = {
+        "creation_index",
+        "_data_version",
+        "_model_version",
+        "_family_version",
+        "_updaters_version",
+        "submobjects",
+        "parents",
+        "family",
+        "family_indices",
+        "_has_updaters_in_family",
+        "_uniforms",
+        "updaters",
+        "updater_dependencies",
+        "shader_wrapper",
+        "shader_wrappers",
+        "instanced_shader_wrapper",
+    }
+
+    @staticmethod
+    def restore_value(value: Any, resolve: Callable[[Mobject], Mobject], depth: int = 0) -> Any:
+        """
+        A value as saved in the checkpoint, with any mobjects in it swapped for
+        their live counterparts, and arrays copied. Returns a LeftOut if any
+        part of it was left out of the checkpoint.
+        """
+        def restore_value(item: Any) -> Any:
+            return SceneCheckpointStore.restore_value(item, resolve, depth + 1)
+
+        if isinstance(value, (LeftOut, str, bytes)):
+            return value
+        if isinstance(value, np.ndarray):
+            return value.copy()
+        if isinstance(value, Mobject):
+            return resolve(value)
+        if isinstance(value, (list, tuple, set, frozenset)):
+            items = [restore_value(item) for item in value]
+            if any(isinstance(item, LeftOut) for item in items):
+                return LeftOut()
+            if type(value) is list:
+                return items
+            if hasattr(type(value), "_make"):
+                # Named tuples take their fields as separate arguments
+                return type(value)._make(items)
+            if isinstance(value, tuple) and type(value) is not tuple:
+                # No telling how other tuple subclasses are constructed
+                return LeftOut()
+            return type(value)(items)
+        if isinstance(value, dict) and type(value) is dict:
+            items = [
+                (restore_value(key), restore_value(item))
+                for key, item in value.items()
+            ]
+            if any(isinstance(part, LeftOut) for item in items for part in item):
+                return LeftOut()
+            return dict(items)
+        if hasattr(value, "__dict__") and depth < MAX_RESTORE_DEPTH:
+            # E.g. an event listener, whose callback was left out
+            if any(isinstance(restore_value(item), LeftOut) for item in vars(value).values()):
+                return LeftOut()
+        return value
+
+    @staticmethod
+    def restore_mobject(live_mob: Mobject, saved_mob: Mobject, resolve: Callable[[Mobject], Mobject]) -> None:
+        store = SceneCheckpointStore
+        for key, value in saved_mob.__dict__.items():
+            if key in store.live_attributes:
+                continue
+            value = store.restore_value(value, resolve)
+            # Anything holding functions left out, e.g. a parametric
+            # function, keeps its live value
+            if not isinstance(value, LeftOut):
+                setattr(live_mob, key, value)
+        live_mob.uniforms = {
+            key: value.copy() if isinstance(value, np.ndarray) else value
+            for key, value in saved_mob.uniforms.items()
+        }
+        # Updaters stay as they are on the live mobject, but so long as they
+        # correspond to those saved, their dependencies are restored
+        if len(saved_mob.updaters) == len(live_mob.updaters):
+            saved_to_live_updaters = dict(zip(saved_mob.updaters, live_mob.updaters))
+            live_mob.updater_dependencies = {
+                saved_to_live_updaters[updater]: [resolve(mob) for mob in dependencies]
+                for updater, dependencies in saved_mob.updater_dependencies.items()
+                if updater in saved_to_live_updaters
+            }
+        live_mob.shader_wrapper = None
+        live_mob.set_submobjects([resolve(sm) for sm in saved_mob.submobjects])
+        live_mob.refresh_has_updater_status()
+        live_mob.note_changed_data(recurse_up=False)
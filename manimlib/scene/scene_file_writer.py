@@ -5,15 +5,18 @@ import platform
 import shutil
 import subprocess as sp
 import sys
+import threading
+from queue import Queue
 
-import numpy as np
 from pydub import AudioSegment
 from tqdm.auto import tqdm as ProgressDisplay
 from pathlib import Path
 
 from manimlib.logger import log
 from manimlib.mobject.mobject import Mobject
+from manimlib.scene.audio_timeline import AudioTimeline
 from manimlib.utils.file_ops import guarantee_existence
+from manimlib.utils.profiling import PROFILER
 from manimlib.utils.sounds import get_full_sound_file_path
 
 from typing import TYPE_CHECKING
@@ -41,6 +44,9 @@ class SceneFileWriter(object):
         show_file_location_upon_completion: bool = False,
         quiet: bool = False,
         total_frames: int = 0,
+        # Frames written by each play, as recorded in an earlier
+        # run, used to keep total_frames up to date as plays finish
+        expected_play_frame_counts: list[int] | None = None,
         progress_description_len: int = 40,
         # Name of the binary used for ffmpeg
         ffmpeg_bin: str = "ffmpeg",
@@ -48,6 +54,16 @@ class SceneFileWriter(object):
         pixel_format: str = "yuv420p",
         saturation: float = 1.0,
         gamma: float = 1.0,
+        # If True, frames are read back from the gpu asynchronously into a ring
+        # of pixel buffers, and written to ffmpeg from a separate thread
+        pipelined_readback: bool = False,
+        n_readback_buffers: int = 2,
+        max_queued_frames: int = 8,
+        # When subdividing output, reuse any partial movie file whose
+        # contents were already rendered from an identical segment
+        cache_partial_movies: bool = True,
+        # Time each phase of rendering, writing a trace and printing a summary when finished
+        profile: bool = False,
     ):
         self.scene: Scene = scene
         self.write_to_movie = write_to_movie
@@ -61,20 +77,31 @@ class SceneFileWriter(object):
         self.show_file_location_upon_completion = show_file_location_upon_completion
         self.quiet = quiet
         self.total_frames = total_frames
+        self.expected_play_frame_counts = expected_play_frame_counts
         self.progress_description_len = progress_description_len
         self.ffmpeg_bin = ffmpeg_bin
         self.video_codec = video_codec
         self.pixel_format = pixel_format
         self.saturation = saturation
         self.gamma = gamma
+        self.pipelined_readback = pipelined_readback
+        self.n_readback_buffers = n_readback_buffers
+        self.max_queued_frames = max_queued_frames
+        self.cache_partial_movies = cache_partial_movies
+        self.profile = profile
 
         # State during file writing
         self.writing_process: sp.Popen | None = None
+        self.frame_writing_thread: threading.Thread | None = None
+        self.partial_movie_files: list[Path] = []
+        self.reusing_partial_movie: bool = False
         self.progress_display: ProgressDisplay | None = None
         self.ended_with_interrupt: bool = False
 
         self.init_output_directories()
         self.init_audio()
+        if self.profile:
+            PROFILER.enable()
 
     # Output directories and files
     def init_output_directories(self) -> None:
@@ -118,19 +145,28 @@ class SceneFileWriter(object):
     def get_image_file_path(self) -> str:
         return self.image_file_path
 
-    def get_next_partial_movie_path(self) -> str:
-        result = Path(self.partial_movie_directory, f"{self.scene.num_plays:05}")
+    def get_next_partial_movie_path(self, segment_hash: str | None = None) -> Path:
+        name = f"{self.scene.num_plays:05}"
+        if segment_hash is not None:
+            name += f"_{segment_hash}"
+        result = Path(self.partial_movie_directory, name)
         return result.with_suffix(self.movie_file_extension)
 
+    def find_partial_movie(self, segment_hash: str) -> Path | None:
+        """
+        Look for a partial movie file rendered from the segment with the
+        given hash, possibly at a different position in the scene
+        """
+        pattern = f"*_{segment_hash}{self.movie_file_extension}"
+        return next(Path(self.partial_movie_directory).glob(pattern), None)
+
     def get_movie_file_path(self) -> str:
         return self.movie_file_path
 
     # Sound
     def init_audio(self) -> None:
         self.includes_sound: bool = False
-
-    def create_audio_segment(self) -> None:
-        self.audio_segment = AudioSegment.silent()
+        self.audio_timeline = AudioTimeline()
 
     def add_audio_segment(
         self,
@@ -138,28 +174,10 @@ class SceneFileWriter(object):
         time: float | None = None,
         gain_to_background: float | None = None
     ) -> None:
-        if not self.includes_sound:
-            self.includes_sound = True
-            self.create_audio_segment()
-        segment = self.audio_segment
-        curr_end = segment.duration_seconds
         if time is None:
-            time = curr_end
-        if time < 0:
-            raise Exception("Adding sound at timestamp < 0")
-
-        new_end = time + new_segment.duration_seconds
-        diff = new_end - curr_end
-        if diff > 0:
-            segment = segment.append(
-                AudioSegment.silent(int(np.ceil(diff * 1000))),
-                crossfade=0,
-            )
-        self.audio_segment = segment.overlay(
-            new_segment,
-            position=int(1000 * time),
-            gain_during_overlay=gain_to_background,
-        )
+            time = self.audio_timeline.get_duration()
+        self.audio_timeline.add_segment(new_segment, time, gain_to_background=gain_to_background)
+        self.includes_sound = True
 
     def add_sound(
         self,
@@ -169,23 +187,45 @@ class SceneFileWriter(object):
         gain_to_background: float | None = None
     ) -> None:
         file_path = get_full_sound_file_path(sound_file)
-        new_segment = AudioSegment.from_file(file_path)
-        if gain:
-            new_segment = new_segment.apply_gain(gain)
-        self.add_audio_segment(new_segment, time, gain_to_background)
+        if time is None:
+            time = self.audio_timeline.get_duration()
+        self.audio_timeline.add_file(file_path, time, gain, gain_to_background)
+        self.includes_sound = True
 
     # Writers
     def begin(self) -> None:
         if not self.subdivide_output and self.write_to_movie:
             self.open_movie_pipe(self.get_movie_file_path())
 
-    def begin_animation(self) -> None:
-        if self.subdivide_output and self.write_to_movie:
-            self.open_movie_pipe(self.get_next_partial_movie_path())
+    def caches_partial_movies(self) -> bool:
+        return self.subdivide_output and self.write_to_movie and self.cache_partial_movies
+
+    def begin_animation(self, segment_hash: str | None = None) -> None:
+        """
+        If segment_hash is passed in, and a partial movie file for a
+        segment with that hash exists, that file is reused rather than
+        being rendered again. In that case, is_reusing_partial_movie
+        will return True until end_animation is called.
+        """
+        if not (self.subdivide_output and self.write_to_movie):
+            return
+        file_path = self.get_next_partial_movie_path(segment_hash)
+        cached_path = self.find_partial_movie(segment_hash) if segment_hash else None
+        if cached_path is not None:
+            if cached_path != file_path:
+                shutil.move(cached_path, file_path)
+            self.reusing_partial_movie = True
+        else:
+            self.open_movie_pipe(file_path)
+        self.partial_movie_files.append(file_path)
 
     def end_animation(self) -> None:
-        if self.subdivide_output and self.write_to_movie:
+        if self.subdivide_output and self.write_to_movie and not self.reusing_partial_movie:
             self.close_movie_pipe()
+        self.reusing_partial_movie = False
+
+    def is_reusing_partial_movie(self) -> bool:
+        return self.reusing_partial_movie
 
     def finish(self) -> None:
         if not self.subdivide_output and self.write_to_movie:
@@ -193,12 +233,26 @@ class SceneFileWriter(object):
             if self.includes_sound:
                 self.add_sound_to_video()
             self.print_file_ready_message(self.get_movie_file_path())
+        elif self.write_to_movie and self.partial_movie_files and not self.ended_with_interrupt:
+            self.combine_partial_movie_files()
+            if self.includes_sound:
+                self.add_sound_to_video()
+            self.print_file_ready_message(self.get_movie_file_path())
         if self.save_last_frame:
             self.scene.update_frame(force_draw=True)
             self.save_final_image(self.scene.get_image())
+        if self.profile:
+            self.write_profile()
         if self.should_open_file():
             self.open_file()
 
+    def write_profile(self) -> None:
+        PROFILER.disable()
+        trace_path = str(self.get_output_file_rootname()) + "_profile.json"
+        PROFILER.write_chrome_trace(trace_path)
+        log.info(PROFILER.get_summary(f"Render profile of {self.scene}"))
+        log.info(f"Profile trace written to {trace_path}")
+
     def open_movie_pipe(self, file_path: str) -> None:
         stem, ext = os.path.splitext(file_path)
         self.final_file_path = file_path
@@ -228,6 +282,8 @@ class SceneFileWriter(object):
             command += ['-pix_fmt', self.pixel_format]
         command += [self.temp_file_path]
         self.writing_process = sp.Popen(command, stdin=sp.PIPE)
+        if self.pipelined_readback:
+            self.init_frame_pipeline(self.scene.camera)
 
         if not self.quiet:
             self.progress_display = ProgressDisplay(
@@ -267,6 +323,24 @@ class SceneFileWriter(object):
     def has_progress_display(self):
         return self.progress_display is not None
 
+    def update_expected_total_frames(self, num_plays: int) -> None:
+        """
+        Called after each play, this resets the progress bar's total to
+        the number of frames written so far, plus the number expected for
+        the remaining plays. If the scene changed since its frames were
+        counted, the total starts as an estimate, and this refines it.
+        """
+        if self.progress_display is None or self.expected_play_frame_counts is None:
+            return
+        if self.subdivide_output:
+            # Each partial movie has its own progress display
+            return
+        total = self.progress_display.n + sum(self.expected_play_frame_counts[num_plays:])
+        if total != self.progress_display.total:
+            self.total_frames = total
+            self.progress_display.total = total
+            self.progress_display.refresh()
+
     def set_progress_display_description(self, file: str = "", sub_desc: str = "") -> None:
         if self.progress_display is None:
             return
@@ -282,13 +356,108 @@ class SceneFileWriter(object):
         self.progress_display.set_description(full_desc)
 
     def write_frame(self, camera: Camera) -> None:
-        if self.write_to_movie:
-            raw_bytes = camera.get_raw_fbo_data()
-            self.writing_process.stdin.write(raw_bytes)
+        if self.write_to_movie and not self.reusing_partial_movie:
+            if self.frame_writing_thread is not None:
+                self.queue_frame(camera)
+            else:
+                raw_bytes = camera.get_raw_fbo_data()
+                with PROFILER.section("ffmpeg pipe write"):
+                    self.writing_process.stdin.write(raw_bytes)
             if self.progress_display is not None:
                 self.progress_display.update()
 
+    def write_repeated_frame(self, camera: Camera, n_frames: int) -> None:
+        """
+        Writes the image currently held by the camera n_frames times,
+        only reading it back from the gpu once
+        """
+        if not self.write_to_movie or self.reusing_partial_movie or n_frames <= 0:
+            return
+        raw_bytes = camera.get_raw_fbo_data()
+        if self.frame_writing_thread is not None:
+            if self.frame_writing_error is not None:
+                raise self.frame_writing_error
+            # Frames still being read back come first
+            self.drain_readback_buffers()
+            for _ in range(n_frames):
+                self.frame_queue.put(raw_bytes)
+        else:
+            with PROFILER.section("ffmpeg pipe write"):
+                for _ in range(n_frames):
+                    self.writing_process.stdin.write(raw_bytes)
+        if self.progress_display is not None:
+            self.progress_display.update(n_frames)
+
+    # Pipelined readback
+    def init_frame_pipeline(self, camera: Camera) -> None:
+        """
+        Frames are read into a ring of gpu buffers, and only pulled back to
+        main memory n_readback_buffers - 1 frames later, so that the transfer
+        for one frame overlaps with the rendering of the next.  The raw bytes
+        are then handed off to a thread which writes them to ffmpeg.
+        """
+        frame_size = camera.get_raw_frame_size()
+        self.readback_buffers = [
+            camera.ctx.buffer(reserve=frame_size)
+            for _ in range(max(self.n_readback_buffers, 1))
+        ]
+        self.pending_readbacks = [False] * len(self.readback_buffers)
+        self.readback_index = 0
+        self.frame_queue: Queue[bytes | None] = Queue(maxsize=self.max_queued_frames)
+        self.frame_writing_error: Exception | None = None
+        self.frame_writing_thread = threading.Thread(
+            target=self.write_queued_frames,
+            args=(self.writing_process.stdin,),
+            daemon=True,
+        )
+        self.frame_writing_thread.start()
+
+    def write_queued_frames(self, pipe) -> None:
+        while (raw_bytes := self.frame_queue.get()) is not None:
+            # Keep draining the queue after an error, so
+            # that the render thread never blocks on it
+            if self.frame_writing_error is not None:
+                continue
+            try:
+                with PROFILER.section("ffmpeg pipe write"):
+                    pipe.write(raw_bytes)
+            except Exception as err:
+                self.frame_writing_error = err
+
+    def queue_frame(self, camera: Camera) -> None:
+        if self.frame_writing_error is not None:
+            raise self.frame_writing_error
+        index = self.readback_index
+        buffer = self.readback_buffers[index]
+        if self.pending_readbacks[index]:
+            self.frame_queue.put(buffer.read())
+        camera.read_fbo_into_buffer(buffer)
+        self.pending_readbacks[index] = True
+        self.readback_index = (index + 1) % len(self.readback_buffers)
+
+    def drain_readback_buffers(self) -> None:
+        # Oldest first, starting from the next buffer in the ring
+        n_buffers = len(self.readback_buffers)
+        for i in range(n_buffers):
+            index = (self.readback_index + i) % n_buffers
+            if self.pending_readbacks[index]:
+                self.frame_queue.put(self.readback_buffers[index].read())
+                self.pending_readbacks[index] = False
+
+    def flush_frame_pipeline(self) -> None:
+        self.drain_readback_buffers()
+        self.frame_queue.put(None)
+        self.frame_writing_thread.join()
+        self.frame_writing_thread = None
+        for buffer in self.readback_buffers:
+            buffer.release()
+        self.readback_buffers = []
+        if self.frame_writing_error is not None:
+            raise self.frame_writing_error
+
     def close_movie_pipe(self) -> None:
+        if self.frame_writing_thread is not None:
+            self.flush_frame_pipeline()
         self.writing_process.stdin.close()
         self.writing_process.wait()
         self.writing_process.terminate()
@@ -300,21 +469,31 @@ class SceneFileWriter(object):
         else:
             self.movie_file_path = self.temp_file_path
 
+    def combine_partial_movie_files(self) -> None:
+        """
+        Concatenates all partial movie files written or reused during this run
+        into the full movie, using ffmpeg's concat demuxer so that nothing
+        needs to be re-encoded
+        """
+        concatenate_movie_files(
+            self.partial_movie_files,
+            Path(self.get_movie_file_path()),
+            self.ffmpeg_bin,
+        )
+
     def add_sound_to_video(self) -> None:
         movie_file_path = self.get_movie_file_path()
         stem, ext = os.path.splitext(movie_file_path)
-        sound_file_path = stem + ".wav"
-        # Makes sure sound file length will match video file
-        self.add_audio_segment(AudioSegment.silent(0))
-        self.audio_segment.export(
-            sound_file_path,
-            bitrate='312k',
-        )
+        samples, frame_rate = self.audio_timeline.mix()
         temp_file_path = stem + "_temp" + ext
         commands = [
             self.ffmpeg_bin,
             "-i", movie_file_path,
-            "-i", sound_file_path,
+            # The mixed samples are piped in as raw floats
+            "-f", "f32le",
+            "-ar", str(frame_rate),
+            "-ac", str(samples.shape[1]),
+            "-i", "-",
             '-y',  # overwrite output file if it exists
             "-c:v", "copy",
             "-c:a", "aac",
@@ -327,9 +506,8 @@ class SceneFileWriter(object):
             # "-shortest",
             temp_file_path,
         ]
-        sp.call(commands)
+        sp.run(commands, input=samples.astype("<f4").tobytes())
         shutil.move(temp_file_path, movie_file_path)
-        os.remove(sound_file_path)
 
     def save_final_image(self, image: Image) -> None:
         file_path = self.get_image_file_path()
@@ -383,3 +561,31 @@ class SceneFileWriter(object):
         if self.quiet:
             sys.stdout.close()
             sys.stdout = curr_stdout
+
+
+def concatenate_movie_files(
+    file_paths: list[Path],
+    output_path: Path,
+    ffmpeg_bin: str = "ffmpeg",
+) -> None:
+    """
+    Joins movie files, all encoded the same way, using ffmpeg's
+    concat demuxer so that nothing needs to be re-encoded
+    """
+    list_file_path = output_path.with_name(output_path.stem + "_file_list.txt")
+    with open(list_file_path, "w") as fp:
+        for file_path in file_paths:
+            escaped_path = file_path.as_posix().replace("'", "'\\''")
+            fp.write(f"file '{escaped_path}'\n")
+    commands = [
+        ffmpeg_bin,
+        '-y',  # overwrite output file if it exists
+        '-f', 'concat',
+        '-safe', '0',
+        '-i', str(list_file_path),
+        '-c', 'copy',
+        '-loglevel', 'error',
+        str(output_path),
+    ]
+    sp.call(commands)
+    os.remove(list_file_path)
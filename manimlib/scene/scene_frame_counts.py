@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import os
+
+from diskcache import Cache
+
+from manimlib.utils.directories import get_cache_dir
+from manimlib.utils.hashing import hash_source_file
+from manimlib.utils.simple_functions import hash_string
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Optional, Type
+    from manimlib.scene.scene import Scene
+
+
+# Records of how many frames each play of a scene wrote (or, for a run
+# which skipped animations, would have written). These let a render
+# size its progress bar without first running the whole scene to count.
+# Opened on first use, rather than on import, keyed by directory in case
+# the cache directory changes
+_caches: dict[str, Cache] = dict()
+
+
+def get_frame_count_cache() -> Cache:
+    directory = os.path.join(get_cache_dir(), "frame_counts")
+    if directory not in _caches:
+        _caches[directory] = Cache(directory)
+    return _caches[directory]
+
+
+def get_frame_count_key(
+    scene_class: Type[Scene],
+    fps: int,
+    start_at_animation_number: Optional[int] = None,
+    end_at_animation_number: Optional[int] = None,
+) -> str:
+    return hash_string("".join(map(str, [
+        scene_class.__module__,
+        scene_class.__qualname__,
+        fps,
+        start_at_animation_number,
+        end_at_animation_number,
+    ])))
+
+
+def save_play_frame_counts(scene: Scene) -> None:
+    key = get_frame_count_key(
+        type(scene),
+        scene.camera.fps,
+        scene.start_at_animation_number,
+        scene.end_at_animation_number,
+    )
+    get_frame_count_cache().set(key, dict(
+        source_hash=hash_source_file(type(scene)),
+        play_frame_counts=list(scene.play_frame_counts),
+        adds_sound=scene.adds_sound,
+    ))
+
+
+def load_play_frame_counts(
+    scene_class: Type[Scene],
+    fps: int,
+    start_at_animation_number: Optional[int] = None,
+    end_at_animation_number: Optional[int] = None,
+) -> tuple[list[int], bool, Optional[bool]] | None:
+    """
+    Returns the frame counts per play recorded for the last run of this
+    scene with the same settings, along with whether its source file is
+    unchanged since then, meaning those counts are exact rather than an
+    estimate, and whether that run added any sounds, if recorded. Returns
+    None if there is no such record.
+    """
+    key = get_frame_count_key(
+        scene_class, fps,
+        start_at_animation_number,
+        end_at_animation_number,
+    )
+    record = get_frame_count_cache().get(key)
+    if record is None:
+        return None
+    is_exact = record["source_hash"] == hash_source_file(scene_class)
+    return record["play_frame_counts"], is_exact, record.get("adds_sound")
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from manimlib.mobject.mobject import Mobject
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Optional
+
+    from manimlib.mobject.mobject import Updater
+
+    # The mobject, the updater, whether it takes dt, and any
+    # mobjects it was declared to depend on
+    UpdaterEntry = tuple[Mobject, Updater, bool, Optional[list[Mobject]]]
+
+
+def updater_takes_dt(updater: Updater) -> bool:
+    # As in Mobject.update, updaters with an argument named
+    # dt are passed the time since the last frame
+    return "dt" in updater.__code__.co_varnames
+
+
+class UpdaterSchedule(object):
+    """
+    All updaters of a list of mobjects, with those of their families, as a
+    flat list, in the order in which calling Mobject.update on each mobject
+    would call them. Running through this, rather than recursing through
+    every family, makes updating a frame cost time in proportion to the
+    number of updaters, rather than to the number of mobjects.
+
+    The list is only rebuilt when the mobjects change, or when the updaters
+    in one of their families might have, which each mobject tracks with
+    Mobject._updaters_version. Families without updaters, or with updating
+    suspended, are skipped while building it, as Mobject.update skips them.
+
+    Updaters added with dependencies, or when reactive is True, all those
+    not taking dt, are skipped on frames where neither their mobject nor
+    anything they depend on has changed since they last ran. Without
+    declared dependencies, these are the mobjects the updater read from
+    (see Mobject.note_read) as it last ran, other than any it created.
+    """
+    def __init__(self, reactive: bool = False):
+        self.reactive = reactive
+        self.mobjects: list[Mobject] = []
+        self.versions: list[int] = []
+        self.entries: list[UpdaterEntry] = []
+        # Versions of what each dependent updater depended on when it last ran
+        self.dependency_versions: dict[tuple[Mobject, Updater], list[tuple[Mobject, int]]] = dict()
+
+    def refresh(self, mobjects: list[Mobject]) -> None:
+        versions = [mob._updaters_version for mob in mobjects]
+        if mobjects == self.mobjects and versions == self.versions:
+            return
+        self.mobjects = list(mobjects)
+        self.versions = versions
+        self.entries = []
+        for mobject in mobjects:
+            self.add_entries(mobject)
+        keys = set((mob, updater) for mob, updater, _, _ in self.entries)
+        self.dependency_versions = {
+            key: value
+            for key, value in self.dependency_versions.items()
+            if key in keys
+        }
+
+    def add_entries(self, mobject: Mobject) -> None:
+        if not mobject.has_updaters() or mobject.updating_suspended:
+            return
+        for submob in mobject.submobjects:
+            self.add_entries(submob)
+        for updater in mobject.updaters:
+            self.entries.append((
+                mobject,
+                updater,
+                updater_takes_dt(updater),
+                mobject.updater_dependencies.get(updater),
+            ))
+
+    def update(self, mobjects: list[Mobject], dt: float) -> None:
+        self.refresh(mobjects)
+        for mobject, updater, takes_dt, dependencies in self.entries:
+            if takes_dt:
+                updater(mobject, dt=dt)
+            elif dependencies is None and not self.reactive:
+                updater(mobject)
+            else:
+                self.update_dependent(mobject, updater, dependencies)
+
+    def update_dependent(
+        self,
+        mobject: Mobject,
+        updater: Updater,
+        dependencies: list[Mobject] | None
+    ) -> None:
+        key = (mobject, updater)
+        last_versions = self.dependency_versions.get(key)
+        if last_versions is not None and all(
+            mob._family_version == version
+            for mob, version in last_versions
+        ):
+            return
+
+        if dependencies is None:
+            dependencies = self.run_recording_reads(mobject, updater)
+        else:
+            updater(mobject)
+        # Versions are taken after the updater has run, so
+        # that its own changes don't count as changes
+        self.dependency_versions[key] = [
+            (mob, mob._family_version)
+            for mob in (mobject, *dependencies)
+        ]
+
+    def run_recording_reads(self, mobject: Mobject, updater: Updater) -> list[Mobject]:
+        """
+        Calls the updater, returning the mobjects it read from which
+        existed before it was called
+        """
+        first_new_index = Mobject.num_created
+        outer_reads = Mobject.recorded_reads
+        Mobject.recorded_reads = reads = set()
+        try:
+            updater(mobject)
+        finally:
+            Mobject.recorded_reads = outer_reads
+        return [mob for mob in reads if mob.creation_index < first_new_index]
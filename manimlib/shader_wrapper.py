@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+import itertools as it
 import os
 import re
 
@@ -15,14 +16,17 @@ from manimlib.utils.shaders import get_shader_code_from_file
 from manimlib.utils.shaders import get_shader_program
 from manimlib.utils.shaders import image_path_to_texture
 from manimlib.utils.shaders import set_program_uniform
+from manimlib.utils.shaders import uses_camera_uniform_block
+from manimlib.utils.profiling import profile
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Optional, Tuple, Iterable
+    from typing import Callable, Optional, Tuple, Iterable
     from manimlib.typing import UniformDict
     from moderngl.vertex_array import VertexArray
     from moderngl.framebuffer import Framebuffer
+    from manimlib.mobject.mobject import Mobject
 
 # Mobjects that should be rendered with
 # the same shader will be organized and
@@ -32,6 +36,17 @@ if TYPE_CHECKING:
 
 
 class ShaderWrapper(object):
+    # Factor by which vertex buffers grow when they run out of room
+    capacity_growth: float = 2.0
+    # Number of draw calls made by all shader wrappers, which
+    # the camera resets and reads with each frame it captures
+    n_draw_calls: int = 0
+    # A draw held back by one shader wrapper, in case it can be combined with
+    # those of the shader wrappers following it, see VShaderWrapper.render_fill.
+    # It's made before any shader wrapper which can't follow on from it renders,
+    # and by the camera once all have.
+    deferred_draw: Optional[Callable[[], None]] = None
+
     def __init__(
         self,
         ctx: moderngl.context.Context,
@@ -99,6 +114,13 @@ class ShaderWrapper(object):
     def init_vertex_objects(self):
         self.vbo = None
         self.vaos = []
+        self.vert_capacity = 0
+        self.n_verts = 0
+        # Mobjects whose data was last read in, with the data version
+        # of each at the time, and where its data sits in the vbo
+        self.source_mobjects: list[Mobject] = []
+        self.source_versions: list[int] = []
+        self.source_ends: np.ndarray = np.zeros(0, dtype=int)
 
     def add_texture(self, name: str, texture: moderngl.Texture):
         max_units = self.ctx.info['GL_MAX_TEXTURE_IMAGE_UNITS']
@@ -115,9 +137,12 @@ class ShaderWrapper(object):
         return self.id
 
     def refresh_id(self) -> None:
+        # Mobjects are also batched by any lazy transform, see
+        # Mobject.get_shader_wrapper_list, so that's left out here
+        uniforms = {k: v for k, v in self.mobject_uniforms.items() if k != "model_matrix"}
         self.id = hash("".join(map(str, [
             "".join(map(str, self.program_code.values())),
-            self.mobject_uniforms,
+            uniforms,
             self.depth_test,
             self.render_primitive,
             self.texture_paths,
@@ -150,28 +175,78 @@ class ShaderWrapper(object):
 
     # Adding data
 
+    @profile()
     def read_in(self, data_list: Iterable[np.ndarray]):
+        """
+        Writes the concatenation of data_list into the vbo. Both the vbo and
+        the array holding its data are allocated with spare capacity, growing
+        geometrically, so that a changing number of vertices, e.g. during
+        ShowCreation, doesn't mean reallocating them (and the vaos) every frame.
+        """
         total_len = sum(map(len, data_list))
+        if total_len > self.vert_capacity:
+            capacity = max(total_len, int(self.capacity_growth * self.vert_capacity))
+            self.release()  # This sets vbo to be None
+            self.vert_buffer = np.zeros(capacity, dtype=self.vert_data.dtype)
+            self.vert_capacity = capacity
+        self.n_verts = total_len
         if total_len == 0:
-            if self.vbo is not None:
-                self.vbo.clear()
             return
 
-        # If possible, read concatenated data into existing list
-        if len(self.vert_data) != total_len:
-            self.vert_data = np.concatenate(data_list)
-        else:
-            np.concatenate(data_list, out=self.vert_data)
+        self.vert_data = self.vert_buffer[:total_len]
+        np.concatenate(data_list, out=self.vert_data)
 
-        # Either create new vbo, or read data into it
-        total_size = self.vert_data.itemsize * total_len
-        if self.vbo is not None and self.vbo.size != total_size:
-            self.release()  # This sets vbo to be None
         if self.vbo is None:
-            self.vbo = self.ctx.buffer(self.vert_data)
+            self.vbo = self.ctx.buffer(reserve=self.vert_buffer.nbytes)
             self.generate_vaos()
-        else:
-            self.vbo.write(self.vert_data)
+        # Only the range in use is written
+        self.vbo.write(self.vert_data)
+
+    def read_in_mobjects(self, mobjects: list[Mobject]):
+        """
+        Reads in the shader data of all the given mobjects. If these are the
+        same mobjects as in the last call, only the data of those which have
+        changed since then is fetched and written, so long as the number of
+        vertices of each is unchanged.
+        """
+        if self.source_mobjects != mobjects or self.n_verts == 0:
+            self.read_in_all_mobjects(mobjects)
+            return
+
+        starts = [0, *self.source_ends[:-1]]
+        changed_ranges = []
+        for index, mob in enumerate(mobjects):
+            if mob._data_version == self.source_versions[index]:
+                continue
+            data = mob.get_shader_data()
+            start, end = starts[index], self.source_ends[index]
+            if len(data) != end - start:
+                self.read_in_all_mobjects(mobjects)
+                return
+            self.vert_data[start:end] = data
+            self.source_versions[index] = mob._data_version
+            if changed_ranges and changed_ranges[-1][1] == start:
+                changed_ranges[-1][1] = end
+            else:
+                changed_ranges.append([start, end])
+
+        # Write contiguous runs of changed data together
+        itemsize = self.vert_data.itemsize
+        for start, end in changed_ranges:
+            self.vbo.write(self.vert_data[start:end], offset=int(start * itemsize))
+
+    def read_in_all_mobjects(self, mobjects: list[Mobject]):
+        data_list = [mob.get_shader_data() for mob in mobjects]
+        self.read_in(data_list)
+        self.source_mobjects = list(mobjects)
+        # Versions are read after the data, as fetching it may update them
+        self.source_versions = [mob._data_version for mob in mobjects]
+        self.source_ends = np.cumsum([len(data) for data in data_list], dtype=int)
+
+    def render_vao(self, vao: VertexArray) -> None:
+        if self.n_verts > 0:
+            vao.render(vertices=self.n_verts)
+            ShaderWrapper.n_draw_calls += 1
 
     def generate_vaos(self):
         # Vertex array object
@@ -185,7 +260,19 @@ class ShaderWrapper(object):
         ]
 
     # Related to data and rendering
+    @staticmethod
+    def flush_deferred_draw() -> None:
+        draw = ShaderWrapper.deferred_draw
+        if draw is not None:
+            ShaderWrapper.deferred_draw = None
+            draw()
+
+    def can_follow_deferred_draw(self) -> bool:
+        return False
+
     def pre_render(self):
+        if not self.can_follow_deferred_draw():
+            ShaderWrapper.flush_deferred_draw()
         self.set_ctx_depth_test(self.depth_test)
         self.set_ctx_clip_plane(self.use_clip_plane())
         for tid, texture in enumerate(self.textures):
@@ -193,13 +280,20 @@ class ShaderWrapper(object):
 
     def render(self):
         for vao in self.vaos:
-            vao.render()
+            self.render_vao(vao)
 
     def update_program_uniforms(self, camera_uniforms: UniformDict):
         for program in self.programs:
             if program is None:
                 continue
-            for uniforms in [self.mobject_uniforms, camera_uniforms, self.texture_names_to_ids]:
+            # Programs with the camera's uniform block read those from the
+            # buffer it binds, so only shaders declaring them individually,
+            # as older custom ones might, need them set here
+            if uses_camera_uniform_block(program):
+                uniform_dicts = [self.mobject_uniforms, self.texture_names_to_ids]
+            else:
+                uniform_dicts = [self.mobject_uniforms, camera_uniforms, self.texture_names_to_ids]
+            for uniforms in uniform_dicts:
                 for name, value in uniforms.items():
                     set_program_uniform(program, name, value)
 
@@ -218,6 +312,14 @@ class ShaderWrapper(object):
 
 
 class VShaderWrapper(ShaderWrapper):
+    # Boxes in the xy-plane which the fills deferred on the fill canvas,
+    # not yet composited onto the frame, stay within
+    deferred_fill_bounds: Optional[np.ndarray] = None
+    # Tolerance for considering the data to lie in the xy-plane
+    flatness_tolerance: float = 1e-3
+    # Canvas shared by all VShaderWrappers of each context, see get_fill_canvas
+    fill_canvases: dict[moderngl.Context, Tuple[Framebuffer, VertexArray, Framebuffer]] = dict()
+
     def __init__(
         self,
         ctx: moderngl.context.Context,
@@ -231,6 +333,7 @@ class VShaderWrapper(ShaderWrapper):
         stroke_behind: bool = False,
     ):
         self.stroke_behind = stroke_behind
+        self.code_replacements = dict(code_replacements)
         super().__init__(
             ctx=ctx,
             vert_data=vert_data,
@@ -241,9 +344,6 @@ class VShaderWrapper(ShaderWrapper):
             render_primitive=render_primitive,
             code_replacements=code_replacements,
         )
-        self.fill_canvas = VShaderWrapper.get_fill_canvas(self.ctx)
-        self.add_texture('Texture', self.fill_canvas[0].color_attachments[0])
-        self.add_texture('DepthTexture', self.fill_canvas[2].color_attachments[0])
 
     def init_program_code(self) -> None:
         self.program_code = {
@@ -305,11 +405,88 @@ class VShaderWrapper(ShaderWrapper):
         self.fill_depth_vert_attributes = ['point', 'base_normal']
 
     def init_vertex_objects(self):
-        self.vbo = None
+        super().init_vertex_objects()
         self.stroke_vao = None
         self.fill_vao = None
         self.fill_border_vao = None
-        self.vaos = []
+        self.fill_depth_vao = None
+        self.has_fill = False
+        self.has_stroke = False
+        # Lower left and upper right corners of a box in the xy-plane holding
+        # all points, or None if they don't lie flat in that plane
+        self.xy_bounds: Optional[np.ndarray] = None
+        self.pixel_size: float = 0.0
+
+    def read_in_mobjects(self, mobjects: list[Mobject]):
+        super().read_in_mobjects(mobjects)
+        self.refresh_data_summary()
+
+    def refresh_data_summary(self) -> None:
+        """
+        Notes whether the data has any visible fill or stroke, so that passes
+        drawing nothing can be skipped, and where it lies, so that fills which
+        don't overlap can share the fill canvas.
+        """
+        if self.n_verts == 0:
+            self.has_fill = self.has_stroke = False
+            self.xy_bounds = None
+            return
+        data = self.vert_data
+        if self.code_replacements:
+            # These may change colors in any way
+            self.has_fill = self.has_stroke = True
+        else:
+            self.has_fill = bool(data["fill_rgba"][:, 3].any())
+            self.has_stroke = bool(data["stroke_width"].any() and data["stroke_rgba"][:, 3].any())
+
+        points = data["point"]
+        corners = np.array(list(it.product(*zip(points.min(0), points.max(0)))))
+        model_matrix = self.mobject_uniforms.get("model_matrix")
+        if model_matrix is not None:
+            affine = model_matrix.reshape(4, 4).T
+            corners = np.dot(corners, affine[:3, :3].T) + affine[:3, 3]
+        mins, maxs = corners.min(0), corners.max(0)
+        if max(abs(mins[2]), abs(maxs[2])) < self.flatness_tolerance:
+            self.xy_bounds = np.array([mins[:2], maxs[:2]])
+        else:
+            self.xy_bounds = None
+
+    def get_fill_canvas_bounds(self) -> Optional[np.ndarray]:
+        """
+        Box in the xy-plane which the fill drawn to the fill canvas stays within,
+        or None if it can't share that canvas with the fills of other shader
+        wrappers. That needs it to be drawn the same way as they are, with no
+        depth test nor clip plane, and flat in the xy-plane, so that not
+        overlapping in that plane means not overlapping on screen.
+        """
+        uniforms = self.mobject_uniforms
+        if self.xy_bounds is None or self.depth_test or self.use_clip_plane():
+            return None
+        if float(uniforms.get("is_fixed_in_frame", 0)) != 0:
+            return None
+        # Leave room for the fill border and antialiasing
+        buff = 4 * self.pixel_size + 0.01 * float(self.vert_data["fill_border_width"].max())
+        return self.xy_bounds + [[-buff, -buff], [buff, buff]]
+
+    def can_follow_deferred_draw(self) -> bool:
+        if not self.has_fill and not self.has_stroke:
+            # Nothing is drawn
+            return True
+        deferred_bounds = VShaderWrapper.deferred_fill_bounds
+        bounds = self.get_fill_canvas_bounds()
+        if deferred_bounds is None or bounds is None or not self.has_fill:
+            return False
+        if self.has_stroke and self.stroke_behind:
+            # This stroke would be drawn before the deferred fills
+            return False
+        return bool(np.all(
+            (deferred_bounds[:, 0] > bounds[1]).any(1) |
+            (deferred_bounds[:, 1] < bounds[0]).any(1)
+        ))
+
+    def update_program_uniforms(self, camera_uniforms: UniformDict):
+        super().update_program_uniforms(camera_uniforms)
+        self.pixel_size = camera_uniforms.get("pixel_size", 0.0)
 
     def generate_vaos(self):
         self.stroke_vao = self.ctx.vertex_array(
@@ -343,20 +520,24 @@ class VShaderWrapper(ShaderWrapper):
 
     # Rendering
     def render_stroke(self):
-        if self.stroke_vao is None:
+        if self.stroke_vao is None or not self.has_stroke:
             return
-        self.stroke_vao.render()
+        self.render_vao(self.stroke_vao)
 
     def render_fill(self):
-        if self.fill_vao is None:
+        if self.fill_vao is None or self.n_verts == 0 or not self.has_fill:
             return
 
         original_fbo = self.ctx.fbo
-        fill_tx_fbo, fill_tx_vao, depth_tx_fbo = self.fill_canvas
+        fill_tx_fbo, fill_tx_vao, depth_tx_fbo = VShaderWrapper.get_fill_canvas(self.ctx)
 
         # Render to a separate texture, due to strange alpha compositing
-        # for the blended winding calculation
-        fill_tx_fbo.clear()
+        # for the blended winding calculation. If fills of earlier shader
+        # wrappers are still on it, this one is added to them.
+        deferred_bounds = VShaderWrapper.deferred_fill_bounds
+        if ShaderWrapper.deferred_draw is None:
+            deferred_bounds = None
+            fill_tx_fbo.clear()
         fill_tx_fbo.use()
 
         # Be sure not to apply depth test while rendering fill
@@ -371,7 +552,7 @@ class VShaderWrapper(ShaderWrapper):
             gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA,
             gl.GL_ONE_MINUS_DST_ALPHA, gl.GL_ONE
         )
-        self.fill_vao.render()
+        self.render_vao(self.fill_vao)
 
         if apply_depth_test:
             self.ctx.enable(moderngl.DEPTH_TEST)
@@ -379,25 +560,47 @@ class VShaderWrapper(ShaderWrapper):
             depth_tx_fbo.use()
             gl.glBlendFunc(gl.GL_ONE, gl.GL_ONE)
             gl.glBlendEquation(gl.GL_MIN)
-            self.fill_depth_vao.render()
+            self.render_vao(self.fill_depth_vao)
 
         # Now add border, just taking the max alpha
         gl.glBlendFunc(gl.GL_ONE, gl.GL_ONE)
         gl.glBlendEquation(gl.GL_MAX)
-        self.fill_border_vao.render()
+        self.render_vao(self.fill_border_vao)
+
+        original_fbo.use()
+        gl.glBlendEquation(gl.GL_FUNC_ADD)
+        gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
+
+        bounds = self.get_fill_canvas_bounds()
+        if bounds is not None and not (self.has_stroke and not self.stroke_behind):
+            # Nothing more of this is drawn over the fill, so compositing it
+            # onto the frame can wait, in case the fills of shader wrappers
+            # following it can share the canvas, and just one composite
+            bounds = bounds.reshape(1, 2, 2)
+            if deferred_bounds is not None:
+                bounds = np.vstack([deferred_bounds, bounds])
+            VShaderWrapper.deferred_fill_bounds = bounds
+            ShaderWrapper.deferred_draw = lambda: self.composite_fill_canvas(original_fbo)
+        else:
+            ShaderWrapper.deferred_draw = None
+            self.composite_fill_canvas(original_fbo)
 
+    def composite_fill_canvas(self, fbo: Framebuffer) -> None:
         # Take the texture we were just drawing to, and render it to
         # the main scene. Account for how alphas have been premultiplied
-        original_fbo.use()
+        VShaderWrapper.deferred_fill_bounds = None
+        fill_tx_fbo, fill_tx_vao, depth_tx_fbo = VShaderWrapper.get_fill_canvas(self.ctx)
+        fill_tx_fbo.color_attachments[0].use(0)
+        depth_tx_fbo.color_attachments[0].use(1)
+        fbo.use()
         gl.glBlendFunc(gl.GL_ONE, gl.GL_ONE_MINUS_SRC_ALPHA)
         gl.glBlendEquation(gl.GL_FUNC_ADD)
         fill_tx_vao.render()
+        ShaderWrapper.n_draw_calls += 1
 
         # Return to original blending state
         gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
 
-    # Static method returning one shared value across all VShaderWrappers
-    @lru_cache
     @staticmethod
     def get_fill_canvas(ctx: moderngl.Context) -> Tuple[Framebuffer, VertexArray, Framebuffer]:
         """
@@ -409,19 +612,63 @@ class VShaderWrapper(ShaderWrapper):
         This returns a texture, loaded into a frame buffer, and a vao
         which can display that texture as a simple quad onto a screen,
         along with the rgb value which is meant to be discarded.
+
+        The camera sizes this to the frame buffer it draws to, with
+        set_fill_canvas_size, before each frame it captures.
         """
-        size = manim_config.camera.resolution
-        double_size = (2 * size[0], 2 * size[1])
+        if ctx not in VShaderWrapper.fill_canvases:
+            VShaderWrapper.set_fill_canvas_size(ctx, manim_config.camera.resolution)
+        return VShaderWrapper.fill_canvases[ctx]
+
+    @staticmethod
+    def set_fill_canvas_size(
+        ctx: moderngl.Context,
+        size: Tuple[int, int],
+        supersampling: int = 2
+    ) -> None:
+        """
+        Makes the fill canvas of the context right for a frame of the given
+        size, with the fill texture larger by a factor of supersampling in
+        each dimension, recreating it if it was sized differently
+        """
+        size = (int(size[0]), int(size[1]))
+        fill_size = (supersampling * size[0], supersampling * size[1])
+        canvas = VShaderWrapper.fill_canvases.get(ctx)
+        if canvas is not None and canvas[0].size == fill_size and canvas[2].size == size:
+            return
+        VShaderWrapper.release_fill_canvas(ctx)
 
         # Important to make sure dtype is floating point (not fixed point)
         # so that alpha values can be negative and are not clipped
-        fill_texture = ctx.texture(size=double_size, components=4, dtype='f2')
+        fill_texture = ctx.texture(size=fill_size, components=4, dtype='f2')
         # Use another one to keep track of depth
         depth_texture = ctx.texture(size=size, components=1, dtype='f4')
 
-        fill_texture_fbo = ctx.framebuffer(fill_texture)
-        depth_texture_fbo = ctx.framebuffer(depth_texture)
+        VShaderWrapper.fill_canvases[ctx] = (
+            ctx.framebuffer(fill_texture),
+            VShaderWrapper.get_fill_canvas_vao(ctx),
+            ctx.framebuffer(depth_texture),
+        )
+
+    @staticmethod
+    def release_fill_canvas(ctx: moderngl.Context) -> None:
+        canvas = VShaderWrapper.fill_canvases.pop(ctx, None)
+        if canvas is None:
+            return
+        for fbo in (canvas[0], canvas[2]):
+            for texture in fbo.color_attachments:
+                texture.release()
+            fbo.release()
 
+    # Static method returning one shared value across all VShaderWrappers
+    @lru_cache
+    @staticmethod
+    def get_fill_canvas_vao(ctx: moderngl.Context) -> VertexArray:
+        """
+        Vao displaying the texture of the fill canvas as a quad covering the
+        frame, which doesn't depend on the canvas size, so is kept when it's
+        recreated
+        """
         simple_vert = '''
             #version 330
 
@@ -469,7 +716,7 @@ class VShaderWrapper(ShaderWrapper):
             mode=moderngl.TRIANGLE_STRIP
         )
 
-        return (fill_texture_fbo, fill_texture_vao, depth_texture_fbo)
+        return fill_texture_vao
 
     def render(self):
         if self.stroke_behind:
@@ -478,3 +725,161 @@ class VShaderWrapper(ShaderWrapper):
         else:
             self.render_fill()
             self.render_stroke()
+
+
+class InstancedVShaderWrapper(VShaderWrapper):
+    """
+    Draws many instances of one shape, each moved by its own linear map and
+    shift, and with its own fill and stroke color, from a single vbo holding
+    the shape's data, and a second holding a small record for each instance.
+    """
+    instance_dtype: np.dtype = np.dtype([
+        ('instance_matrix', np.float32, (3, 3)),  # Column major, as read by glsl
+        ('instance_shift', np.float32, (3,)),
+        ('instance_fill_rgba', np.float32, (4,)),
+        ('instance_stroke_rgba', np.float32, (4,)),
+    ])
+
+    def init_program_code(self) -> None:
+        super().init_program_code()
+        code = self.program_code
+        code["stroke_vert"] = self.get_instanced_vert_code(code["stroke_vert"], {
+            "verts = point;": "verts = instance_matrix * point + instance_shift;",
+            "v_color = stroke_rgba;": "v_color = instance_stroke_rgba;",
+        })
+        code["fill_vert"] = self.get_instanced_vert_code(code["fill_vert"], {
+            "verts = point;": "verts = instance_matrix * point + instance_shift;",
+            "v_color = fill_rgba;": "v_color = instance_fill_rgba;",
+            # Within each triangle, the second vertex carries the unit normal,
+            # and the others carry the base point, which moves with the instance
+            "v_base_normal = base_normal;": """
+                v_base_normal = (gl_VertexID % 3 == 1) ?
+                    base_normal : instance_matrix * base_normal + instance_shift;
+            """,
+        })
+        code["depth_vert"] = self.get_instanced_vert_code(code["depth_vert"], {
+            "verts = point;": "verts = instance_matrix * point + instance_shift;",
+            "v_base_point = base_normal;": "v_base_point = instance_matrix * base_normal + instance_shift;",
+        })
+
+    @staticmethod
+    def get_instanced_vert_code(code: str, replacements: dict[str, str]) -> str:
+        code = code.replace("#version 330", "\n".join([
+            "#version 330",
+            "in mat3 instance_matrix;",
+            "in vec3 instance_shift;",
+            "in vec4 instance_fill_rgba;",
+            "in vec4 instance_stroke_rgba;",
+        ]), 1)
+        for old, new in replacements.items():
+            code = code.replace(old, new)
+        return code
+
+    def init_program(self):
+        super().init_program()
+        # Colors come from the instance attributes rather than the vertices
+        self.stroke_vert_format = '3f 16x 1f 1f 16x 3f 4x'
+        self.stroke_vert_attributes = ['point', 'stroke_width', 'joint_angle', 'unit_normal']
+
+        self.fill_vert_format = '3f 40x 3f 4x'
+        self.fill_vert_attributes = ['point', 'base_normal']
+
+        self.fill_border_vert_format = '3f 20x 1f 16x 3f 1f'
+        self.fill_border_vert_attributes = ['point', 'joint_angle', 'unit_normal', 'stroke_width']
+
+        # Instance attributes used by each program, where the fill border is
+        # drawn with the stroke shaders, but in the fill color
+        self.stroke_instance_format = '9f 3f 16x 4f/i'
+        self.stroke_instance_attributes = ['instance_matrix', 'instance_shift', 'instance_stroke_rgba']
+
+        self.fill_instance_format = '9f 3f 4f 16x/i'
+        self.fill_instance_attributes = ['instance_matrix', 'instance_shift', 'instance_fill_rgba']
+
+        self.fill_border_instance_format = '9f 3f 4f 16x/i'
+        self.fill_border_instance_attributes = ['instance_matrix', 'instance_shift', 'instance_stroke_rgba']
+
+        self.fill_depth_instance_format = '9f 3f 32x/i'
+        self.fill_depth_instance_attributes = ['instance_matrix', 'instance_shift']
+
+    def refresh_data_summary(self) -> None:
+        # Colors and positions come with each instance, so
+        # the template's data says nothing about them
+        super().refresh_data_summary()
+        self.has_fill = self.has_stroke = self.n_verts > 0
+        self.xy_bounds = None
+
+    def init_vertex_objects(self):
+        super().init_vertex_objects()
+        self.instance_vbo = None
+        self.instance_capacity = 0
+        self.n_instances = 0
+
+    def read_in_instances(self, instance_data: np.ndarray):
+        """
+        Writes the record of each instance into the instance vbo, which,
+        like the vbo, grows geometrically as needed. Since vaos refer to
+        both buffers, they are regenerated along with either.
+        """
+        n_instances = len(instance_data)
+        if n_instances > self.instance_capacity:
+            capacity = max(n_instances, int(self.capacity_growth * self.instance_capacity))
+            if self.instance_vbo is not None:
+                self.instance_vbo.release()
+            self.instance_vbo = self.ctx.buffer(reserve=capacity * self.instance_dtype.itemsize)
+            self.instance_capacity = capacity
+            if self.vbo is not None:
+                self.generate_vaos()
+        self.n_instances = n_instances
+        if n_instances > 0:
+            self.instance_vbo.write(instance_data.astype(self.instance_dtype, copy=False))
+
+    def generate_vaos(self):
+        if self.instance_vbo is None:
+            # Wait for the instance data
+            return
+        for vao in (self.stroke_vao, self.fill_vao, self.fill_border_vao, self.fill_depth_vao):
+            if vao is not None:
+                vao.release()
+        self.stroke_vao, self.fill_vao, self.fill_border_vao, self.fill_depth_vao = [
+            self.ctx.vertex_array(
+                program=program,
+                content=[
+                    (self.vbo, vert_format, *vert_attributes),
+                    (self.instance_vbo, instance_format, *instance_attributes),
+                ],
+                mode=self.render_primitive,
+            )
+            for program, vert_format, vert_attributes, instance_format, instance_attributes in [
+                (
+                    self.stroke_program,
+                    self.stroke_vert_format, self.stroke_vert_attributes,
+                    self.stroke_instance_format, self.stroke_instance_attributes,
+                ),
+                (
+                    self.fill_program,
+                    self.fill_vert_format, self.fill_vert_attributes,
+                    self.fill_instance_format, self.fill_instance_attributes,
+                ),
+                (
+                    self.fill_border_program,
+                    self.fill_border_vert_format, self.fill_border_vert_attributes,
+                    self.fill_border_instance_format, self.fill_border_instance_attributes,
+                ),
+                (
+                    self.fill_depth_program,
+                    self.fill_depth_vert_format, self.fill_depth_vert_attributes,
+                    self.fill_depth_instance_format, self.fill_depth_instance_attributes,
+                ),
+            ]
+        ]
+        self.vaos = [self.stroke_vao, self.fill_vao, self.fill_border_vao, self.fill_depth_vao]
+
+    def render_vao(self, vao: VertexArray) -> None:
+        if self.n_verts > 0 and self.n_instances > 0:
+            vao.render(vertices=self.n_verts, instances=self.n_instances)
+            ShaderWrapper.n_draw_calls += 1
+
+    def release(self):
+        if self.instance_vbo is not None:
+            self.instance_vbo.release()
+        super().release()
@@ -0,0 +1,13 @@
+#ifndef CAMERA_UNIFORMS
+#define CAMERA_UNIFORMS
+// Written once per frame by the camera, into a buffer shared by all
+// programs, see Camera.refresh_uniforms, so the layout must match there
+layout(std140) uniform CameraUniforms {
+    mat4 view;
+    vec3 frame_rescale_factors;
+    float frame_scale;
+    vec3 camera_position;
+    float pixel_size;
+    vec3 light_position;
+};
+#endif
@@ -1,5 +1,5 @@
-uniform vec3 light_position;
-uniform vec3 camera_position;
+#INSERT camera_uniforms.glsl
+
 uniform vec3 shading;
 
 vec3 float_to_color(float value, float min_val, float max_val, vec3[9] colormap_data){
@@ -1,5 +1,7 @@
 #version 330
 
+uniform mat4 model_matrix;
+
 in vec3 point;
 in vec3 base_normal;
 
@@ -9,4 +11,8 @@ out vec3 v_base_point;
 void main(){
     verts = point;
     v_base_point = base_normal;
+
+    // Apply any pending lazy transform of the mobject
+    verts = (model_matrix * vec4(verts, 1.0)).xyz;
+    v_base_point = (model_matrix * vec4(v_base_point, 1.0)).xyz;
 }
\ No newline at end of file
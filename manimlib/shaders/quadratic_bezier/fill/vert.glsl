@@ -1,5 +1,7 @@
 #version 330
 
+uniform mat4 model_matrix;
+
 in vec3 point;
 in vec4 fill_rgba;
 in vec3 base_normal;
@@ -12,4 +14,14 @@ void main(){
     verts = point;
     v_color = fill_rgba;
     v_base_normal = base_normal;
+
+    // Apply any pending lazy transform of the mobject, which is a rotation
+    // with uniform scaling. Within each triangle, the second vertex carries
+    // the unit normal, and the others the base point.
+    verts = (model_matrix * vec4(verts, 1.0)).xyz;
+    if(gl_VertexID % 3 == 1){
+        v_base_normal = normalize(mat3(model_matrix) * v_base_normal);
+    }else{
+        v_base_normal = (model_matrix * vec4(v_base_normal, 1.0)).xyz;
+    }
 }
\ No newline at end of file
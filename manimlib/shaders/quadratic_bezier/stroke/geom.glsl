@@ -3,11 +3,11 @@
 layout (triangles) in;
 layout (triangle_strip, max_vertices = 64) out;  // Related to MAX_STEPS below
 
+#INSERT camera_uniforms.glsl
+
 uniform float anti_alias_width;
 uniform float flat_stroke;
-uniform float pixel_size;
 uniform float joint_type;
-uniform float frame_scale;
 
 in vec3 verts[3];
 
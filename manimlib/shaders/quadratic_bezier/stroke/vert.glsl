@@ -1,8 +1,10 @@
 #version 330
 
-uniform float frame_scale;
+#INSERT camera_uniforms.glsl
+
 uniform float is_fixed_in_frame;
 uniform float scale_stroke_with_zoom;
+uniform mat4 model_matrix;
 
 in vec3 point;
 in vec4 stroke_rgba;
@@ -26,4 +28,10 @@ void main(){
     v_stroke_width = STROKE_WIDTH_CONVERSION * stroke_width * mix(frame_scale, 1, scale_stroke_with_zoom);
     v_joint_angle = joint_angle;
     v_unit_normal = unit_normal;
+
+    // Apply any pending lazy transform of the mobject, which is a rotation
+    // with uniform scaling. Within each triangle, the second vertex is the
+    // one whose unit normal is used.
+    verts = (model_matrix * vec4(verts, 1.0)).xyz;
+    if(gl_VertexID % 3 == 1) v_unit_normal = normalize(mat3(model_matrix) * v_unit_normal);
 }
\ No newline at end of file
@@ -3,10 +3,9 @@
 layout (points) in;
 layout (triangle_strip, max_vertices = 4) out;
 
-uniform float pixel_size;
+#INSERT camera_uniforms.glsl
+
 uniform float anti_alias_width;
-uniform float frame_scale;
-uniform vec3 camera_position;
 
 in vec3 v_point[1];
 in float v_radius[1];
@@ -18,6 +18,10 @@ def get_cache_dir() -> str:
     return get_directories()["cache"] or appdirs.user_cache_dir("manim")
 
 
+def get_shader_cache_dir() -> str:
+    return get_directories()["shader_cache"] or os.path.join(get_cache_dir(), "shader_programs")
+
+
 def get_temp_dir() -> str:
     return get_directories()["temporary_storage"] or tempfile.gettempdir()
 
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import hashlib
+import inspect
+import types
+
+import numpy as np
+from colour import Color
+
+from manimlib.animation.animation import Animation
+from manimlib.mobject.mobject import Mobject
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+# How deep to follow closures, default arguments and globals of
+# functions (e.g. updaters or rate functions) when hashing them
+MAX_FUNCTION_DEPTH = 3
+
+
+class Unhashable(Exception):
+    """
+    Raised for objects whose state can't be described, so that whatever
+    they're part of can be treated as uncacheable, rather than as matching
+    anything else of the same type
+    """
+    pass
+
+
+def update_hash_with_object(hasher, obj: Any, memo: set[int] | None = None, depth: int = 0) -> None:
+    """
+    Feeds a description of obj into hasher, in a way which is stable across
+    runs. This is meant for detecting whether two pieces of scene construction
+    (mobjects, animations, updaters, etc.) would look the same, so mobjects
+    are hashed by their data, animations by their attributes, and functions
+    by their code, along with anything they close over or read from globals.
+
+    Other objects are described by their type along with their state, as
+    given by __getstate__ or __dict__, and Unhashable is raised for any
+    whose state can't be found this way.
+    """
+    if memo is None:
+        memo = set()
+
+    def update(*strings: str):
+        for string in strings:
+            hasher.update(string.encode())
+
+    if obj is None or isinstance(obj, (bool, int, float, complex, str)):
+        update(type(obj).__name__, repr(obj))
+    elif isinstance(obj, bytes):
+        hasher.update(obj)
+    elif isinstance(obj, np.ndarray):
+        update(obj.dtype.str, str(obj.shape))
+        if obj.dtype == object:
+            for elem in obj.flat:
+                update_hash_with_object(hasher, elem, memo, depth)
+        else:
+            hasher.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, np.generic):
+        update(repr(obj))
+    elif isinstance(obj, Color):
+        update("Color", obj.get_hex_l())
+    elif isinstance(obj, (list, tuple)):
+        update(type(obj).__name__, "(")
+        for elem in obj:
+            update_hash_with_object(hasher, elem, memo, depth)
+        update(")")
+    elif isinstance(obj, dict):
+        update("{")
+        for key in sorted(obj.keys(), key=str):
+            update(str(key), ":")
+            update_hash_with_object(hasher, obj[key], memo, depth)
+        update("}")
+    elif isinstance(obj, (set, frozenset)):
+        update("set", *sorted(map(repr, obj)))
+    elif id(obj) in memo:
+        # Already described, this is just another reference to it
+        update("ref", type(obj).__qualname__)
+    elif isinstance(obj, Mobject):
+        memo.add(id(obj))
+        update_hash_with_mobject(hasher, obj, memo)
+    elif isinstance(obj, Animation):
+        memo.add(id(obj))
+        update(type(obj).__module__, type(obj).__qualname__)
+        update_hash_with_object(hasher, dict(vars(obj)), memo, depth)
+    elif isinstance(obj, (types.FunctionType, types.MethodType, types.BuiltinFunctionType)):
+        memo.add(id(obj))
+        update_hash_with_function(hasher, obj, memo, depth)
+    elif isinstance(obj, type):
+        update("type", obj.__module__, obj.__qualname__)
+    elif isinstance(obj, types.ModuleType):
+        update("module", obj.__name__)
+    elif is_scene(obj):
+        # What of the scene affects rendering is hashed separately
+        update("scene", type(obj).__qualname__)
+    else:
+        memo.add(id(obj))
+        update("object", type(obj).__module__, type(obj).__qualname__)
+        update_hash_with_object(hasher, get_object_state(obj), memo, depth)
+
+
+def is_scene(obj: Any) -> bool:
+    # Imported here, as scenes import this module
+    from manimlib.scene.scene import Scene
+    return isinstance(obj, Scene)
+
+
+def get_object_state(obj: Any) -> Any:
+    if isinstance(obj, (types.GeneratorType, types.CoroutineType)):
+        raise Unhashable(type(obj).__qualname__)
+    getstate = getattr(obj, "__getstate__", None)
+    if getstate is not None:
+        try:
+            return getstate()
+        except TypeError as err:
+            # E.g. objects wrapping resources, which can't be pickled
+            raise Unhashable(type(obj).__qualname__) from err
+    if hasattr(obj, "__dict__"):
+        return dict(vars(obj))
+    raise Unhashable(type(obj).__qualname__)
+
+
+def update_hash_with_mobject(hasher, mobject: Mobject, memo: set[int]) -> None:
+    for mob in mobject.get_family():
+        memo.add(id(mob))
+        hasher.update(type(mob).__qualname__.encode())
+        hasher.update(str(len(mob.submobjects)).encode())
+        # Use the shader data, rather than the data itself, so that any
+        # lazily computed values (e.g. joint angles) are filled in
+        update_hash_with_object(hasher, mob.get_shader_data() if mob.has_points() else mob.get_data(), memo)
+        update_hash_with_object(hasher, mob.uniforms, memo)
+        update_hash_with_object(hasher, mob.shader_code_replacements, memo)
+        update_hash_with_object(hasher, [
+            mob.shader_folder,
+            mob.texture_paths,
+            mob.depth_test,
+            mob.z_index,
+            mob.updating_suspended,
+        ], memo)
+        for updater in mob.updaters:
+            update_hash_with_object(hasher, updater, memo)
+
+
+def update_hash_with_function(hasher, func, memo: set[int], depth: int) -> None:
+    if isinstance(func, types.MethodType):
+        update_hash_with_object(hasher, func.__self__, memo, depth)
+        func = func.__func__
+    hasher.update(f"{getattr(func, '__module__', '')}.{func.__qualname__}".encode())
+
+    code = getattr(func, "__code__", None)
+    if code is None:
+        # Builtins have no code to inspect
+        return
+    update_hash_with_code(hasher, code)
+
+    if depth >= MAX_FUNCTION_DEPTH:
+        return
+    func_globals = getattr(func, "__globals__", dict())
+    for name in sorted(get_global_names(code)):
+        if name in func_globals:
+            hasher.update(name.encode())
+            update_hash_with_object(hasher, func_globals[name], memo, depth + 1)
+    update_hash_with_object(hasher, func.__defaults__, memo, depth + 1)
+    update_hash_with_object(hasher, func.__kwdefaults__, memo, depth + 1)
+    for cell in func.__closure__ or ():
+        try:
+            contents = cell.cell_contents
+        except ValueError:
+            # Empty cell
+            continue
+        update_hash_with_object(hasher, contents, memo, depth + 1)
+
+
+def get_global_names(code: types.CodeType) -> set[str]:
+    """
+    Names which the code, or any code nested within it, may read from
+    globals, along with names of attributes, which can't be told apart
+    """
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names.update(get_global_names(const))
+    return names
+
+
+def update_hash_with_code(hasher, code: types.CodeType) -> None:
+    hasher.update(code.co_code)
+    hasher.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            update_hash_with_code(hasher, const)
+        else:
+            hasher.update(repr(const).encode())
+
+
+def get_source_file(cls: type) -> str | None:
+    # Modules loaded straight from a file, as scene files are, aren't
+    # in sys.modules, so inspect may not find them from the class alone
+    try:
+        return inspect.getsourcefile(cls)
+    except TypeError:
+        pass
+    for value in vars(cls).values():
+        if isinstance(value, types.FunctionType):
+            return value.__code__.co_filename
+    return None
+
+
+def hash_source_file(cls: type) -> str:
+    """
+    Hash of the full source file in which cls (e.g. a scene class)
+    is defined, or of the empty string if it can't be found
+    """
+    try:
+        with open(get_source_file(cls), "rb") as fp:
+            source = fp.read()
+    except (TypeError, OSError):
+        source = b""
+    return hashlib.sha256(source).hexdigest()
+
+
+def hash_objects(*objects: Any, n_bytes: int = 16) -> str | None:
+    """
+    Hash of the objects, as described by update_hash_with_object,
+    or None if any of them can't be described
+    """
+    hasher = hashlib.sha256()
+    memo = set()
+    try:
+        for obj in objects:
+            update_hash_with_object(hasher, obj, memo)
+    except Unhashable:
+        return None
+    return hasher.hexdigest()[:n_bytes]
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from contextlib import nullcontext
+from functools import wraps
+import json
+import os
+import threading
+import time
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Callable, TypeVar
+    from manimlib.mobject.mobject import Mobject
+
+    T = TypeVar("T")
+
+
+class RenderProfiler(object):
+    """
+    Records how long each phase of rendering takes, for finding out where
+    the time in a slow scene is going. Sections are timed with
+
+        with PROFILER.section(name, category):
+            ...
+
+    or by decorating functions with profile(category). While disabled,
+    which is the default, these do nothing beyond a single check. Names
+    which take work to build can be given as functions returning them,
+    which are then only called while enabled.
+
+    The results can be written as a Chrome trace, which can be opened
+    with chrome://tracing or https://ui.perfetto.dev, or summarized as text.
+    """
+    def __init__(self):
+        self.enabled: bool = False
+        self.reset()
+
+    def reset(self) -> None:
+        self.start_time: float = time.perf_counter()
+        # Each as (name, category, start, end, thread id)
+        self.events: list[tuple[str, str, float, float, int]] = []
+        # Values of counters, like draw calls per frame, each as (name, time, value)
+        self.counts: list[tuple[str, float, float]] = []
+
+    def enable(self) -> None:
+        self.reset()
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def section(self, name: str | Callable[[], str], category: str = "phase"):
+        if not self.enabled:
+            return nullcontext()
+        if callable(name):
+            name = name()
+        return _ProfiledSection(self, name, category)
+
+    def add_event(self, name: str, category: str, start: float, end: float) -> None:
+        # Appending is atomic, so sections may be timed from any thread
+        self.events.append((name, category, start, end, threading.get_ident()))
+
+    def add_count(self, name: str, value: float) -> None:
+        self.counts.append((name, time.perf_counter(), value))
+
+    def write_chrome_trace(self, file_path: str) -> None:
+        pid = os.getpid()
+        trace_events = [
+            dict(
+                name=name,
+                cat=category,
+                ph="X",
+                ts=1e6 * (start - self.start_time),
+                dur=1e6 * (end - start),
+                pid=pid,
+                tid=tid,
+            )
+            for name, category, start, end, tid in self.events
+        ]
+        trace_events.extend(
+            dict(
+                name=name,
+                ph="C",
+                ts=1e6 * (timestamp - self.start_time),
+                pid=pid,
+                args={name: value},
+            )
+            for name, timestamp, value in self.counts
+        )
+        with open(file_path, "w") as fp:
+            json.dump(dict(traceEvents=trace_events, displayTimeUnit="ms"), fp)
+
+    def get_totals(self, category: str) -> dict[str, tuple[int, float]]:
+        """
+        Number of calls and total time, in seconds, of each
+        differently named section within the given category
+        """
+        counts = defaultdict(int)
+        totals = defaultdict(float)
+        for name, cat, start, end, tid in self.events:
+            if cat == category:
+                counts[name] += 1
+                totals[name] += end - start
+        return {name: (counts[name], totals[name]) for name in counts}
+
+    def get_summary(self, title: str = "Render profile") -> str:
+        frame_counts = self.get_totals("frame")
+        n_frames = sum(count for count, total in frame_counts.values())
+        frame_time = sum(total for count, total in frame_counts.values())
+        elapsed = (self.events[-1][3] - self.start_time) if self.events else 0
+        lines = [
+            title,
+            f"{elapsed:.2f}s in total, {n_frames} frames rendered in {frame_time:.2f}s" + (
+                f" ({n_frames / frame_time:.1f} fps)" if frame_time > 0 else ""
+            ),
+        ]
+        count_values = defaultdict(list)
+        for name, timestamp, value in self.counts:
+            count_values[name].append(value)
+        for name, values in count_values.items():
+            lines.append(f"{name}: {sum(values) / len(values):.1f} per frame on average, at most {max(values):g}")
+
+        # Times for nested sections include those of their subsections
+        for category, heading in [
+            ("play", "Per play"),
+            ("phase", "Per phase"),
+            ("animation", "Per animation class"),
+            ("mobject", "Per top level mobject class"),
+        ]:
+            totals = self.get_totals(category)
+            if not totals:
+                continue
+            lines.append("")
+            lines.append(f"{heading:<44} {'calls':>8} {'total (s)':>10} {'mean (ms)':>10}")
+            items = totals.items()
+            if category != "play":
+                # Plays are listed in order, everything else by time spent
+                items = sorted(items, key=lambda item: -item[1][1])
+            for name, (count, total) in items:
+                if len(name) > 42:
+                    name = name[:39] + "..."
+                lines.append(
+                    f"  {name:<42} {count:>8} {total:>10.3f} {1000 * total / count:>10.3f}"
+                )
+        return "\n".join(lines)
+
+
+class _ProfiledSection(object):
+    __slots__ = ("profiler", "name", "category", "start")
+
+    def __init__(self, profiler: RenderProfiler, name: str, category: str):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.add_event(self.name, self.category, self.start, time.perf_counter())
+
+
+# This is supposed to be a Singleton, shared by everything being profiled
+PROFILER = RenderProfiler()
+
+
+def profile(category: str = "phase", by_class: bool = False) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Decorator for methods whose calls should be timed by the profiler. Sections
+    are named after the method's qualified name, or if by_class is True, after
+    the class of the object it's called on, so that subclasses are told apart.
+    """
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not PROFILER.enabled:
+                return func(self, *args, **kwargs)
+            if by_class:
+                name = f"{type(self).__name__}.{func.__name__}"
+            else:
+                name = func.__qualname__
+            with PROFILER.section(name, category):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def get_mobject_label(mobject: Mobject) -> str:
+    # Scenes render their mobjects in groups of those with the same type,
+    # in which case it's that type which is informative
+    submobs = mobject.submobjects
+    if submobs and type(mobject) is submobs[0].get_group_class():
+        return type(submobs[0]).__name__
+    return type(mobject).__name__
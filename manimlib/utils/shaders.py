@@ -3,10 +3,12 @@ from __future__ import annotations
 import os
 import re
 from functools import lru_cache
+import weakref
 import moderngl
 from PIL import Image
 import numpy as np
 
+from manimlib.utils.directories import get_shader_cache_dir
 from manimlib.utils.directories import get_shader_dir
 from manimlib.utils.file_ops import find_file
 
@@ -16,8 +18,48 @@ if TYPE_CHECKING:
     from typing import Sequence, Optional
 
 
-# Global maps to reflect uniform status
-PROGRAM_UNIFORM_MIRRORS: dict[int, dict[str, float | tuple]] = dict()
+# Global maps to reflect uniform status. These are keyed by the programs
+# themselves, rather than their ids, which those created later may reuse
+# once programs evicted from get_shader_program's cache are collected
+PROGRAM_UNIFORM_MIRRORS: weakref.WeakKeyDictionary[moderngl.Program, dict[str, float | tuple]] = weakref.WeakKeyDictionary()
+
+# Uniform block declared in inserts/camera_uniforms.glsl, which all programs
+# read from a single buffer bound to this binding point, see Camera.refresh_uniforms
+CAMERA_UNIFORM_BLOCK = "CameraUniforms"
+CAMERA_UNIFORM_BINDING = 0
+
+# Environment variables with which OpenGL drivers take a directory to keep
+# compiled shader programs in between runs, for Mesa (including llvmpipe),
+# older versions of Mesa, and Nvidia respectively
+SHADER_CACHE_DIR_VARIABLES = [
+    "MESA_SHADER_CACHE_DIR",
+    "MESA_GLSL_CACHE_DIR",
+    "__GL_SHADER_DISK_CACHE_PATH",
+]
+
+
+def use_shader_program_cache() -> None:
+    """
+    Has the OpenGL driver keep the binaries of the programs it compiles within
+    manim's cache directory, so that later runs load them rather than compiling
+    them again, which can take seconds with software rendering. This needs to
+    be called before the driver is loaded, which may happen as soon as the
+    window module is imported, so it's called on importing manimlib.
+
+    Moderngl can only create programs from source, so the binaries are kept
+    by the driver's own cache, rather than through glProgramBinary. It keys
+    them by a hash of the source along with the driver's build, and compiles
+    from source whenever there's no binary matching both.
+    """
+    cache_dir = get_shader_cache_dir()
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError:
+        # Leave the driver to its default
+        return
+    for variable in SHADER_CACHE_DIR_VARIABLES:
+        # Those set by the user take precedence
+        os.environ.setdefault(variable, cache_dir)
 
 
 @lru_cache()
@@ -37,11 +79,18 @@ def get_shader_program(
         fragment_shader: Optional[str] = None,
         geometry_shader: Optional[str] = None,
 ) -> moderngl.Program:
-    return ctx.program(
+    program = ctx.program(
         vertex_shader=vertex_shader,
         fragment_shader=fragment_shader,
         geometry_shader=geometry_shader,
     )
+    if uses_camera_uniform_block(program):
+        program[CAMERA_UNIFORM_BLOCK].binding = CAMERA_UNIFORM_BINDING
+    return program
+
+
+def uses_camera_uniform_block(program: moderngl.Program) -> bool:
+    return isinstance(program.get(CAMERA_UNIFORM_BLOCK, None), moderngl.UniformBlock)
 
 
 def set_program_uniform(
@@ -58,10 +107,9 @@ def set_program_uniform(
     Returns True if changed the program, False if it left it as is.
     """
 
-    pid = id(program)
-    if pid not in PROGRAM_UNIFORM_MIRRORS:
-        PROGRAM_UNIFORM_MIRRORS[pid] = dict()
-    uniform_mirror = PROGRAM_UNIFORM_MIRRORS[pid]
+    if program not in PROGRAM_UNIFORM_MIRRORS:
+        PROGRAM_UNIFORM_MIRRORS[program] = dict()
+    uniform_mirror = PROGRAM_UNIFORM_MIRRORS[program]
 
     if type(value) is np.ndarray and value.ndim > 0:
         value = tuple(value.flatten())
@@ -1,14 +1,10 @@
 from __future__ import annotations
 
-from functools import reduce
 import math
-import operator as op
-import platform
 
 from mapbox_earcut import triangulate_float32 as earcut
 import numpy as np
 from scipy.spatial.transform import Rotation
-from tqdm.auto import tqdm as ProgressDisplay
 
 from manimlib.constants import DOWN, OUT, RIGHT, UP
 from manimlib.constants import PI, TAU
@@ -415,7 +411,94 @@ def norm_squared(v: VectN | List[float]) -> float:
     return sum(x * x for x in v)
 
 
+def get_ring_winding_numbers(
+    verts: Vect2Array,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    points: Vect2Array,
+) -> np.ndarray:
+    """
+    Winding number of each ring of verts, given by start and end indices, around
+    the corresponding point, computed for all rings and points at once
+    """
+    lengths = ends - starts
+    if lengths.sum() == 0:
+        return np.zeros(len(starts))
+    # Indices into verts of all the rings laid end to end, along with
+    # the index of each vertex's successor around its ring
+    offsets = np.cumsum(lengths) - lengths
+    positions = np.arange(lengths.sum()) - np.repeat(offsets, lengths)
+    indices = np.repeat(starts, lengths) + positions
+    next_indices = np.repeat(starts, lengths) + (positions + 1) % np.repeat(lengths, lengths)
+
+    rel_points = np.repeat(points, lengths, axis=0)
+    angles = np.arctan2(*(verts[indices] - rel_points).T[::-1])
+    next_angles = np.arctan2(*(verts[next_indices] - rel_points).T[::-1])
+    d_angles = ((next_angles - angles + PI) % TAU) - PI
+    return np.add.reduceat(d_angles, offsets) / TAU
+
+
 # TODO, fails for polygons drawn over themselves
+def get_ring_children(
+    verts: Vect3Array | Vect2Array,
+    ring_starts: np.ndarray,
+    ring_ends: np.ndarray,
+) -> tuple[np.ndarray, list[list[int]]]:
+    """
+    Returns the indices of the rings sorted from largest to smallest area,
+    along with a list for each ring of those directly within it, i.e. the
+    rings it contains which no smaller ring containing them does
+    """
+    n_rings = len(ring_ends)
+    epsilon = 1e-6
+
+    xs, ys = verts[:, 0], verts[:, 1]
+    left = np.minimum.reduceat(xs, ring_starts)
+    right = np.maximum.reduceat(xs, ring_starts)
+    bottom = np.minimum.reduceat(ys, ring_starts)
+    top = np.maximum.reduceat(ys, ring_starts)
+    # Twice the area of each ring, leaving out terms between one ring and the next
+    area_terms = np.zeros(len(verts), dtype=verts.dtype)
+    area_terms[:-1] = cross2d(verts[1:, :2], verts[:-1, :2])
+    area_terms[ring_ends[ring_ends < len(verts)] - 1] = 0
+    area = np.abs(np.add.reduceat(area_terms, ring_starts))
+
+    # The larger ring must be outside
+    rings_sorted = np.argsort(-area, kind="stable")
+
+    # Ring b can only contain ring a if it comes earlier in this order, and its
+    # bounding box holds that of a. For those which pass this test, whether a's
+    # first point is within b is then checked all at once. Each ring's parent is
+    # the last which passes both, and this works through the rings in blocks to
+    # bound the memory used.
+    parents = np.full(n_rings, -1)
+    lrbt = np.array([left, right, bottom, top])[:, rings_sorted]
+    block_size = max(1, 2**22 // max(n_rings, 1))
+    for b0 in range(0, n_rings, block_size):
+        block = np.arange(b0, min(b0 + block_size, n_rings))
+        bl, br, bb, bt = lrbt[:, block, np.newaxis]
+        fits = (lrbt[0] <= bl) & (br <= lrbt[1]) & (lrbt[2] <= bb) & (bt <= lrbt[3])
+        fits &= np.arange(n_rings) < block[:, np.newaxis]
+        pos_a, pos_b = np.nonzero(fits)
+        if len(pos_a) == 0:
+            continue
+        ring_a = rings_sorted[block[pos_a]]
+        ring_b = rings_sorted[pos_b]
+        winding = get_ring_winding_numbers(
+            verts[:, :2], ring_starts[ring_b], ring_ends[ring_b],
+            verts[ring_starts[ring_a], :2],
+        )
+        is_in = np.abs(np.abs(winding) - 1) < epsilon
+        # Of those containing each ring, keep the last in sorted order
+        np.maximum.at(parents, ring_a[is_in], pos_b[is_in])
+
+    children = [[] for i in range(n_rings)]
+    for i in rings_sorted:
+        if parents[i] >= 0:
+            children[rings_sorted[parents[i]]].append(i)
+    return rings_sorted, children
+
+
 def earclip_triangulation(verts: Vect3Array | Vect2Array, ring_ends: list[int]) -> list[int]:
     """
     Returns a list of indices giving a triangulation
@@ -426,79 +509,36 @@ def earclip_triangulation(verts: Vect3Array | Vect2Array, ring_ends: list[int])
     - ring_ends is a list of indices indicating where
     the ends of new paths are
     """
-
-    rings = [
-        list(range(e0, e1))
-        for e0, e1 in zip([0, *ring_ends], ring_ends)
-    ]
+    ring_ends = np.array(ring_ends, dtype=int)
+    ring_starts = np.array([0, *ring_ends[:-1]], dtype=int)
     epsilon = 1e-6
 
-    def is_in(point, ring_id):
-        return abs(abs(get_winding_number([i - point for i in verts[rings[ring_id]]])) - 1) < epsilon
-
-    def ring_area(ring_id):
-        ring = rings[ring_id]
-        s = 0
-        for i, j in zip(ring[1:], ring):
-            s += cross2d(verts[i], verts[j])
-        return abs(s) / 2
-
     # Points at the same position may cause problems
-    for i in rings:
-        if len(i) < 2:
-            continue
-        verts[i[0]] += (verts[i[1]] - verts[i[0]]) * epsilon
-        verts[i[-1]] += (verts[i[-2]] - verts[i[-1]]) * epsilon
+    long_rings = (ring_ends - ring_starts) >= 2
+    s0, e0 = ring_starts[long_rings], ring_ends[long_rings]
+    verts[s0] += (verts[s0 + 1] - verts[s0]) * epsilon
+    verts[e0 - 1] += (verts[e0 - 2] - verts[e0 - 1]) * epsilon
 
     # First, we should know which rings are directly contained in it for each ring
-
-    right = [max(verts[rings[i], 0]) for i in range(len(rings))]
-    left = [min(verts[rings[i], 0]) for i in range(len(rings))]
-    top = [max(verts[rings[i], 1]) for i in range(len(rings))]
-    bottom = [min(verts[rings[i], 1]) for i in range(len(rings))]
-    area = [ring_area(i) for i in range(len(rings))]
-
-    # The larger ring must be outside
-    rings_sorted = list(range(len(rings)))
-    rings_sorted.sort(key=lambda x: area[x], reverse=True)
-
-    def is_in_fast(ring_a, ring_b):
-        # Whether a is in b
-        return reduce(op.and_, (
-            left[ring_b] <= left[ring_a] <= right[ring_a] <= right[ring_b],
-            bottom[ring_b] <= bottom[ring_a] <= top[ring_a] <= top[ring_b],
-            is_in(verts[rings[ring_a][0]], ring_b)
-        ))
-
-    chilren = [[] for i in rings]
-    ringenum = ProgressDisplay(
-        enumerate(rings_sorted),
-        total=len(rings),
-        leave=False,
-        ascii=True if platform.system() == 'Windows' else None,
-        dynamic_ncols=True,
-        desc="SVG Triangulation",
-        delay=3,
-    )
-    for idx, i in ringenum:
-        for j in rings_sorted[:idx][::-1]:
-            if is_in_fast(i, j):
-                chilren[j].append(i)
-                break
+    rings_sorted, children = get_ring_children(verts, ring_starts, ring_ends)
 
     res = []
 
     # Then, we can use earcut for each part
-    used = [False] * len(rings)
+    used = [False] * len(ring_ends)
     for i in rings_sorted:
         if used[i]:
             continue
-        v = rings[i]
-        ring_ends = [len(v)]
-        for j in chilren[i]:
+        v = list(range(ring_starts[i], ring_ends[i]))
+        part_ends = [len(v)]
+        for j in children[i]:
             used[j] = True
-            v += rings[j]
-            ring_ends.append(len(v))
-        res += [v[i] for i in earcut(verts[v, :2], ring_ends)]
+            v += range(ring_starts[j], ring_ends[j])
+            part_ends.append(len(v))
+        tri_indices = earcut(
+            verts[v, :2].astype(np.float32),
+            np.array(part_ends, dtype=np.uint32),
+        )
+        res += [v[i] for i in tri_indices]
 
     return res
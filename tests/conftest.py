@@ -0,0 +1,20 @@
+import sys
+
+import pytest
+
+# manimlib builds its configuration from the command line when it's first
+# imported, which should be that of a plain run, rather than of pytest
+sys.argv = sys.argv[:1]
+
+
+@pytest.fixture
+def make_scene():
+    from manimlib.scene.scene import Scene
+
+    def make_scene(scene_class=Scene, **kwargs):
+        kwargs.setdefault("camera_config", dict(resolution=(64, 36)))
+        return scene_class(
+            file_writer_config=dict(write_to_movie=False, save_last_frame=False, quiet=True),
+            **kwargs
+        )
+    return make_scene
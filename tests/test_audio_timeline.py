@@ -0,0 +1,23 @@
+import numpy as np
+from pydub import AudioSegment
+from pydub.generators import Sine
+
+from manimlib.scene.audio_timeline import AudioTimeline
+
+
+def test_8_bit_silence_mixes_to_zeros():
+    timeline = AudioTimeline()
+    silence = AudioSegment.silent(duration=200, frame_rate=8000).set_sample_width(1)
+    timeline.add_segment(silence, 0)
+    timeline.add_segment(silence, 0.1)
+    track, frame_rate = timeline.mix()
+    assert frame_rate == 8000
+    assert track.shape == (2400, 1)
+    assert np.all(track == 0)
+
+
+def test_mixed_sample_widths_agree():
+    tone = Sine(440).to_audio_segment(duration=100, volume=-6).set_frame_rate(8000)
+    samples_16 = AudioTimeline.get_samples(tone.set_sample_width(2), 8000, 1)
+    samples_8 = AudioTimeline.get_samples(tone.set_sample_width(1), 8000, 1)
+    assert np.allclose(samples_16, samples_8, atol=2**-6)
@@ -0,0 +1,52 @@
+import numpy as np
+
+from manimlib.constants import RED, RIGHT
+from manimlib.mobject.geometry import Square
+from manimlib.mobject.types.vectorized_mobject import VGroup
+
+
+def test_points_can_be_edited_in_place_after_copying():
+    square = Square()
+    points = square.get_points().copy()
+    copy = square.copy()
+
+    square.get_points()[0] += 1
+    copy.get_points()[1] -= 1
+    assert np.allclose(square.get_points()[0], points[0] + 1)
+    assert np.allclose(square.get_points()[1], points[1])
+    assert np.allclose(copy.get_points()[0], points[0])
+    assert np.allclose(copy.get_points()[1], points[1] - 1)
+
+
+def test_style_can_be_edited_in_place_after_copying():
+    square = Square(stroke_width=4)
+    copy = square.copy()
+    copy.get_stroke_widths()[:] = 10
+    assert (square.get_stroke_widths() == 4).all()
+    assert (copy.get_stroke_widths() == 10).all()
+
+
+def test_reading_leaves_data_shared():
+    group = VGroup(*(Square() for _ in range(3)))
+    # Joint angles are computed when first needed, after which they're only read
+    for mob in group:
+        mob.get_shader_data()
+    copy = group.copy()
+    for mob in group:
+        mob.get_color()
+        mob.get_fill_opacity()
+        mob.get_style()
+        mob.get_shader_data()
+    group.copy().shift(RIGHT).interpolate(group, copy, 0.5)
+    assert all(
+        sm1.get_data() is sm2.get_data()
+        for sm1, sm2 in zip(group, copy)
+    )
+
+
+def test_edits_leave_copies_unchanged():
+    square = Square()
+    copy = square.copy()
+    square.set_color(RED).shift(RIGHT)
+    assert copy.get_color() != square.get_color()
+    assert np.allclose(copy.get_center(), 0)
@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+
+from manimlib.constants import BLUE, DOWN, GREEN, IN, LEFT, OUT, RED, RIGHT, UP, YELLOW
+from manimlib.mobject.geometry import Circle
+from manimlib.mobject.geometry import Rectangle
+from manimlib.mobject.geometry import Square
+from manimlib.shader_wrapper import VShaderWrapper
+
+
+# Consecutive mobjects alternate between types, so that each is drawn by its
+# own shader wrapper, rather than all being batched into one render group
+
+
+def overlapping_fills(scene):
+    return [
+        Square(side_length=2, fill_color=RED, fill_opacity=0.6, stroke_width=0),
+        Circle(radius=1, fill_color=GREEN, fill_opacity=0.6, stroke_width=0).shift(0.8 * RIGHT),
+        Square(side_length=2, fill_color=BLUE, fill_opacity=0.6).shift(0.4 * RIGHT + 0.6 * UP),
+        Circle(radius=1, fill_color=YELLOW, fill_opacity=0.6, stroke_width=0).shift(0.6 * DOWN),
+    ]
+
+
+def disjoint_fills(scene):
+    # Stroked squares between the circles keep their fills from being
+    # deferred across them, unless render groups are reordered
+    circles = [
+        Circle(radius=0.6, fill_color=color, fill_opacity=0.7, stroke_width=0).shift(x * RIGHT)
+        for color, x in [(RED, -4), (GREEN, 0), (BLUE, 4)]
+    ]
+    squares = [Square(side_length=1, fill_opacity=0.5).shift(x * RIGHT + 2 * DOWN) for x in (-2, 2)]
+    return [circles[0], squares[0], circles[1], squares[1], circles[2]]
+
+
+def stroke_behind(scene):
+    rect = Rectangle(width=1, height=3, fill_color=RED, fill_opacity=0.8, stroke_width=0)
+    square = Square(side_length=1.5, fill_color=BLUE, fill_opacity=0.8)
+    square.set_stroke(YELLOW, width=160, behind=True)
+    # The fill of the square is clear of that of the rectangle, but not its backstroke
+    square.next_to(rect, RIGHT, buff=0.6)
+    return [rect, square, Circle(radius=0.5, fill_opacity=0.8, stroke_width=0).shift(4 * RIGHT)]
+
+
+def fixed_in_frame(scene):
+    # With the frame moved, the fixed square is drawn over the middle of the
+    # screen, where the last circle is, however clear of it it is in the plane
+    scene.frame.shift(3 * RIGHT)
+    left_circle = Circle(radius=1, fill_color=RED, fill_opacity=1, stroke_width=0)
+    label = Square(side_length=1.5, fill_color=YELLOW, fill_opacity=1, stroke_width=0).fix_in_frame()
+    circle = Circle(radius=0.5, fill_color=BLUE, fill_opacity=1, stroke_width=0).shift(3 * RIGHT)
+    return [left_circle, label, circle]
+
+
+def depth_tested(scene):
+    flat = Circle(radius=1.2, fill_color=YELLOW, fill_opacity=0.8, stroke_width=0).shift(LEFT)
+    back = Square(side_length=2, fill_color=RED, fill_opacity=1, stroke_width=0).shift(IN)
+    front = Circle(radius=1, fill_color=BLUE, fill_opacity=1, stroke_width=0).shift(0.8 * RIGHT + OUT)
+    # The front circle is added before the square behind it, so it only shows
+    # in front of it when depth tested
+    for mob in [back, front]:
+        mob.apply_depth_test()
+    far_circle = Circle(radius=0.5, fill_opacity=0.8, stroke_width=0).shift(4 * RIGHT)
+    return [flat, front, back, far_circle]
+
+
+@pytest.fixture
+def composite_counter(monkeypatch):
+    composites = []
+    composite_fill_canvas = VShaderWrapper.composite_fill_canvas
+
+    def counted(self, fbo):
+        composites.append(self)
+        return composite_fill_canvas(self, fbo)
+
+    monkeypatch.setattr(VShaderWrapper, "composite_fill_canvas", counted)
+    return composites
+
+
+def render(make_scene, monkeypatch, get_mobjects, reorder: bool, defer: bool):
+    with monkeypatch.context() as patch:
+        if not defer:
+            patch.setattr(VShaderWrapper, "can_follow_deferred_draw", lambda self: False)
+        scene = make_scene(
+            camera_config=dict(resolution=(240, 135)),
+            reorder_render_groups=reorder,
+        )
+        scene.add(*get_mobjects(scene))
+        scene.update_frame(force_draw=True)
+        return np.array(scene.camera.get_image(), dtype=float)
+
+
+@pytest.mark.parametrize("get_mobjects", [
+    overlapping_fills, disjoint_fills, stroke_behind, fixed_in_frame, depth_tested,
+])
+@pytest.mark.parametrize("reorder,defer", [(False, True), (True, False), (True, True)])
+def test_deferred_fills_render_as_undeferred_ones(make_scene, monkeypatch, get_mobjects, reorder, defer):
+    expected = render(make_scene, monkeypatch, get_mobjects, reorder=False, defer=False)
+    image = render(make_scene, monkeypatch, get_mobjects, reorder=reorder, defer=defer)
+    assert expected[..., :3].max() > 0
+    # Allowing for rounding at the edges of shapes
+    assert (np.abs(image - expected) > 8).mean() < 0.001
+
+
+def test_disjoint_fills_share_a_composite(make_scene, monkeypatch, composite_counter):
+    render(make_scene, monkeypatch, disjoint_fills, reorder=False, defer=False)
+    num_undeferred = len(composite_counter)
+    composite_counter.clear()
+    render(make_scene, monkeypatch, disjoint_fills, reorder=True, defer=True)
+    assert len(composite_counter) < num_undeferred
@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+from mapbox_earcut import triangulate_float32 as earcut
+
+from manimlib.utils.space_ops import cross2d
+from manimlib.utils.space_ops import earclip_triangulation
+from manimlib.utils.space_ops import get_ring_children
+from manimlib.utils.space_ops import get_winding_number
+
+
+def previous_earclip_triangulation(verts, ring_ends):
+    """
+    earclip_triangulation as it was before ring nesting was vectorized, less
+    its progress display, and returning the ring order and nesting it found
+    along with the triangulation
+    """
+    rings = [
+        list(range(e0, e1))
+        for e0, e1 in zip([0, *ring_ends], ring_ends)
+    ]
+    epsilon = 1e-6
+
+    def is_in(point, ring_id):
+        return abs(abs(get_winding_number([i - point for i in verts[rings[ring_id]]])) - 1) < epsilon
+
+    def ring_area(ring_id):
+        ring = rings[ring_id]
+        s = 0
+        for i, j in zip(ring[1:], ring):
+            s += cross2d(verts[i], verts[j])
+        return abs(s) / 2
+
+    for i in rings:
+        if len(i) < 2:
+            continue
+        verts[i[0]] += (verts[i[1]] - verts[i[0]]) * epsilon
+        verts[i[-1]] += (verts[i[-2]] - verts[i[-1]]) * epsilon
+
+    right = [max(verts[rings[i], 0]) for i in range(len(rings))]
+    left = [min(verts[rings[i], 0]) for i in range(len(rings))]
+    top = [max(verts[rings[i], 1]) for i in range(len(rings))]
+    bottom = [min(verts[rings[i], 1]) for i in range(len(rings))]
+    area = [ring_area(i) for i in range(len(rings))]
+
+    rings_sorted = list(range(len(rings)))
+    rings_sorted.sort(key=lambda x: area[x], reverse=True)
+
+    def is_in_fast(ring_a, ring_b):
+        return all((
+            left[ring_b] <= left[ring_a] <= right[ring_a] <= right[ring_b],
+            bottom[ring_b] <= bottom[ring_a] <= top[ring_a] <= top[ring_b],
+            is_in(verts[rings[ring_a][0]], ring_b)
+        ))
+
+    children = [[] for i in rings]
+    for idx, i in enumerate(rings_sorted):
+        for j in rings_sorted[:idx][::-1]:
+            if is_in_fast(i, j):
+                children[j].append(i)
+                break
+
+    res = []
+    used = [False] * len(rings)
+    for i in rings_sorted:
+        if used[i]:
+            continue
+        v = list(rings[i])
+        part_ends = [len(v)]
+        for j in children[i]:
+            used[j] = True
+            v += rings[j]
+            part_ends.append(len(v))
+        tri_indices = earcut(verts[v, :2].astype(np.float32), np.array(part_ends, dtype=np.uint32))
+        res += [v[i] for i in tri_indices]
+
+    return rings_sorted, children, res
+
+
+def get_ring(center, radius, n_points=12, clockwise=False):
+    # Closed, as the rings of a VMobject's subpaths are
+    angles = np.linspace(0, 2 * np.pi, n_points + 1)
+    if clockwise:
+        angles = -angles
+    points = np.zeros((n_points + 1, 3))
+    points[:, 0] = center[0] + radius * np.cos(angles)
+    points[:, 1] = center[1] + radius * np.sin(angles)
+    return points
+
+
+def get_targets(seed):
+    """
+    Rings nested four deep, i.e. shapes with holes holding islands with holes
+    of their own, at several places, alongside rings overlapping none, all in
+    a shuffled order and of mixed orientation
+    """
+    rng = np.random.default_rng(seed)
+    rings = []
+    for center in [(0, 0), (5, 1), (-4, 3), (1, -6)]:
+        for depth, radius in enumerate([3.0, 2.2, 1.4, 0.6]):
+            rings.append(get_ring(center, radius, clockwise=bool(depth % 2)))
+        # A second island within the outer hole
+        rings.append(get_ring((center[0] + 1.8, center[1]), 0.3))
+    for x in range(-8, 12, 4):
+        rings.append(get_ring((x, 12), rng.uniform(0.2, 1)))
+    rng.shuffle(rings)
+    verts = np.vstack(rings)
+    ring_ends = list(np.cumsum([len(ring) for ring in rings]))
+    return verts, ring_ends
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_earclip_triangulation_matches_previous_implementation(seed):
+    verts, ring_ends = get_targets(seed)
+    old_sorted, old_children, old_triangles = previous_earclip_triangulation(verts.copy(), ring_ends)
+
+    nudged_verts = verts.copy()
+    triangles = earclip_triangulation(nudged_verts, ring_ends)
+    ring_ends = np.array(ring_ends)
+    rings_sorted, children = get_ring_children(
+        nudged_verts, np.array([0, *ring_ends[:-1]]), ring_ends
+    )
+
+    assert list(rings_sorted) == old_sorted
+    assert [list(map(int, c)) for c in children] == old_children
+    # The outer ring, hole and island of each target have rings within them
+    assert sum(len(c) > 0 for c in children) == 4 * 3
+    assert len(triangles) > 0
+    assert list(map(int, triangles)) == list(map(int, old_triangles))
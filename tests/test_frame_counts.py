@@ -0,0 +1,61 @@
+import pytest
+
+from manimlib.scene import scene_frame_counts
+from manimlib.scene.scene import Scene
+from manimlib.scene.scene_frame_counts import load_play_frame_counts
+from manimlib.scene.scene_frame_counts import save_play_frame_counts
+
+
+class TwoWaits(Scene):
+    def construct(self):
+        self.wait()
+        self.wait(0.5)
+
+
+@pytest.fixture(autouse=True)
+def tmp_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(scene_frame_counts, "get_cache_dir", lambda: str(tmp_path))
+
+
+@pytest.fixture
+def ran_scene(make_scene):
+    scene = make_scene(TwoWaits)
+    scene.run()
+    return scene
+
+
+def load(scene):
+    return load_play_frame_counts(
+        type(scene),
+        scene.camera.fps,
+        scene.start_at_animation_number,
+        scene.end_at_animation_number,
+    )
+
+
+def test_runs_without_progress_display_record_nothing(ran_scene):
+    assert load(ran_scene) is None
+
+
+def test_frame_counts_for_unchanged_source_are_exact(ran_scene):
+    save_play_frame_counts(ran_scene)
+    play_frame_counts, is_exact, adds_sound = load(ran_scene)
+    assert play_frame_counts == ran_scene.play_frame_counts
+    assert len(play_frame_counts) == 2
+    assert is_exact
+    assert adds_sound is False
+
+
+def test_frame_counts_for_changed_source_are_estimates(ran_scene, monkeypatch):
+    save_play_frame_counts(ran_scene)
+    monkeypatch.setattr(scene_frame_counts, "hash_source_file", lambda scene_class: "edited")
+    play_frame_counts, is_exact, _ = load(ran_scene)
+    assert play_frame_counts == ran_scene.play_frame_counts
+    assert not is_exact
+
+
+def test_frame_counts_are_kept_per_animation_range(ran_scene):
+    save_play_frame_counts(ran_scene)
+    fps = ran_scene.camera.fps
+    assert load_play_frame_counts(TwoWaits, fps, 1, None) is None
+    assert load_play_frame_counts(TwoWaits, fps + 1) is None
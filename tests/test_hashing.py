@@ -0,0 +1,33 @@
+from manimlib.utils.hashing import hash_objects
+
+
+class Settings:
+    def __init__(self, scale):
+        self.scale = scale
+
+
+SCALE = 1.0
+
+
+def read_global():
+    return SCALE
+
+
+def test_objects_are_hashed_by_state():
+    assert hash_objects(Settings(1)) == hash_objects(Settings(1))
+    assert hash_objects(Settings(1)) != hash_objects(Settings(2))
+
+
+def test_functions_are_hashed_with_globals_they_read():
+    global SCALE
+    before = hash_objects(read_global)
+    SCALE = 2.0
+    try:
+        assert hash_objects(read_global) != before
+    finally:
+        SCALE = 1.0
+    assert hash_objects(read_global) == before
+
+
+def test_unhashable_objects_give_no_hash():
+    assert hash_objects(Settings(1), (i for i in range(3))) is None
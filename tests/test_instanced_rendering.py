@@ -0,0 +1,62 @@
+import numpy as np
+
+from manimlib.constants import BLUE, DOWN, GREEN, RED, RIGHT, UP, WHITE, YELLOW
+from manimlib.mobject.geometry import Circle
+from manimlib.mobject.geometry import Dot
+from manimlib.mobject.geometry import RegularPolygon
+from manimlib.utils.color import interpolate_color
+
+
+def render_frames(make_scene, instanced: bool):
+    scene = make_scene(camera_config=dict(resolution=(240, 135)))
+    dots = Dot(radius=0.15, fill_color=BLUE).set_stroke(WHITE, 2).get_grid(4, 8, buff=0.3)
+    dots.to_edge(UP)
+    stars = RegularPolygon(5, fill_opacity=0.8, color=RED).set_stroke(YELLOW, 3).replicate(8)
+    for i, star in enumerate(stars):
+        star.rotate(0.3 * i).scale(0.3 + 0.05 * i).move_to((1.5 * i - 5.25) * RIGHT + 2 * DOWN)
+        star.set_fill(interpolate_color(RED, GREEN, i / 8))
+    if instanced:
+        dots.use_instanced_rendering()
+        stars.use_instanced_rendering()
+    scene.add(dots, stars)
+
+    star5 = stars[5].copy()
+    images = []
+    instanced_frames = []
+    for frame in range(8):
+        dots.shift(0.05 * DOWN)
+        stars[3].rotate(0.2)
+        if frame == 3:
+            # No longer an instance, having a different number of points
+            stars[5].become(Circle(radius=0.3).move_to(stars[5]))
+        if frame == 4:
+            # Nor is one with the same number of points, moved by a map which isn't affine
+            stars[5].become(star5)
+            stars[6].apply_function(lambda p: p + 0.2 * np.sin(3 * p[[1, 0, 2]]))
+        if frame == 6:
+            stars[6].become(star5.copy().shift(1.5 * RIGHT))
+        scene.update_frame(force_draw=True)
+        images.append(np.array(scene.camera.get_image(), dtype=float))
+        if instanced:
+            ctx = scene.camera.ctx
+            instanced_frames.append([
+                group.get_instance_data(ctx) is not None
+                for group in (dots, stars)
+            ])
+    return images, instanced_frames
+
+
+def test_instanced_groups_render_as_uninstanced_ones(make_scene):
+    instanced_images, _ = render_frames(make_scene, instanced=True)
+    images, _ = render_frames(make_scene, instanced=False)
+    for instanced_image, image in zip(instanced_images, images):
+        assert image[..., :3].max() > 0
+        # Allowing for rounding at the edges of shapes
+        assert (np.abs(instanced_image - image) > 8).mean() < 0.001
+
+
+def test_groups_stop_being_instanced_while_members_are_not_instances(make_scene):
+    _, instanced_frames = render_frames(make_scene, instanced=True)
+    dots_instanced, stars_instanced = zip(*instanced_frames)
+    assert all(dots_instanced)
+    assert stars_instanced == (True, True, True, False, False, False, True, True)
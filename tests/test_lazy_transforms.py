@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from manimlib.constants import BLUE, DOWN, LEFT, RED, RIGHT, UP
+from manimlib.mobject.geometry import Circle
+from manimlib.mobject.geometry import Square
+from manimlib.mobject.mobject import Mobject
+from manimlib.mobject.types.vectorized_mobject import VGroup
+
+
+@pytest.fixture
+def bake_counter(monkeypatch):
+    bakes = []
+    apply_model_transform = Mobject.apply_model_transform
+
+    def counted(self):
+        if self._has_model_transform:
+            bakes.append(self)
+        return apply_model_transform(self)
+
+    monkeypatch.setattr(Mobject, "apply_model_transform", counted)
+    return bakes
+
+
+def render_frames(make_scene, lazy: bool):
+    scene = make_scene(camera_config=dict(resolution=(160, 90)))
+    squares = VGroup(*(Square(side_length=0.5) for _ in range(5)))
+    squares.arrange(RIGHT).set_fill(BLUE, 0.5).to_edge(UP)
+    # Drawn after the squares but clear of them, so that render groups are reordered
+    circle = Circle(radius=0.5, fill_opacity=0.5).to_edge(DOWN)
+    lone_square = Square(side_length=0.5, color=RED).to_edge(LEFT)
+    if lazy:
+        squares.use_lazy_transforms()
+    scene.add(squares, lone_square, circle)
+    images = []
+    for _ in range(10):
+        squares.shift(0.1 * DOWN).rotate(0.05).scale(1.01)
+        scene.update_frame(1 / 30, force_draw=True)
+        images.append(np.array(scene.camera.get_image(), dtype=float))
+    return scene, squares, images
+
+
+def test_rendering_leaves_lazy_transforms_pending(make_scene, bake_counter):
+    scene, squares, images = render_frames(make_scene, lazy=True)
+    assert scene.render_group_reorderings
+    assert all(sq._has_model_transform for sq in squares)
+    assert bake_counter == []
+
+
+def test_reading_style_leaves_lazy_transforms_pending(bake_counter):
+    square = Square().use_lazy_transforms()
+    square.shift(RIGHT)
+    square.get_color()
+    square.get_stroke_widths()
+    square.get_fill_opacities()
+    square.has_fill()
+    square.set_fill(RED, 0.5)
+    assert square._has_model_transform
+    assert bake_counter == []
+    assert np.allclose(square.get_center(), RIGHT)
+    assert np.allclose(square.get_points(), Square().shift(RIGHT).get_points())
+    assert bake_counter == [square]
+
+
+def test_lazy_transforms_render_as_eager_ones(make_scene):
+    _, _, lazy_images = render_frames(make_scene, lazy=True)
+    _, _, eager_images = render_frames(make_scene, lazy=False)
+    for lazy_image, eager_image in zip(lazy_images, eager_images):
+        # Allowing for rounding at the edges of shapes
+        diff = np.abs(lazy_image - eager_image)
+        assert (diff > 8).mean() < 0.001
@@ -0,0 +1,21 @@
+from manimlib.utils.profiling import RenderProfiler
+
+
+def test_section_names_are_only_built_while_enabled():
+    profiler = RenderProfiler()
+    built = []
+
+    def get_name():
+        built.append(True)
+        return "1 Waiting"
+
+    with profiler.section(get_name, "play"):
+        pass
+    assert built == []
+    assert profiler.events == []
+
+    profiler.enable()
+    with profiler.section(get_name, "play"):
+        pass
+    assert built == [True]
+    assert profiler.get_totals("play")["1 Waiting"][0] == 1
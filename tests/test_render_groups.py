@@ -0,0 +1,47 @@
+from manimlib.constants import RIGHT
+from manimlib.mobject.geometry import Square
+from manimlib.mobject.types.dot_cloud import TrueDot
+from manimlib.scene.render_groups import batch_for_rendering
+from manimlib.scene.render_groups import reorderings_are_valid
+
+
+def batch(mobjects, frame_scale=1.0):
+    return batch_for_rendering(
+        mobjects,
+        batch_key=lambda m: id(m),
+        merge_key=lambda m: type(m),
+        buff=0.01,
+        frame_scale=frame_scale,
+    )
+
+
+def test_separated_mobjects_are_batched_together():
+    squares = [Square(stroke_width=2), TrueDot(radius=0.05), Square(stroke_width=2)]
+    squares[2].shift(2.5 * RIGHT)
+    batches, reorderings = batch(squares)
+    assert len(batches) == 2
+    assert reorderings_are_valid(squares, reorderings, 0.01)
+
+
+def test_thick_strokes_keep_mobjects_apart():
+    # The bounding boxes of the squares are 0.1 apart, but not their strokes
+    squares = [Square(stroke_width=20), TrueDot(radius=0.05), Square(stroke_width=20)]
+    squares[2].shift(2.1 * RIGHT)
+    batches, reorderings = batch(squares)
+    assert len(batches) == 3
+    # Zooming out widens the strokes relative to the scene
+    squares[2].set_stroke(width=2)
+    squares[0].set_stroke(width=2)
+    assert len(batch(squares)[0]) == 2
+    assert len(batch(squares, frame_scale=5)[0]) == 3
+
+
+def test_dot_radii_keep_mobjects_apart():
+    mobjects = [TrueDot(radius=0.3), Square(), TrueDot(radius=0.3)]
+    mobjects[2].shift(0.9 * RIGHT)
+    assert len(batch(mobjects)[0]) == 3
+    mobjects[2].shift(RIGHT)
+    batches, reorderings = batch(mobjects)
+    assert len(batches) == 2
+    mobjects[2].shift(-0.9 * RIGHT)
+    assert not reorderings_are_valid(mobjects, reorderings, 0.01)
@@ -0,0 +1,88 @@
+from collections import namedtuple
+
+import numpy as np
+import pytest
+
+from manimlib.animation.rotation import Rotate
+from manimlib.constants import PI, RED, RIGHT, UP
+from manimlib.mobject.geometry import Dot
+from manimlib.mobject.geometry import Square
+from manimlib.mobject.mobject import Mobject
+from manimlib.mobject.types.vectorized_mobject import VMobject
+from manimlib.mobject.value_tracker import ValueTracker
+from manimlib.scene.scene import Scene
+from manimlib.scene.scene_checkpoints import LeftOut
+from manimlib.scene.scene_checkpoints import SceneCheckpointStore
+
+
+class CheckpointedScene(Scene):
+    def construct(self):
+        self.square = Square()
+        self.curve = VMobject()
+        self.curve.set_points_as_corners([[0, 0, 0], [1, 0, 0], [1, 1, 0]])
+        self.tracker = ValueTracker(0)
+        self.dot = Dot()
+        self.dot.add_updater(lambda m: m.next_to(self.square, UP), dependencies=[self.square])
+        self.add(self.square, self.curve, self.dot)
+        self.play(self.square.animate.shift(RIGHT))
+        self.play(self.tracker.animate.set_value(2), self.square.animate.set_color(RED))
+        self.curve.add_line_to([0, 1, 0])
+        self.play(Rotate(self.square, PI / 4))
+
+
+@pytest.fixture
+def checkpoint_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr("manimlib.scene.scene_checkpoints.get_cache_dir", lambda: str(tmp_path))
+    return tmp_path
+
+
+def test_resumed_scene_matches_full_run(make_scene, checkpoint_dir):
+    full = make_scene(CheckpointedScene, use_disk_checkpoints=True)
+    full.run()
+    resumed = make_scene(CheckpointedScene, use_disk_checkpoints=True, start_at_animation_number=2)
+    resumed.run()
+
+    assert np.allclose(resumed.square.get_points(), full.square.get_points())
+    assert resumed.square.get_color() == full.square.get_color()
+    assert np.allclose(resumed.curve.get_points(), full.curve.get_points())
+    assert np.isclose(resumed.tracker.get_value(), 2)
+    assert np.allclose(resumed.dot.get_center(), full.dot.get_center())
+    # The updater, and its dependency on the live square, are intact
+    (updater,) = resumed.dot.get_updaters()
+    assert resumed.dot.updater_dependencies[updater] == [resumed.square]
+    resumed.square.shift(UP)
+    resumed.update_mobjects(0)
+    assert np.allclose(resumed.dot.get_bottom(), resumed.square.get_top() + 0.25 * UP)
+
+
+def test_render_groups_are_not_recorded(make_scene, checkpoint_dir):
+    class RenderGroupScene(Scene):
+        def construct(self):
+            self.add(Square(), Dot())
+            registry = self.checkpoint_store.registry
+            num_recorded = registry.num_created
+            num_created = Mobject.num_created
+            self.assemble_render_groups()
+            self.num_recorded = registry.num_created - num_recorded
+            self.num_created = Mobject.num_created - num_created
+
+    scene = make_scene(RenderGroupScene, use_disk_checkpoints=True)
+    scene.run()
+    assert scene.num_recorded == 0
+    assert scene.num_created > 0
+    assert Mobject.creation_registry is None
+
+
+def test_tuple_subclasses_are_restored_or_left_out():
+    Pair = namedtuple("Pair", ["mob", "value"])
+
+    class Wrapped(tuple):
+        def __new__(cls, first, second):
+            return super().__new__(cls, (first, second))
+
+    saved, live = Square(), Square()
+    restore = lambda value: SceneCheckpointStore.restore_value(value, {saved: live}.get)
+    pair = restore(Pair(saved, 1))
+    assert type(pair) is Pair and pair.mob is live and pair.value == 1
+    assert restore((saved, 1)) == (live, 1)
+    assert isinstance(restore(Wrapped(saved, 1)), LeftOut)
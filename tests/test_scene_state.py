@@ -0,0 +1,54 @@
+import numpy as np
+
+from manimlib.constants import RIGHT
+from manimlib.mobject.geometry import Square
+from manimlib.mobject.types.vectorized_mobject import VGroup
+from manimlib.mobject.value_tracker import ValueTracker
+
+
+def test_unchanged_mobjects_share_copies(make_scene):
+    scene = make_scene()
+    square, other = Square(), Square()
+    scene.add(square, other)
+    scene.save_state()
+    square.shift(RIGHT)
+    scene.save_state()
+    last, state = scene.undo_stack[-2:]
+    assert state.mobjects_to_copies[other] is last.mobjects_to_copies[other]
+    assert state.mobjects_to_copies[square] is not last.mobjects_to_copies[square]
+    assert state.n_changes(last) == 1
+
+
+def test_uniform_only_change_is_saved(make_scene):
+    scene = make_scene()
+    square = Square()
+    group = VGroup(square)
+    scene.add(group)
+    scene.save_state()
+    versions = scene.get_render_group_versions()
+
+    square.uniforms["shading"] = np.array([0.5, 0.5, 0.5])
+    assert scene.get_render_group_versions() != versions
+    scene.save_state()
+    assert len(scene.undo_stack) == 2
+    copy = scene.undo_stack[-1].mobjects_to_copies[group]
+    assert np.allclose(copy[0].uniforms["shading"], 0.5)
+
+
+def test_interpolated_uniform_is_saved(make_scene):
+    scene = make_scene()
+    tracker = ValueTracker(0)
+    scene.add(tracker)
+    scene.save_state()
+    scene.play(tracker.animate.set_value(2), run_time=0.2)
+    scene.save_state()
+    copy = scene.undo_stack[-1].mobjects_to_copies[tracker]
+    assert np.isclose(copy.get_value(), 2)
+
+
+def test_field_of_view_change_is_noted(make_scene):
+    scene = make_scene()
+    frame = scene.frame
+    version = frame._family_version
+    frame.set_field_of_view(0.5)
+    assert frame._family_version > version
@@ -0,0 +1,27 @@
+from addict import Dict
+
+from manimlib import extract_scene
+from manimlib.scene.scene import Scene
+
+
+def test_failed_slice_discards_the_others(monkeypatch, tmp_path):
+    rendered = [tmp_path / "slice_000.mp4", tmp_path / "slice_002.mp4"]
+
+    def render_in_subprocesses(tasks, n_jobs, desc):
+        assert len(tasks) == 3
+        for path in rendered:
+            path.touch()
+        return [str(rendered[0]), None, str(rendered[1])]
+
+    def concatenate_movie_files(*args):
+        raise AssertionError("Slices shouldn't be concatenated when one failed")
+
+    monkeypatch.setattr(extract_scene, "find_play_frame_counts", lambda *args: ([10, 10, 10], True, False))
+    monkeypatch.setattr(extract_scene, "render_in_subprocesses", render_in_subprocesses)
+    monkeypatch.setattr(extract_scene, "concatenate_movie_files", concatenate_movie_files)
+
+    scene_config = Dict(start_at_animation_number=None, end_at_animation_number=None)
+    run_config = Dict(jobs=3)
+    assert not extract_scene.render_scene_in_time_slices(Scene, scene_config, run_config)
+    assert not any(path.exists() for path in rendered)
+
@@ -0,0 +1,28 @@
+import numpy as np
+
+from manimlib.constants import RIGHT
+from manimlib.mobject.geometry import Dot
+from manimlib.mobject.value_tracker import ValueTracker
+
+
+def test_reactive_updater_follows_animated_tracker(make_scene):
+    scene = make_scene(reactive_updaters=True)
+    tracker = ValueTracker(0)
+    dot = Dot()
+    dot.add_updater(lambda m: m.move_to(tracker.get_value() * RIGHT))
+    scene.add(tracker, dot)
+    scene.play(tracker.animate.set_value(3), run_time=0.5)
+    assert np.isclose(dot.get_x(), 3)
+
+
+def test_declared_dependency_follows_animated_tracker(make_scene):
+    scene = make_scene()
+    tracker = ValueTracker(0)
+    dot = Dot()
+    dot.add_updater(
+        lambda m: m.move_to(tracker.get_value() * RIGHT),
+        dependencies=[tracker],
+    )
+    scene.add(tracker, dot)
+    scene.play(tracker.animate.set_value(-2), run_time=0.5)
+    assert np.isclose(dot.get_x(), -2)